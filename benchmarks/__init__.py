@@ -0,0 +1,3 @@
+"""
+Benchmarks del solver con generadores de problemas reproducibles (ver benchmarks.run).
+"""
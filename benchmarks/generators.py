@@ -0,0 +1,124 @@
+"""
+Generadores de problemas de programación lineal con semilla.
+Cada familia construye un problema de m restricciones directamente como
+arrays (ConstraintSet.from_arrays), de modo que generar m = 100000
+restricciones no domina el tiempo del benchmark. La misma (m, semilla)
+produce siempre el mismo problema.
+"""
+from typing import Callable, Dict
+import numpy as np
+
+from core.models import (
+    LinearProgrammingProblem, ObjectiveFunction, ConstraintSet, InequalityType, OptimizationType,
+    INEQUALITY_CODES
+)
+
+
+# Centro y radio de referencia de las regiones generadas
+CENTER = 100.0
+RADIUS = 50.0
+
+_CODE_LE = INEQUALITY_CODES[InequalityType.MENOR_IGUAL]
+
+
+def _problem(normals: np.ndarray, rhs: np.ndarray, objective: np.ndarray,
+             optimization_type: OptimizationType = OptimizationType.MAXIMIZAR) -> LinearProgrammingProblem:
+    """Arma un problema con restricciones n·x ≤ rhs"""
+    codes = np.full(len(rhs), _CODE_LE, dtype=np.int8)
+    constraints = ConstraintSet.from_arrays(normals, rhs, codes)
+    c1, c2 = objective.tolist()
+    return LinearProgrammingProblem(ObjectiveFunction(c1, c2, optimization_type), constraints)
+
+
+def _tangent_lines(angles: np.ndarray, radii: np.ndarray) -> tuple:
+    """Rectas tangentes a círculos centrados en (CENTER, CENTER): n·x ≤ n·centro + r"""
+    normals = np.column_stack((np.cos(angles), np.sin(angles)))
+    return normals, normals.sum(axis=1) * CENTER + radii
+
+
+def _random_objective(rng: np.random.Generator) -> np.ndarray:
+    """Coeficientes de la función objetivo con ambos signos"""
+    return np.round(rng.uniform(-10.0, 10.0, 2), 3)
+
+
+def random_bounded(m: int, seed: int) -> LinearProgrammingProblem:
+    """
+    Polígono acotado: rectas tangentes a círculos de radio aleatorio.
+
+    Los ángulos se reparten uniformemente con una perturbación, así que para
+    m ≥ 4 la región siempre es acotada.
+    """
+    rng = np.random.default_rng(seed)
+    angles = 2.0 * np.pi * (np.arange(m) + rng.uniform(0.0, 0.9, m)) / m
+    normals, rhs = _tangent_lines(angles, rng.uniform(0.5 * RADIUS, RADIUS, m))
+    return _problem(normals, rhs, _random_objective(rng))
+
+
+def degenerate(m: int, seed: int) -> LinearProgrammingProblem:
+    """
+    Polígono regular de pocos vértices por cada uno de los cuales pasan muchas restricciones.
+
+    Los lados del polígono se incluyen siempre; el resto de las rectas pasa
+    por un vértice con una normal dentro de su cono normal, por lo que todas
+    son activas en algún vértice sin cambiar la región.
+    """
+    rng = np.random.default_rng(seed)
+    k = max(3, min(12, m // 4))
+    vertex_angles = 2.0 * np.pi * np.arange(k) / k
+    vertices = CENTER + RADIUS * np.column_stack((np.cos(vertex_angles), np.sin(vertex_angles)))
+
+    # Lados: la normal del lado entre los vértices q y q+1 está a mitad de camino
+    side_angles = vertex_angles + np.pi / k
+    extra = max(m - k, 0)
+    owner = rng.integers(0, k, extra)
+    cone_angles = vertex_angles[owner] + rng.uniform(-np.pi / k, np.pi / k, extra)
+
+    angles = np.concatenate((side_angles, cone_angles))[:m]
+    points = np.concatenate((vertices, vertices[owner]))[:m]
+    normals = np.column_stack((np.cos(angles), np.sin(angles)))
+    rhs = np.einsum("ij,ij->i", normals, points)
+
+    # El objetivo apunta a un vértice para que el óptimo sea degenerado
+    target = vertex_angles[rng.integers(0, k)]
+    return _problem(normals, rhs, np.round(10.0 * np.array([np.cos(target), np.sin(target)]), 3))
+
+
+def parallel(m: int, seed: int) -> LinearProgrammingProblem:
+    """Pocas direcciones con muchas restricciones paralelas cada una (la mayoría dominadas)"""
+    rng = np.random.default_rng(seed)
+    directions = 6
+    angles = 2.0 * np.pi * (np.arange(m) % directions) / directions
+    normals, rhs = _tangent_lines(angles, rng.uniform(0.5 * RADIUS, 4.0 * RADIUS, m))
+    return _problem(normals, rhs, _random_objective(rng))
+
+
+def infeasible(m: int, seed: int) -> LinearProgrammingProblem:
+    """Polígono acotado más una restricción que lo excluye por completo"""
+    problem = random_bounded(max(m - 1, 4), seed)
+    A, b, codes = problem.constraints.to_arrays()
+    problem.constraints = ConstraintSet.from_arrays(
+        np.vstack((A, [[-1.0, -1.0]])), np.append(b, -4.0 * (CENTER + RADIUS)), np.append(codes, _CODE_LE))
+    return problem
+
+
+def unbounded(m: int, seed: int) -> LinearProgrammingProblem:
+    """
+    Región no acotada en la dirección de optimización.
+
+    Las normales apuntan al tercer cuadrante, de modo que la región se
+    extiende hacia X1, X2 → ∞ y se maximiza un objetivo positivo.
+    """
+    rng = np.random.default_rng(seed)
+    angles = np.pi * (1.0 + 0.5 * (np.arange(m) + rng.uniform(0.0, 0.9, m)) / m)
+    normals, rhs = _tangent_lines(angles, rng.uniform(0.5 * RADIUS, RADIUS, m))
+    return _problem(normals, rhs, np.round(rng.uniform(1.0, 10.0, 2), 3))
+
+
+# Familias disponibles: nombre -> generador(m, semilla)
+FAMILIES: Dict[str, Callable[[int, int], LinearProgrammingProblem]] = {
+    "acotado": random_bounded,
+    "degenerado": degenerate,
+    "paralelas": parallel,
+    "infactible": infeasible,
+    "no_acotado": unbounded,
+}
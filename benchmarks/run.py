@@ -0,0 +1,347 @@
+"""
+Benchmark de LinearProgrammingSolver.solve sobre las familias de benchmarks.generators.
+
+Mide cada combinación (familia, configuración, m) varias veces, escribe los
+resultados en JSON y, si se indica una línea base, marca como regresión
+todo caso cuyo mejor tiempo empeore más que el umbral.
+
+Uso:
+    python -m benchmarks.run --output resultados.json
+    python -m benchmarks.run --sizes 10 100 1000 --baseline base.json --threshold 0.25
+"""
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional, TextIO, Tuple
+
+import numpy as np
+
+from core.models import SolveMethod
+from core.solver import LinearProgrammingSolver
+from .generators import FAMILIES
+
+
+# Formato del archivo de resultados (cambia si cambian los campos)
+RESULTS_VERSION = 1
+
+DEFAULT_SIZES = (10, 100, 1000, 10000, 100000)
+
+# Configuraciones del solver: nombre -> argumentos de LinearProgrammingSolver
+CONFIGURATIONS: Dict[str, dict] = {
+    "enumeracion": {"method": SolveMethod.ENUMERACION},
+    "semiplanos": {"method": SolveMethod.SEMIPLANOS},
+    "presolve": {"presolve": True},
+}
+
+# Tamaño máximo por configuración: la enumeración evalúa O(m²) pares
+MAX_CONSTRAINTS: Dict[str, int] = {
+    "enumeracion": 5000,
+    "semiplanos": 100000,
+    "presolve": 5000,
+}
+
+# Aumento relativo del mejor tiempo a partir del cual se informa una regresión
+DEFAULT_THRESHOLD = 0.2
+
+# Diferencias menores a este tiempo se consideran ruido de medición
+NOISE_FLOOR_SECONDS = 1e-3
+
+# Tolerancia relativa para comparar el valor óptimo con la línea base
+VALUE_TOLERANCE = 1e-6
+
+
+@dataclass
+class BenchmarkResult:
+    """Tiempos y resultado de un caso del benchmark"""
+    family: str
+    configuration: str
+    m: int
+    seed: int
+    times: List[float]
+    is_feasible: bool
+    optimal_value: Optional[float]
+    vertices: int
+
+    @property
+    def key(self) -> Tuple[str, str, int]:
+        return self.family, self.configuration, self.m
+
+    @property
+    def best(self) -> float:
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data.update(best=self.best, median=self.median)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BenchmarkResult":
+        return cls(**{name: data[name] for name in cls.__dataclass_fields__})
+
+
+@dataclass
+class Comparison:
+    """Diferencias de una ejecución respecto de la línea base"""
+    regressions: List[Tuple[BenchmarkResult, BenchmarkResult]] = field(default_factory=list)
+    improvements: List[Tuple[BenchmarkResult, BenchmarkResult]] = field(default_factory=list)
+    changed_results: List[Tuple[BenchmarkResult, BenchmarkResult]] = field(default_factory=list)
+    missing: List[Tuple[str, str, int]] = field(default_factory=list)
+
+    @property
+    def failed(self) -> bool:
+        return bool(self.regressions or self.changed_results)
+
+
+def run_case(family: str, configuration: str, m: int, seed: int, repeat: int) -> BenchmarkResult:
+    """
+    Mide un caso resolviendo `repeat` veces un problema recién generado.
+
+    La generación del problema queda fuera de la medición, ya que el solver
+    modifica el problema (agrega X1 ≥ 0 y X2 ≥ 0).
+
+    Args:
+        family: Nombre de la familia (ver FAMILIES)
+        configuration: Nombre de la configuración del solver (ver CONFIGURATIONS)
+        m: Número de restricciones
+        seed: Semilla del generador
+        repeat: Número de mediciones
+
+    Returns:
+        BenchmarkResult: Tiempos y resultado de la última resolución
+    """
+    solver = LinearProgrammingSolver(**CONFIGURATIONS[configuration])
+    times = []
+    for _ in range(repeat):
+        problem = FAMILIES[family](m, seed)
+        start = time.perf_counter()
+        solution = solver.solve(problem)
+        times.append(time.perf_counter() - start)
+
+    return BenchmarkResult(
+        family=family,
+        configuration=configuration,
+        m=m,
+        seed=seed,
+        times=times,
+        is_feasible=solution.is_feasible,
+        optimal_value=solution.optimal_value,
+        vertices=len(solution.feasible_vertices)
+    )
+
+
+def run_benchmarks(families: List[str], configurations: List[str], sizes: List[int],
+                   seed: int = 0, repeat: int = 5, time_budget: Optional[float] = None,
+                   progress: Optional[TextIO] = None) -> List[BenchmarkResult]:
+    """
+    Ejecuta todas las combinaciones de familia, configuración y tamaño.
+
+    Los tamaños que superan MAX_CONSTRAINTS de la configuración se omiten, y
+    si un caso tarda más que time_budget (mediana) se omiten los tamaños
+    mayores de esa familia y configuración.
+
+    Args:
+        families: Familias a medir
+        configurations: Configuraciones del solver a medir
+        sizes: Números de restricciones
+        seed: Semilla de los generadores
+        repeat: Mediciones por caso
+        time_budget: Segundos máximos por caso antes de dejar de crecer
+        progress: Flujo donde se informa cada caso terminado
+
+    Returns:
+        List[BenchmarkResult]: Resultados en el orden de ejecución
+    """
+    results = []
+    for family in families:
+        for configuration in configurations:
+            for m in sorted(sizes):
+                if m > MAX_CONSTRAINTS[configuration]:
+                    break
+                result = run_case(family, configuration, m, seed, repeat)
+                results.append(result)
+                if progress is not None:
+                    print(_format_result(result), file=progress, flush=True)
+                if time_budget is not None and result.median > time_budget:
+                    break
+    return results
+
+
+def compare(results: List[BenchmarkResult], baseline: List[BenchmarkResult],
+            threshold: float = DEFAULT_THRESHOLD) -> Comparison:
+    """
+    Compara los resultados con una línea base.
+
+    Se compara el mejor tiempo de cada caso (como timeit), que es mucho menos
+    sensible a la carga de la máquina que la mediana. Un caso es una regresión
+    si supera al de la línea base en más de `threshold` (relativo) y de
+    NOISE_FLOOR_SECONDS (absoluto). Un cambio
+    de factibilidad o de valor óptimo se informa aparte, ya que indica un
+    cambio de comportamiento y no de rendimiento.
+
+    Args:
+        results: Resultados de la ejecución actual
+        baseline: Resultados de referencia
+        threshold: Aumento relativo tolerado
+
+    Returns:
+        Comparison: Regresiones, mejoras, cambios de resultado y casos sin referencia
+    """
+    reference = {result.key: result for result in baseline}
+    comparison = Comparison()
+
+    for result in results:
+        base = reference.get(result.key)
+        if base is None:
+            comparison.missing.append(result.key)
+            continue
+
+        if result.is_feasible != base.is_feasible or not _same_value(result.optimal_value, base.optimal_value):
+            comparison.changed_results.append((result, base))
+
+        difference = result.best - base.best
+        if abs(difference) <= NOISE_FLOOR_SECONDS:
+            continue
+        if difference > threshold * base.best:
+            comparison.regressions.append((result, base))
+        elif -difference > threshold * base.best:
+            comparison.improvements.append((result, base))
+
+    return comparison
+
+
+def _same_value(value: Optional[float], reference: Optional[float]) -> bool:
+    if value is None or reference is None:
+        return value is reference
+    return abs(value - reference) <= VALUE_TOLERANCE * max(1.0, abs(reference))
+
+
+def environment() -> dict:
+    """Versiones y plataforma con las que se midió"""
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+    }
+
+
+def save_results(path: str, results: List[BenchmarkResult]):
+    """Guarda los resultados en JSON"""
+    data = {
+        "version": RESULTS_VERSION,
+        "environment": environment(),
+        "results": [result.to_dict() for result in results],
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def load_results(path: str) -> List[BenchmarkResult]:
+    """
+    Carga resultados guardados con save_results.
+
+    Raises:
+        ValueError: Si el archivo no tiene el formato esperado
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Versión de resultados no soportada: {data.get('version')}")
+    try:
+        return [BenchmarkResult.from_dict(item) for item in data["results"]]
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Formato de resultados inválido: {e}")
+
+
+def _format_result(result: BenchmarkResult) -> str:
+    value = "-" if result.optimal_value is None else f"{result.optimal_value:.6g}"
+    return (f"{result.family:<12} {result.configuration:<12} m={result.m:<7} "
+            f"mediana {result.median * 1000:10.2f} ms  mín {result.best * 1000:10.2f} ms  Z* = {value}")
+
+
+def _format_change(result: BenchmarkResult, base: BenchmarkResult) -> str:
+    ratio = result.best / base.best if base.best > 0 else float("inf")
+    return (f"  {result.family} / {result.configuration} / m={result.m}: "
+            f"{base.best * 1000:.2f} ms -> {result.best * 1000:.2f} ms ({ratio:.2f}x)")
+
+
+def report_comparison(comparison: Comparison, threshold: float, output: TextIO):
+    """Imprime un resumen legible de la comparación"""
+    print(f"\n=== Comparación con la línea base (umbral {threshold:.0%}) ===", file=output)
+    print(f"Regresiones: {len(comparison.regressions)}", file=output)
+    for result, base in comparison.regressions:
+        print(_format_change(result, base), file=output)
+    print(f"Mejoras: {len(comparison.improvements)}", file=output)
+    for result, base in comparison.improvements:
+        print(_format_change(result, base), file=output)
+    if comparison.changed_results:
+        print(f"Resultados distintos: {len(comparison.changed_results)}", file=output)
+        for result, base in comparison.changed_results:
+            print(f"  {result.family} / {result.configuration} / m={result.m}: "
+                  f"Z* {base.optimal_value} -> {result.optimal_value}", file=output)
+    if comparison.missing:
+        print(f"Casos sin referencia: {len(comparison.missing)}", file=output)
+
+
+def main(argv: Optional[List[str]] = None, output: TextIO = sys.stdout) -> int:
+    """
+    Punto de entrada de línea de comandos del benchmark.
+
+    Args:
+        argv: Argumentos (por defecto sys.argv[1:])
+        output: Flujo donde se escribe el progreso y el resumen
+
+    Returns:
+        int: Código de salida (1 si hay regresiones o resultados distintos)
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run",
+                                     description="Benchmark de LinearProgrammingSolver.solve")
+    parser.add_argument("--families", nargs="+", choices=list(FAMILIES), default=list(FAMILIES))
+    parser.add_argument("--configurations", nargs="+", choices=list(CONFIGURATIONS),
+                        default=list(CONFIGURATIONS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES),
+                        help="Números de restricciones a medir")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla de los generadores")
+    parser.add_argument("--repeat", type=int, default=5, help="Mediciones por caso")
+    parser.add_argument("--time-budget", type=float, default=30.0,
+                        help="Segundos por caso a partir de los cuales no se miden tamaños mayores")
+    parser.add_argument("--output", help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--baseline", help="Resultados de referencia (JSON de --output)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Aumento relativo del mejor tiempo considerado regresión")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = load_results(args.baseline)
+        except (OSError, ValueError) as e:
+            print(f"Error al leer la línea base: {e}", file=sys.stderr)
+            return 2
+
+    results = run_benchmarks(args.families, args.configurations, args.sizes, args.seed,
+                             max(1, args.repeat), args.time_budget, progress=output)
+
+    if args.output:
+        save_results(args.output, results)
+
+    if baseline is None:
+        return 0
+
+    comparison = compare(results, baseline, args.threshold)
+    report_comparison(comparison, args.threshold, output)
+    return 1 if comparison.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
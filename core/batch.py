@@ -0,0 +1,266 @@
+"""
+Resolución en lote de muchos problemas pequeños de 2 variables.
+Los problemas se reciben como arrays apilados (struct-of-arrays) y se
+resuelven todos a la vez con operaciones vectorizadas de NumPy.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+
+from .models import (
+    LinearProgrammingProblem, ObjectiveFunction, ConstraintSet, Solution,
+    InequalityType, OptimizationType
+)
+from .vectorized import (
+    INEQUALITY_CODES, DEFAULT_CONSTRAINTS_PER_BLOCK, constraint_bounds, constraints_to_arrays
+)
+
+
+# Máximo de celdas (problema, par, restricción) evaluadas por bloque
+DEFAULT_MAX_CELLS_PER_CHUNK = 1 << 22
+
+
+@dataclass
+class ProblemBatch:
+    """
+    Lote de N problemas con hasta K restricciones cada uno.
+
+    Las filas con mask == False son relleno y se ignoran.
+    """
+    objective: np.ndarray       # (N, 2) coeficientes c1, c2
+    maximize: np.ndarray        # (N,) True para maximizar
+    A: np.ndarray               # (N, K, 2) coeficientes de las restricciones
+    b: np.ndarray               # (N, K) términos independientes
+    codes: np.ndarray           # (N, K) códigos de desigualdad (ver INEQUALITY_CODES)
+    mask: np.ndarray            # (N, K) filas válidas
+
+    def __len__(self) -> int:
+        return self.objective.shape[0]
+
+    def to_problem(self, index: int) -> LinearProgrammingProblem:
+        """Construye el LinearProgrammingProblem del problema `index`"""
+        c1, c2 = self.objective[index].tolist()
+        opt_type = OptimizationType.MAXIMIZAR if self.maximize[index] else OptimizationType.MINIMIZAR
+        valid = self.mask[index]
+        constraints = ConstraintSet.from_arrays(self.A[index][valid], self.b[index][valid], self.codes[index][valid])
+        return LinearProgrammingProblem(ObjectiveFunction(c1, c2, opt_type), constraints)
+
+    @classmethod
+    def from_problems(cls, problems: List[LinearProgrammingProblem]) -> "ProblemBatch":
+        """
+        Empaqueta una lista de problemas rellenando hasta el máximo de restricciones.
+
+        Args:
+            problems: Problemas a empaquetar
+
+        Returns:
+            ProblemBatch: Lote equivalente
+        """
+        n = len(problems)
+        k = max((len(p.constraints) for p in problems), default=0)
+
+        batch = cls(
+            objective=np.zeros((n, 2)),
+            maximize=np.zeros(n, dtype=bool),
+            A=np.zeros((n, k, 2)),
+            b=np.zeros((n, k)),
+            codes=np.zeros((n, k), dtype=np.int8),
+            mask=np.zeros((n, k), dtype=bool)
+        )
+
+        for i, problem in enumerate(problems):
+            objective = problem.objective_function
+            batch.objective[i] = (objective.c1, objective.c2)
+            batch.maximize[i] = objective.optimization_type == OptimizationType.MAXIMIZAR
+            A, b, codes = constraints_to_arrays(problem.constraints)
+            m = len(b)
+            batch.A[i, :m], batch.b[i, :m], batch.codes[i, :m] = A, b, codes
+            batch.mask[i, :m] = True
+
+        return batch
+
+
+@dataclass
+class BatchSolution:
+    """
+    Resultados compactos de un lote.
+
+    Las soluciones completas (Solution) se construyen solo bajo demanda con
+    solution(i), resolviendo ese problema con el solver original.
+    """
+    optimal_points: np.ndarray      # (N, 2), NaN si no hay solución
+    optimal_values: np.ndarray      # (N,), NaN si no hay solución
+    is_feasible: np.ndarray         # (N,)
+    active_constraints: np.ndarray  # (N, 2) filas que definen el óptimo, -1 si no hay;
+                                    # K y K+1 corresponden a X1 ≥ 0 y X2 ≥ 0
+    batch: ProblemBatch
+    tolerance: float = 1e-10
+    _solutions: Dict[int, Solution] = field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return self.optimal_values.shape[0]
+
+    def solution(self, index: int) -> Solution:
+        """
+        Materializa la solución completa del problema `index`.
+
+        Args:
+            index: Posición del problema en el lote
+
+        Returns:
+            Solution: Solución completa (se guarda para llamadas posteriores)
+        """
+        if index not in self._solutions:
+            from .solver import LinearProgrammingSolver
+            solver = LinearProgrammingSolver(tolerance=self.tolerance)
+            self._solutions[index] = solver.solve(self.batch.to_problem(index))
+        return self._solutions[index]
+
+    def solutions(self) -> Iterator[Solution]:
+        """Itera sobre las soluciones completas, materializándolas una a una"""
+        for index in range(len(self)):
+            yield self.solution(index)
+
+
+def best_feasible_vertices(A: np.ndarray, b: np.ndarray, lower: np.ndarray, upper: np.ndarray,
+                           objective: np.ndarray, sign: np.ndarray, ii: np.ndarray, jj: np.ndarray,
+                           tolerance: float, mask: Optional[np.ndarray] = None,
+                           max_cells_per_chunk: int = DEFAULT_MAX_CELLS_PER_CHUNK
+                           ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Mejor intersección factible de los pares (ii, jj) en cada uno de n problemas.
+
+    Núcleo común de solve_many y parametric.rhs_sweep. Los problemas y los
+    pares se recorren por bloques, y la factibilidad se verifica por bloques
+    de restricciones descartando las intersecciones que ya fallaron (como en
+    vectorized.feasibility_mask), de modo que ningún bloque evalúa más de
+    max_cells_per_chunk celdas aunque un solo problema tenga más pares. Los
+    empates se resuelven a favor del primer par.
+
+    Args:
+        A: Coeficientes (n, m, 2); puede ser una vista con broadcast
+        b: Términos independientes (n, m)
+        lower, upper: Cotas de cada restricción (n, m), ver constraint_bounds
+        objective: Coeficientes c1, c2 de cada problema (n, 2)
+        sign: 1 para maximizar y -1 para minimizar (n,)
+        ii, jj: Pares de restricciones a intersecar (P,)
+        tolerance: Determinante mínimo de un par
+        mask: Filas válidas de cada problema (n, m); None si todas lo son
+        max_cells_per_chunk: Máximo de evaluaciones restricción-intersección por bloque
+
+    Returns:
+        Tuple: Puntos óptimos (n, 2) y valores (n,) con NaN si no hay
+        solución, máscara de problemas factibles (n,) y par óptimo (n, 2)
+        con -1 si no hay
+    """
+    n, m = b.shape
+    optimal_points = np.full((n, 2), np.nan)
+    optimal_values = np.full(n, np.nan)
+    best_pair = np.full(n, -1, dtype=np.intp)
+    p = len(ii)
+    if n == 0 or m == 0 or p == 0:
+        return optimal_points, optimal_values, np.zeros(n, dtype=bool), np.full((n, 2), -1, dtype=np.intp)
+
+    rows_per_block = min(m, DEFAULT_CONSTRAINTS_PER_BLOCK)
+    pairs_per_chunk = max(1, min(p, max_cells_per_chunk // rows_per_block))
+    problems_per_chunk = max(1, max_cells_per_chunk // (rows_per_block * pairs_per_chunk))
+
+    for start in range(0, n, problems_per_chunk):
+        stop = min(start + problems_per_chunk, n)
+        best_score = np.full(stop - start, -np.inf)
+
+        for pair_start in range(0, p, pairs_per_chunk):
+            pi, pj = ii[pair_start:pair_start + pairs_per_chunk], jj[pair_start:pair_start + pairs_per_chunk]
+            Ac, bc = A[start:stop], b[start:stop]
+
+            # Intersecciones de los pares por regla de Cramer: (problemas, pares)
+            a1i, a2i, a1j, a2j = Ac[:, pi, 0], Ac[:, pi, 1], Ac[:, pj, 0], Ac[:, pj, 1]
+            det = a1i * a2j - a1j * a2i
+            valid = np.abs(det) >= tolerance
+            if mask is not None:
+                valid &= mask[start:stop, pi] & mask[start:stop, pj]
+            rows, cols = np.nonzero(valid)
+            det = det[rows, cols]
+            x1 = (bc[rows, pi[cols]] * a2j[rows, cols] - bc[rows, pj[cols]] * a2i[rows, cols]) / det
+            x2 = (a1i[rows, cols] * bc[rows, pj[cols]] - a1j[rows, cols] * bc[rows, pi[cols]]) / det
+            rows = rows + start
+
+            # Factibilidad por bloques de restricciones, descartando las que fallan
+            alive = np.arange(len(rows))
+            for row in range(0, m, rows_per_block):
+                block = slice(row, row + rows_per_block)
+                owner = rows[alive]
+                values = A[owner, block, 0] * x1[alive, None] + A[owner, block, 1] * x2[alive, None]
+                ok = np.all((values >= lower[owner, block]) & (values <= upper[owner, block]), axis=1)
+                alive = alive[ok]
+                if alive.size == 0:
+                    break
+            if alive.size == 0:
+                continue
+
+            # Mejor intersección de cada problema en este bloque (primer par si empatan)
+            owner, x1, x2, cols = rows[alive], x1[alive], x2[alive], cols[alive]
+            z = objective[owner, 0] * x1 + objective[owner, 1] * x2
+            score = sign[owner] * z
+            order = np.lexsort((cols, -score, owner))
+            first = order[np.concatenate(([True], owner[order][1:] != owner[order][:-1]))]
+            first = first[score[first] > best_score[owner[first] - start]]
+
+            target = owner[first]
+            best_score[target - start] = score[first]
+            optimal_points[target] = np.column_stack((x1[first], x2[first]))
+            optimal_values[target] = z[first]
+            best_pair[target] = pair_start + cols[first]
+
+    found = best_pair >= 0
+    active = np.full((n, 2), -1, dtype=np.intp)
+    active[found] = np.column_stack((ii[best_pair[found]], jj[best_pair[found]]))
+    return optimal_points, optimal_values, found, active
+
+
+def solve_many(batch: ProblemBatch, tolerance: float = 1e-10,
+               max_cells_per_chunk: int = DEFAULT_MAX_CELLS_PER_CHUNK) -> BatchSolution:
+    """
+    Resuelve todos los problemas del lote por el método gráfico vectorizado.
+
+    Igual que LinearProgrammingSolver.solve, agrega X1 ≥ 0 y X2 ≥ 0, calcula
+    las intersecciones de todos los pares de restricciones, filtra las
+    factibles y elige la mejor. Los empates se resuelven a favor del primer
+    par en el mismo orden que el solver individual.
+
+    Args:
+        batch: Lote de problemas
+        tolerance: Tolerancia para determinantes y factibilidad
+        max_cells_per_chunk: Máximo de evaluaciones por bloque (ver best_feasible_vertices)
+
+    Returns:
+        BatchSolution: Puntos y valores óptimos de cada problema
+    """
+    n, k = batch.b.shape
+
+    # Agregar las restricciones de no negatividad al final de cada problema
+    A = np.concatenate((batch.A, np.broadcast_to([[1.0, 0.0], [0.0, 1.0]], (n, 2, 2))), axis=1)
+    b = np.concatenate((batch.b, np.zeros((n, 2))), axis=1)
+    codes = np.concatenate(
+        (batch.codes, np.full((n, 2), INEQUALITY_CODES[InequalityType.MAYOR_IGUAL], dtype=np.int8)), axis=1)
+    mask = np.concatenate((batch.mask, np.ones((n, 2), dtype=bool)), axis=1)
+
+    ii, jj = np.triu_indices(k + 2, 1)
+
+    lower, upper = constraint_bounds(b, codes, tolerance)
+    lower = np.where(mask, lower, -np.inf)
+    upper = np.where(mask, upper, np.inf)
+
+    sign = np.where(batch.maximize, 1.0, -1.0)
+
+    optimal_points, optimal_values, is_feasible, active = best_feasible_vertices(
+        A, b, lower, upper, batch.objective, sign, ii, jj, tolerance, mask, max_cells_per_chunk)
+
+    return BatchSolution(
+        optimal_points=optimal_points,
+        optimal_values=optimal_values,
+        is_feasible=is_feasible,
+        active_constraints=active,
+        batch=batch,
+        tolerance=tolerance
+    )
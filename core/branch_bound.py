@@ -0,0 +1,208 @@
+"""
+Ramificación y acotamiento para problemas con variables enteras.
+Cada nodo es un polígono convexo: los hijos recortan el polígono del padre
+con el semiplano de la rama (Xⱼ ≤ ⌊v⌋ o Xⱼ ≥ ⌈v⌉) en O(V) en lugar de
+volver a resolver la relajación desde cero.
+"""
+import heapq
+import math
+import time
+from itertools import count
+from typing import List, Optional, Tuple
+
+from .models import (
+    LinearProgrammingProblem, Point, Solution, BranchAndBoundReport, OptimizationType,
+    PHASE_BRANCH_AND_BOUND
+)
+from .halfplane import (
+    ConvexPolygon, build_feasible_polygon, clip_constraint, polygon_finite_vertices, polygon_tolerances
+)
+
+
+# Distancia máxima a un entero para considerar entera una coordenada
+DEFAULT_INTEGRALITY_TOLERANCE = 1e-6
+
+# Límite de nodos explorados antes de detener la búsqueda
+DEFAULT_MAX_NODES = 10000
+
+
+def root_polygon(problem: LinearProgrammingProblem) -> Tuple[ConvexPolygon, float]:
+    """
+    Construye el polígono factible de la relajación lineal.
+
+    Si la intersección de semiplanos no puede decidir el caso (regiones muy
+    degeneradas) se recorta la caja acotante restricción por restricción.
+
+    Args:
+        problem: Problema con las restricciones de no negatividad ya agregadas
+
+    Returns:
+        Tuple[ConvexPolygon, float]: Polígono y tolerancia de factibilidad usada
+    """
+    eps, bound = polygon_tolerances(problem.constraints)
+    polygon = build_feasible_polygon(problem.constraints, eps=eps, bound=bound)
+    if polygon is None:
+        polygon = ConvexPolygon.box(bound)
+        for index, constraint in enumerate(problem.constraints):
+            polygon = clip_constraint(polygon, constraint, index, eps)
+    return polygon, eps
+
+
+class BranchAndBoundSolver:
+    """Resuelve problemas con X1 y/o X2 enteras sobre la relajación del método gráfico"""
+
+    def __init__(self, solver=None, integrality_tolerance: float = DEFAULT_INTEGRALITY_TOLERANCE,
+                 max_nodes: int = DEFAULT_MAX_NODES):
+        """
+        Args:
+            solver: LinearProgrammingSolver que resuelve la relajación del nodo
+                raíz (por defecto, uno con la configuración estándar)
+            integrality_tolerance: Distancia máxima a un entero para aceptar
+                una coordenada como entera
+            max_nodes: Número máximo de nodos a explorar; al alcanzarlo se
+                devuelve la mejor solución entera encontrada y su brecha
+        """
+        if solver is None:
+            from .solver import LinearProgrammingSolver
+            solver = LinearProgrammingSolver()
+        self.solver = solver
+        self.integrality_tolerance = integrality_tolerance
+        self.max_nodes = max_nodes
+
+    def solve(self, problem: LinearProgrammingProblem) -> Solution:
+        """
+        Resuelve el problema entero con búsqueda por mejor cota.
+
+        La cota de cada nodo es el mejor vértice de su polígono; se explora
+        siempre el nodo abierto con mejor cota, de modo que la cota global es
+        la del primer nodo de la cola.
+
+        Args:
+            problem: Problema con integer_variables indicando las variables enteras
+
+        Returns:
+            Solution: Solución entera óptima (o la mejor encontrada dentro del
+            límite de nodos), con los vértices de la relajación y el resumen
+            de la búsqueda en branch_and_bound; si el solver registra
+            estadísticas, stats incluye además el tiempo de la búsqueda
+        """
+        relaxation = self.solver.solve_relaxation(problem)
+        report = BranchAndBoundReport(relaxation.optimal_point, relaxation.optimal_value)
+
+        solution = Solution(
+            problem=problem,
+            intersection_points=relaxation.intersection_points,
+            feasible_vertices=relaxation.feasible_vertices,
+            vertex_evaluations=relaxation.vertex_evaluations,
+            optimal_point=None,
+            optimal_value=None,
+            is_feasible=False,
+            presolve_removed=relaxation.presolve_removed,
+            branch_and_bound=report,
+            stats=relaxation.stats
+        )
+        if relaxation.optimal_point is None:
+            return solution
+        start = time.perf_counter()
+
+        objective = problem.objective_function
+        sense = 1.0 if objective.optimization_type == OptimizationType.MAXIMIZAR else -1.0
+        flagged = [j for j, flag in enumerate(problem.integer_variables) if flag]
+        polygon, eps = root_polygon(problem)
+
+        # Las ramas usan etiquetas no negativas posteriores a las restricciones
+        tags = count(len(problem.constraints))
+        order = count()
+
+        incumbent: Optional[Tuple[float, float]] = None
+        incumbent_score = -math.inf
+
+        # Cola de prioridad por cota (negada para que heapq saque la mejor)
+        heap = [(-sense * relaxation.optimal_value, next(order), 0, polygon)]
+        progress = getattr(self.solver, "progress", None)
+        while heap:
+            if progress is not None:
+                progress(PHASE_BRANCH_AND_BOUND, report.nodes_explored / self.max_nodes)
+            negated_bound, _, depth, polygon = heapq.heappop(heap)
+            if self._is_pruned(-negated_bound, incumbent_score):
+                report.nodes_pruned += 1
+                continue
+            if report.nodes_explored >= self.max_nodes:
+                heapq.heappush(heap, (negated_bound, next(order), depth, polygon))
+                report.node_limit_reached = True
+                break
+
+            report.nodes_explored += 1
+            report.max_depth = max(report.max_depth, depth)
+            vertices = [(x1, x2) for x1, x2, _, _ in polygon_finite_vertices(polygon)]
+            if not vertices:
+                report.nodes_pruned += 1
+                continue
+
+            # Cualquier vértice entero del nodo es una solución factible
+            scores = [sense * objective.evaluate(x1, x2) for x1, x2 in vertices]
+            for vertex, score in zip(vertices, scores):
+                if score > incumbent_score and self._fractional_variable(vertex, flagged) is None:
+                    incumbent, incumbent_score = vertex, score
+
+            best = max(range(len(vertices)), key=scores.__getitem__)
+            branch = self._fractional_variable(vertices[best], flagged)
+            if branch is None or self._is_pruned(scores[best], incumbent_score):
+                continue
+
+            value = vertices[best][branch]
+            normal = (1.0, 0.0) if branch == 0 else (0.0, 1.0)
+            children = (
+                polygon.clip(normal[0], normal[1], math.floor(value), next(tags), eps),
+                polygon.clip(-normal[0], -normal[1], -math.ceil(value), next(tags), eps)
+            )
+            for child in children:
+                child_scores = [sense * objective.evaluate(x1, x2)
+                                for x1, x2, _, _ in polygon_finite_vertices(child)]
+                if not child_scores:
+                    report.nodes_pruned += 1
+                    continue
+                heapq.heappush(heap, (-max(child_scores), next(order), depth + 1, child))
+
+        if solution.stats is not None:
+            solution.stats.add_time(PHASE_BRANCH_AND_BOUND, time.perf_counter() - start)
+
+        # La cota global es la del mejor nodo abierto (o la solución entera si no quedan)
+        bound_score = max(-heap[0][0], incumbent_score) if heap else incumbent_score
+        if not math.isinf(bound_score):
+            report.best_bound = sense * bound_score
+        if incumbent is None:
+            return solution
+
+        # Redondear las coordenadas enteras elimina el error del recorte
+        x1, x2 = (float(round(value)) if j in flagged else value for j, value in enumerate(incumbent))
+        optimal_value = objective.evaluate(x1, x2)
+        report.incumbent_value = optimal_value
+        if not heap:
+            report.best_bound = optimal_value
+
+        solution.optimal_point = Point(x1, x2)
+        solution.optimal_value = optimal_value
+        solution.is_feasible = True
+        return solution
+
+    def _fractional_variable(self, vertex: Tuple[float, float], flagged: List[int]) -> Optional[int]:
+        """
+        Elige la variable entera más fraccionaria del vértice.
+
+        Args:
+            vertex: Coordenadas (x1, x2)
+            flagged: Índices de las variables enteras
+
+        Returns:
+            int: Índice de la variable para ramificar, o None si el vértice es entero
+        """
+        distances = [(abs(vertex[j] - round(vertex[j])), j) for j in flagged]
+        distance, j = max(distances, default=(0.0, None))
+        return None if distance <= self.integrality_tolerance else j
+
+    def _is_pruned(self, score: float, incumbent_score: float) -> bool:
+        """Indica si un nodo con esa cota no puede mejorar la solución entera actual"""
+        if math.isinf(incumbent_score):
+            return False
+        return score <= incumbent_score + self.integrality_tolerance * max(1.0, abs(incumbent_score))
@@ -0,0 +1,243 @@
+"""
+Caché LRU de soluciones indexada por una huella canónica del problema.
+"""
+import copy
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .models import LinearProgrammingProblem, Solution, InequalityType
+
+
+# Decimales a los que se redondean los coeficientes al calcular la huella
+FINGERPRINT_DECIMALS = 9
+
+_NON_NEGATIVITY = (
+    (1.0, 0.0, InequalityType.MAYOR_IGUAL.value, 0.0),
+    (0.0, 1.0, InequalityType.MAYOR_IGUAL.value, 0.0),
+)
+
+
+def _rounded(value: float) -> float:
+    """Redondea un coeficiente normalizando -0.0 a 0.0"""
+    return round(float(value), FINGERPRINT_DECIMALS) + 0.0
+
+
+def _canonical_rows(constraints) -> List[Tuple]:
+    """Filas redondeadas (a1, a2, tipo, b) de las restricciones, en su orden"""
+    return [
+        (_rounded(c.a1), _rounded(c.a2), c.inequality_type.value, _rounded(c.b))
+        for c in constraints
+    ]
+
+
+def problem_fingerprint(problem: LinearProgrammingProblem) -> str:
+    """
+    Calcula una huella canónica del problema.
+
+    No depende del orden de las restricciones, redondea los coeficientes a
+    FINGERPRINT_DECIMALS y considera X1 ≥ 0 y X2 ≥ 0 como siempre presentes
+    (el solver las agrega si faltan).
+
+    Args:
+        problem: Problema de programación lineal
+
+    Returns:
+        str: Huella hexadecimal (SHA-256)
+    """
+    objective = problem.objective_function
+    rows = _canonical_rows(problem.constraints)
+    for row in _NON_NEGATIVITY:
+        if row not in rows:
+            rows.append(row)
+    rows.sort()
+
+    canonical = (
+        (_rounded(objective.c1), _rounded(objective.c2), objective.optimization_type.value),
+        tuple(rows),
+        tuple(bool(flag) for flag in problem.integer_variables)
+    )
+    return hashlib.sha256(repr(canonical).encode("utf-8")).hexdigest()
+
+
+def _solver_key(solver) -> Tuple:
+    """Configuración del solver que influye en la solución"""
+    method = getattr(solver, "method", None)
+    return (
+        getattr(solver, "tolerance", None),
+        getattr(method, "value", method),
+        getattr(solver, "presolve", None),
+        getattr(solver, "exact", None),
+        getattr(solver, "collect_stats", None),
+    )
+
+
+def _row_permutation(stored_rows: Sequence[Tuple], rows: Sequence[Tuple]) -> Optional[List[int]]:
+    """
+    Posición en rows de cada fila de stored_rows.
+
+    Las filas repetidas se asignan en el orden en que aparecen (son
+    intercambiables). Devuelve None si las filas no son las mismas.
+    """
+    if len(stored_rows) != len(rows):
+        return None
+    positions: Dict[Tuple, List[int]] = {}
+    for position, row in reversed(list(enumerate(rows))):
+        positions.setdefault(row, []).append(position)
+
+    permutation = []
+    for row in stored_rows:
+        candidates = positions.get(row)
+        if not candidates:
+            return None
+        permutation.append(candidates.pop())
+    return permutation
+
+
+def _remap_rows(solution: Solution, permutation: List[int]):
+    """
+    Traduce los datos indexados por restricción de una solución a otro orden.
+
+    Args:
+        solution: Solución a modificar (una copia privada)
+        permutation: Nueva posición de cada restricción del problema original
+    """
+    def moved(values: Optional[list]) -> Optional[list]:
+        if values is None:
+            return None
+        result = [None] * len(values)
+        for old, value in enumerate(values):
+            result[permutation[old]] = value
+        return result
+
+    report = solution.sensitivity
+    if report is not None:
+        report.binding = sorted(permutation[index] for index in report.binding)
+        report.slacks = moved(report.slacks)
+        report.shadow_prices = moved(report.shadow_prices)
+        report.rhs_ranges = moved(report.rhs_ranges)
+        if report.basis is not None:
+            report.basis = tuple(sorted(permutation[index] for index in report.basis))
+
+    for removed in solution.presolve_removed:
+        removed.index = permutation[removed.index]
+        if removed.kept_index is not None:
+            removed.kept_index = permutation[removed.kept_index]
+    solution.presolve_removed.sort(key=lambda removed: removed.index)
+
+
+@dataclass
+class CacheStats:
+    """Estadísticas de uso de la caché"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __str__(self):
+        return (f"{self.hits} aciertos, {self.misses} fallos, {self.evictions} desalojos "
+                f"({self.hit_rate * 100:.1f}% aciertos)")
+
+
+class SolutionCache:
+    """
+    Caché LRU acotada de soluciones.
+
+    Guarda una copia privada de cada solución y entrega siempre copias nuevas,
+    de modo que modificar una solución devuelta no altera la caché. Como la
+    huella no depende del orden de las restricciones, cada entrada guarda
+    también las filas del problema resuelto, y al acertar con otro orden los
+    índices de la solución (sensibilidad, presolve) se traducen a ese orden.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Tuple, Tuple[Solution, List[Tuple]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _key(self, problem: LinearProgrammingProblem, solver) -> Tuple:
+        return problem_fingerprint(problem), _solver_key(solver)
+
+    @staticmethod
+    def _copy_for(solution: Solution, problem: LinearProgrammingProblem) -> Solution:
+        """Copia profunda de la solución asociada al problema indicado"""
+        return copy.deepcopy(solution, memo={id(solution.problem): problem})
+
+    def get(self, problem: LinearProgrammingProblem, solver) -> Optional[Solution]:
+        """
+        Busca la solución de un problema equivalente.
+
+        Args:
+            problem: Problema a buscar
+            solver: Solver cuya configuración forma parte de la clave
+
+        Returns:
+            Solution: Copia de la solución guardada, o None si no existe
+        """
+        key = self._key(problem, solver)
+        entry = self._entries.get(key)
+
+        # Igual que solve, dejar el problema con la no negatividad agregada
+        # (los índices de la solución incluyen esas restricciones)
+        permutation = None
+        if entry is not None:
+            problem.add_non_negativity_constraints()
+            permutation = _row_permutation(entry[1], _canonical_rows(problem.constraints))
+
+        if permutation is None:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        self._entries.move_to_end(key)
+
+        solution = self._copy_for(entry[0], problem)
+        if permutation != list(range(len(permutation))):
+            _remap_rows(solution, permutation)
+        return solution
+
+    def put(self, problem: LinearProgrammingProblem, solver, solution: Solution):
+        """
+        Guarda una copia de la solución, desalojando la menos usada si hace falta.
+
+        Args:
+            problem: Problema resuelto
+            solver: Solver con el que se resolvió
+            solution: Solución a guardar
+        """
+        key = self._key(problem, solver)
+        self._entries[key] = copy.deepcopy(solution), _canonical_rows(solution.problem.constraints)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def get_or_solve(self, problem: LinearProgrammingProblem, solver) -> Solution:
+        """
+        Devuelve la solución guardada o resuelve el problema y la guarda.
+
+        Args:
+            problem: Problema a resolver
+            solver: Solver a utilizar en caso de fallo
+
+        Returns:
+            Solution: Solución del problema
+        """
+        solution = self.get(problem, solver)
+        if solution is None:
+            solution = solver.solve(problem)
+            self.put(problem, solver, solution)
+        return solution
+
+    def clear(self):
+        """Vacía la caché sin reiniciar las estadísticas"""
+        self._entries.clear()
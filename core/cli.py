@@ -0,0 +1,89 @@
+"""
+Interfaz de línea de comandos sin interfaz gráfica.
+Solo importa el paquete core: nunca carga tkinter ni matplotlib, por lo que
+funciona en equipos sin pantalla.
+"""
+import argparse
+import json
+import sys
+from typing import List, Optional, TextIO
+
+from .models import SolveMethod
+from .serialization import problem_from_dict, solution_to_dict
+
+
+# Subcomandos atendidos por esta interfaz (el resto de invocaciones abren la GUI)
+COMMANDS = ("solve", "batch")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Construye el parser de argumentos"""
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Solver de programación lineal de 2 variables (modo sin interfaz gráfica)"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    solve_parser = subparsers.add_parser("solve", help="Resuelve un problema en formato JSON")
+    source = solve_parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("problem", nargs="?", help="Archivo JSON del problema")
+    source.add_argument("--stdin", action="store_true", help="Leer el problema desde la entrada estándar")
+    solve_parser.add_argument("--method", choices=[m.value for m in SolveMethod],
+                              default=SolveMethod.ENUMERACION.value, help="Algoritmo de resolución")
+    solve_parser.add_argument("--presolve", action="store_true", help="Eliminar restricciones redundantes")
+    solve_parser.add_argument("--exact", action="store_true",
+                              help="Clasificar vértices con aritmética exacta (problemas mal escalados)")
+    solve_parser.add_argument("--stats", action="store_true",
+                              help="Incluir tiempos por fase y contadores en la salida")
+    solve_parser.add_argument("--indent", type=int, default=2, help="Sangría del JSON de salida")
+
+    subparsers.add_parser("batch", add_help=False, help="Resuelve problemas por lotes (ver core.runner)")
+
+    return parser
+
+
+def _solve(args: argparse.Namespace, stdin: TextIO, output: TextIO) -> int:
+    """Resuelve un único problema e imprime la solución como JSON"""
+    from .solver import LinearProgrammingSolver
+
+    try:
+        if args.stdin:
+            problem_data = json.load(stdin)
+        else:
+            with open(args.problem, 'r', encoding='utf-8') as f:
+                problem_data = json.load(f)
+        problem = problem_from_dict(problem_data)
+    except (OSError, ValueError) as e:
+        print(f"Error al leer el problema: {e}", file=sys.stderr)
+        return 2
+
+    solver = LinearProgrammingSolver(method=SolveMethod(args.method), presolve=args.presolve,
+                                     exact=args.exact, collect_stats=args.stats)
+    solution = solver.solve(problem)
+
+    json.dump(solution_to_dict(solution), output, indent=args.indent, ensure_ascii=False)
+    output.write("\n")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None, stdin: TextIO = sys.stdin,
+         output: TextIO = sys.stdout) -> int:
+    """
+    Punto de entrada de la interfaz de línea de comandos.
+
+    Args:
+        argv: Argumentos, empezando por el subcomando (por defecto sys.argv[1:])
+        stdin: Entrada usada con --stdin
+        output: Flujo donde se escribe la solución
+
+    Returns:
+        int: Código de salida
+    """
+    argv = sys.argv[1:] if argv is None else argv
+
+    if argv and argv[0] == "batch":
+        from .runner import main as batch_main
+        return batch_main(argv[1:], output=output)
+
+    args = _build_parser().parse_args(argv)
+    return _solve(args, stdin, output)
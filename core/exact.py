@@ -0,0 +1,239 @@
+"""
+Predicados geométricos exactos con filtro de punto flotante.
+Los determinantes se evalúan primero en float64 junto con una cota de su
+error de redondeo; solo cuando el resultado cae dentro de esa cota se
+recalcula con fractions.Fraction. Así la clasificación de vértices es exacta
+para cualquier escala de coeficientes y el costo es casi el de float.
+"""
+from fractions import Fraction
+from typing import Callable, Optional, Tuple
+import numpy as np
+
+from .models import InequalityType, INEQUALITY_CODES
+from .vectorized import DEFAULT_MAX_PAIRS_PER_CHUNK, DEFAULT_MAX_CELLS_PER_CHUNK, DEFAULT_CONSTRAINTS_PER_BLOCK
+
+
+# Redondeo unitario de float64 (la mitad del épsilon de máquina)
+UNIT_ROUNDOFF = 2.0 ** -53
+
+# Cotas relativas del error de a·d − b·c y del desarrollo por cofactores de un
+# determinante 3x3, multiplicadas por la suma de los valores absolutos de sus
+# términos (redondeadas hacia arriba respecto de las cotas de Shewchuk)
+DET2_ERROR_BOUND = 4.0 * UNIT_ROUNDOFF
+DET3_ERROR_BOUND = 8.0 * UNIT_ROUNDOFF
+
+# Margen absoluto para los productos que pierden precisión por subdesbordamiento
+_UNDERFLOW_MARGIN = float(np.finfo(np.float64).tiny)
+
+_CODE_LE = INEQUALITY_CODES[InequalityType.MENOR_IGUAL]
+_CODE_GE = INEQUALITY_CODES[InequalityType.MAYOR_IGUAL]
+
+
+class _Rationals:
+    """Conversión perezosa de los coeficientes a Fraction (exacta para cualquier float)"""
+
+    def __init__(self, A: np.ndarray, b: np.ndarray):
+        self._columns = (A[:, 0], A[:, 1], b)
+        self._cache = {}
+
+    def row(self, k: int) -> Tuple[Fraction, Fraction, Fraction]:
+        if k not in self._cache:
+            self._cache[k] = tuple(Fraction(float(column[k])) for column in self._columns)
+        return self._cache[k]
+
+
+def _sign(value) -> int:
+    return (value > 0) - (value < 0)
+
+
+def det2_signs(a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray) -> np.ndarray:
+    """
+    Signo exacto de a·d − b·c, elemento a elemento.
+
+    Args:
+        a, b, c, d: Arrays de la misma forma con los elementos de cada matriz 2x2
+
+    Returns:
+        np.ndarray: -1, 0 o 1 (int8) para cada determinante
+    """
+    ad, bc = a * d, b * c
+    det = ad - bc
+    signs = np.sign(det).astype(np.int8)
+
+    uncertain = np.abs(det) <= DET2_ERROR_BOUND * (np.abs(ad) + np.abs(bc)) + _UNDERFLOW_MARGIN
+    for index in zip(*np.nonzero(uncertain)):
+        exact = (Fraction(float(a[index])) * Fraction(float(d[index])) -
+                 Fraction(float(b[index])) * Fraction(float(c[index])))
+        signs[index] = _sign(exact)
+    return signs
+
+
+def exact_pairwise_intersections(A: np.ndarray, b: np.ndarray,
+                                 max_pairs_per_chunk: int = DEFAULT_MAX_PAIRS_PER_CHUNK,
+                                 progress: Optional[Callable[[float], None]] = None
+                                 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Intersecciones de todos los pares de rectas que no son exactamente paralelas.
+
+    Los pares se recorren en el orden de itertools.combinations. Las
+    coordenadas se calculan con la regla de Cramer en float, salvo en los
+    pares casi paralelos, donde se calculan con Fraction y se redondean una
+    sola vez.
+
+    Args:
+        A: Matriz de coeficientes (m, 2)
+        b: Vector de términos independientes (m,)
+        max_pairs_per_chunk: Máximo de pares evaluados en cada bloque
+        progress: Función llamada antes de cada bloque con la fracción de
+            filas procesadas (ver vectorized.pairwise_intersections)
+
+    Returns:
+        Tuple: Índices i, índices j, coordenadas X1 y coordenadas X2 de cada intersección
+    """
+    m = A.shape[0]
+    rationals = _Rationals(A, b)
+    rows_per_chunk = max(1, max_pairs_per_chunk // max(m, 1))
+    parts_i, parts_j, parts_x1, parts_x2 = [], [], [], []
+
+    for start in range(0, max(m - 1, 0), rows_per_chunk):
+        if progress is not None:
+            progress(start / (m - 1))
+        stop = min(start + rows_per_chunk, m - 1)
+        block_i = np.arange(start, stop)
+        ii, jj = np.nonzero(block_i[:, None] < np.arange(m)[None, :])
+        ii = block_i[ii]
+
+        a1i, a2i, a1j, a2j = A[ii, 0], A[ii, 1], A[jj, 0], A[jj, 1]
+        signs = det2_signs(a1i, a2i, a1j, a2j)
+        keep = signs != 0
+        ii, jj, a1i, a2i, a1j, a2j = ii[keep], jj[keep], a1i[keep], a2i[keep], a1j[keep], a2j[keep]
+
+        det = a1i * a2j - a1j * a2i
+        bi, bj = b[ii], b[jj]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x1 = (bi * a2j - bj * a2i) / det
+            x2 = (a1i * bj - a1j * bi) / det
+
+        # Pares casi paralelos: el determinante en float no es confiable
+        close = np.abs(det) <= DET2_ERROR_BOUND * (np.abs(a1i * a2j) + np.abs(a1j * a2i)) + _UNDERFLOW_MARGIN
+        for p in np.flatnonzero(close).tolist():
+            (p1i, p2i, qi), (p1j, p2j, qj) = rationals.row(int(ii[p])), rationals.row(int(jj[p]))
+            exact_det = p1i * p2j - p1j * p2i
+            x1[p] = float((qi * p2j - qj * p2i) / exact_det)
+            x2[p] = float((p1i * qj - p1j * qi) / exact_det)
+
+        parts_i.append(ii)
+        parts_j.append(jj)
+        parts_x1.append(x1)
+        parts_x2.append(x2)
+
+    if not parts_i:
+        empty = np.empty(0)
+        return empty.astype(np.intp), empty.astype(np.intp), empty, empty
+    return (np.concatenate(parts_i), np.concatenate(parts_j),
+            np.concatenate(parts_x1), np.concatenate(parts_x2))
+
+
+def _side_signs(A: np.ndarray, b: np.ndarray, pi: np.ndarray, pj: np.ndarray, pair_sign: np.ndarray,
+                minors: Tuple[np.ndarray, ...], permanents: Tuple[np.ndarray, ...],
+                ks: np.ndarray, rationals: _Rationals) -> np.ndarray:
+    """
+    Signo exacto de aₖ·x − bₖ para la intersección x de cada par y cada restricción k.
+
+    Args:
+        A, b: Coeficientes y términos independientes
+        pi, pj: Pares de restricciones (P,)
+        pair_sign: Signo exacto de det(B) de cada par (P,)
+        minors, permanents: Menores de la tercera fila de M y sus permanentes, (P,) cada uno
+        ks: Restricciones a evaluar (K,)
+        rationals: Coeficientes convertidos a Fraction
+
+    Returns:
+        np.ndarray: -1, 0 o 1 (int8) de forma (P, K)
+    """
+    a1k, a2k, bk = A[ks, 0][None, :], A[ks, 1][None, :], b[ks][None, :]
+    minor1, minor2, minor3 = (minor[:, None] for minor in minors)
+    perm1, perm2, perm3 = (perm[:, None] for perm in permanents)
+
+    det3 = a1k * minor1 - a2k * minor2 + bk * minor3
+    bound = DET3_ERROR_BOUND * (np.abs(a1k) * perm1 + np.abs(a2k) * perm2 + np.abs(bk) * perm3)
+    side = -np.sign(det3).astype(np.int8) * pair_sign[:, None]
+
+    # Las rectas i y j pasan por su propia intersección
+    own = (ks[None, :] == pi[:, None]) | (ks[None, :] == pj[:, None])
+    side[own] = 0
+    uncertain = (np.abs(det3) <= bound + _UNDERFLOW_MARGIN) & ~own
+
+    for p, q in zip(*np.nonzero(uncertain)):
+        (p1i, p2i, qi), (p1j, p2j, qj), (p1k, p2k, qk) = (
+            rationals.row(int(pi[p])), rationals.row(int(pj[p])), rationals.row(int(ks[q])))
+        exact = p1k * (p2i * qj - qi * p2j) - p2k * (p1i * qj - qi * p1j) + qk * (p1i * p2j - p1j * p2i)
+        side[p, q] = -_sign(exact) * int(pair_sign[p])
+    return side
+
+
+def exact_feasibility_mask(A: np.ndarray, b: np.ndarray, codes: np.ndarray,
+                           ii: np.ndarray, jj: np.ndarray,
+                           max_cells_per_chunk: int = DEFAULT_MAX_CELLS_PER_CHUNK,
+                           progress: Optional[Callable[[float], None]] = None) -> np.ndarray:
+    """
+    Decide exactamente si la intersección de cada par (i, j) cumple todas las restricciones.
+
+    Con x la intersección de las rectas i y j, aₖ·x − bₖ = −det(M)/det(B),
+    donde B es la matriz de coeficientes de i y j y M es la matriz 3x3 con las
+    filas [a₁ a₂ b] de i, j y k. Ambos determinantes se evalúan con filtro,
+    por lo que ningún vértice se clasifica con una tolerancia. Como en
+    feasibility_mask, las restricciones se recorren por bloques y los pares
+    que ya fallaron se descartan.
+
+    Args:
+        A: Matriz de coeficientes (m, 2)
+        b: Vector de términos independientes (m,)
+        codes: Códigos de desigualdad (m,)
+        ii, jj: Pares de restricciones no paralelas (ver exact_pairwise_intersections)
+        max_cells_per_chunk: Máximo de celdas (par, restricción) evaluadas por bloque
+        progress: Función llamada antes de cada bloque con la fracción de
+            pares procesados (ver vectorized.feasibility_mask)
+
+    Returns:
+        np.ndarray: Máscara booleana (P,) con los vértices factibles
+    """
+    m = A.shape[0]
+    n = len(ii)
+    mask = np.zeros(n, dtype=bool)
+    if m == 0 or n == 0:
+        return mask
+
+    rationals = _Rationals(A, b)
+    rows_per_block = min(m, DEFAULT_CONSTRAINTS_PER_BLOCK)
+    pairs_per_chunk = max(1, max_cells_per_chunk // rows_per_block)
+
+    for start in range(0, n, pairs_per_chunk):
+        if progress is not None:
+            progress(start / n)
+        pi, pj = ii[start:start + pairs_per_chunk], jj[start:start + pairs_per_chunk]
+        a1i, a2i, bi = A[pi, 0], A[pi, 1], b[pi]
+        a1j, a2j, bj = A[pj, 0], A[pj, 1], b[pj]
+        pair_sign = det2_signs(a1i, a2i, a1j, a2j)
+
+        # Menores de la tercera fila de M y sus permanentes (suma de |términos|)
+        minors = (a2i * bj - bi * a2j, a1i * bj - bi * a1j, a1i * a2j - a1j * a2i)
+        permanents = (np.abs(a2i * bj) + np.abs(bi * a2j), np.abs(a1i * bj) + np.abs(bi * a1j),
+                      np.abs(a1i * a2j) + np.abs(a1j * a2i))
+
+        alive = np.arange(len(pi))
+        for row in range(0, m, rows_per_block):
+            ks = np.arange(row, min(row + rows_per_block, m))
+            side = _side_signs(A, b, pi[alive], pj[alive], pair_sign[alive],
+                               tuple(minor[alive] for minor in minors),
+                               tuple(perm[alive] for perm in permanents), ks, rationals)
+            block_codes = codes[ks][None, :]
+            ok = np.where(block_codes == _CODE_LE, side <= 0,
+                          np.where(block_codes == _CODE_GE, side >= 0, side == 0)).all(axis=1)
+            alive = alive[ok]
+            if alive.size == 0:
+                break
+
+        mask[start + alive] = True
+
+    return mask
@@ -0,0 +1,205 @@
+"""
+Modelo de programación lineal de n variables.
+Representa el problema con vectores de NumPy y una matriz de restricciones
+densa o dispersa (ver core.matrix) para el backend simplex (ver core.simplex);
+los problemas de 2 variables se convierten sin pérdida con
+GeneralProblem.from_problem.
+"""
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from .models import (
+    LinearProgrammingProblem, ObjectiveFunction, ConstraintSet, InequalityType, OptimizationType,
+    INEQUALITY_TYPES
+)
+from .vectorized import INEQUALITY_CODES, constraints_to_arrays
+from .matrix import ConstraintMatrix, SparseMatrix, as_constraint_matrix, feasibility_violations, max_feasible_step
+
+
+class SolutionStatus(Enum):
+    """Resultado de la resolución de un problema de n variables"""
+    OPTIMA = "óptima"
+    INFACTIBLE = "infactible"
+    NO_ACOTADA = "no acotada"
+    LIMITE_ITERACIONES = "límite de iteraciones"
+
+
+@dataclass
+class GeneralProblem:
+    """
+    Problema de programación lineal de n variables:
+    optimizar c·x sujeto a A x (≤, ≥, =) b, x ≥ 0.
+    """
+    c: np.ndarray                           # (n,) coeficientes de la función objetivo
+    A: np.ndarray                           # (m, n) coeficientes (array denso o SparseMatrix)
+    inequality_types: List[InequalityType]  # (m,) tipo de cada restricción
+    b: np.ndarray                           # (m,) términos independientes
+    optimization_type: OptimizationType = OptimizationType.MAXIMIZAR
+    variable_names: Optional[List[str]] = None
+
+    def __post_init__(self):
+        self.c = np.asarray(self.c, dtype=np.float64).ravel()
+        self.b = np.asarray(self.b, dtype=np.float64).ravel()
+        if isinstance(self.A, SparseMatrix):
+            if self.A.shape != (len(self.b), len(self.c)):
+                raise ValueError(f"La matriz dispersa debe ser de {len(self.b)}x{len(self.c)}")
+        else:
+            self.A = np.asarray(self.A, dtype=np.float64).reshape(len(self.b), len(self.c))
+        self.inequality_types = list(self.inequality_types)
+
+        if len(self.inequality_types) != len(self.b):
+            raise ValueError("Debe haber un tipo de desigualdad por restricción")
+        if self.variable_names is not None and len(self.variable_names) != len(self.c):
+            raise ValueError("Debe haber un nombre por variable")
+
+    @property
+    def num_variables(self) -> int:
+        return len(self.c)
+
+    @property
+    def num_constraints(self) -> int:
+        return len(self.b)
+
+    @property
+    def is_sparse(self) -> bool:
+        return isinstance(self.A, SparseMatrix)
+
+    @property
+    def matrix(self) -> ConstraintMatrix:
+        """Matriz de restricciones con la interfaz común de core.matrix"""
+        return as_constraint_matrix(self.A)
+
+    @property
+    def codes(self) -> np.ndarray:
+        """Códigos de desigualdad de cada restricción (ver INEQUALITY_CODES)"""
+        return np.array([INEQUALITY_CODES[t] for t in self.inequality_types], dtype=np.int8)
+
+    def evaluate(self, x: np.ndarray) -> float:
+        """Evalúa la función objetivo en un punto"""
+        return float(self.c @ x)
+
+    def constraint_values(self, x: np.ndarray) -> np.ndarray:
+        """Lado izquierdo A x de cada restricción"""
+        return self.matrix.matvec(np.asarray(x, dtype=np.float64))
+
+    def violated_constraints(self, x: np.ndarray, tolerance: float = 1e-9) -> np.ndarray:
+        """Índices de las restricciones que el punto no cumple"""
+        return feasibility_violations(self.matrix, self.b, self.codes, np.asarray(x, dtype=np.float64), tolerance)
+
+    def max_step(self, x: np.ndarray, direction: np.ndarray) -> Tuple[float, int]:
+        """
+        Mayor paso factible desde x en la dirección indicada (ver core.matrix.max_feasible_step).
+
+        Returns:
+            Tuple[float, int]: Paso máximo y restricción que lo bloquea
+        """
+        return max_feasible_step(self.matrix, self.b, self.codes,
+                                 np.asarray(x, dtype=np.float64), np.asarray(direction, dtype=np.float64))
+
+    @classmethod
+    def from_rows(cls, c, rows: Iterable[Union[Dict[int, float], Tuple[Sequence[int], Sequence[float]]]],
+                  inequality_types: List[InequalityType], b,
+                  optimization_type: OptimizationType = OptimizationType.MAXIMIZAR,
+                  variable_names: Optional[List[str]] = None) -> "GeneralProblem":
+        """
+        Construye un problema disperso a partir de sus restricciones fila a fila.
+
+        Args:
+            c: Coeficientes de la función objetivo (n,)
+            rows: Cada restricción como {variable: coeficiente} o par (variables, coeficientes)
+            inequality_types: Tipo de cada restricción
+            b: Términos independientes
+            optimization_type: Sentido de la optimización
+            variable_names: Nombres opcionales de las variables
+
+        Returns:
+            GeneralProblem: Problema con la matriz en formato SparseMatrix
+        """
+        c = np.asarray(c, dtype=np.float64).ravel()
+        return cls(c, SparseMatrix.from_rows(rows, len(c)), inequality_types, b,
+                   optimization_type, variable_names)
+
+    @classmethod
+    def from_problem(cls, problem: LinearProgrammingProblem) -> "GeneralProblem":
+        """
+        Convierte un problema de 2 variables conservando todas sus restricciones.
+
+        Args:
+            problem: Problema de 2 variables
+
+        Returns:
+            GeneralProblem: Problema equivalente con n = 2
+        """
+        objective = problem.objective_function
+        A, b, codes = constraints_to_arrays(problem.constraints)
+        return cls(
+            c=[objective.c1, objective.c2],
+            A=A.copy(),
+            inequality_types=[INEQUALITY_TYPES[code] for code in codes.tolist()],
+            b=b.copy(),
+            optimization_type=objective.optimization_type,
+            variable_names=["X₁", "X₂"]
+        )
+
+    def to_problem(self) -> LinearProgrammingProblem:
+        """
+        Convierte un problema de 2 variables al modelo del método gráfico.
+
+        Returns:
+            LinearProgrammingProblem: Problema equivalente
+
+        Raises:
+            ValueError: Si el problema no tiene exactamente 2 variables
+        """
+        if self.num_variables != 2:
+            raise ValueError(f"Solo se pueden convertir problemas de 2 variables (tiene {self.num_variables})")
+
+        objective = ObjectiveFunction(float(self.c[0]), float(self.c[1]), self.optimization_type)
+        constraints = ConstraintSet.from_arrays(self.matrix.toarray(), self.b, self.codes)
+        return LinearProgrammingProblem(objective, constraints)
+
+    def __str__(self):
+        names = self.variable_names or [f"X{j + 1}" for j in range(self.num_variables)]
+        storage = f", {self.A.nnz} coeficientes no nulos" if self.is_sparse else ""
+        return (f"{self.optimization_type.value.capitalize()} Z con {self.num_variables} variables "
+                f"({', '.join(names[:5])}{', ...' if len(names) > 5 else ''}) "
+                f"y {self.num_constraints} restricciones{storage}")
+
+
+@dataclass
+class GeneralSolution:
+    """
+    Solución de un problema de n variables.
+
+    Usa los mismos nombres que Solution y SensitivityReport (optimal_point,
+    optimal_value, is_feasible, slacks, shadow_prices) para poder comparar
+    ambos caminos.
+    """
+    problem: GeneralProblem
+    status: SolutionStatus
+    optimal_point: Optional[np.ndarray] = None     # (n,) None si no hay óptimo
+    optimal_value: Optional[float] = None
+    shadow_prices: Optional[np.ndarray] = None     # (m,) variación de Z* por unidad de b
+    slacks: Optional[np.ndarray] = None            # (m,) holgura, excedente o desvío
+    iterations: int = 0
+    basis: List[int] = field(default_factory=list)  # Variables básicas (j ≥ n son holguras)
+
+    @property
+    def is_feasible(self) -> bool:
+        return self.status in (SolutionStatus.OPTIMA, SolutionStatus.NO_ACOTADA)
+
+    @property
+    def binding(self) -> List[int]:
+        """Restricciones activas en el óptimo"""
+        if self.slacks is None:
+            return []
+        scale = np.maximum(1.0, np.abs(self.problem.b))
+        return np.flatnonzero(self.slacks <= 1e-9 * scale).tolist()
+
+    def __str__(self):
+        if self.status != SolutionStatus.OPTIMA:
+            return f"Problema sin solución óptima ({self.status.value})"
+        return (f"Solución óptima en {self.iterations} iteraciones\n"
+                f"Valor óptimo: Z = {self.optimal_value:.3f}")
@@ -0,0 +1,408 @@
+"""
+Intersección de semiplanos en O(m log m).
+Construye directamente el polígono de la región factible ordenando los
+semiplanos por ángulo y procesándolos con una doble cola (deque).
+"""
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+import numpy as np
+
+from .models import Constraint, InequalityType, INEQUALITY_CODES
+from .vectorized import constraints_to_arrays
+
+
+# Etiquetas de los lados de la caja acotante (las restricciones usan índices >= 0)
+BOX_TAGS = (-1, -2, -3, -4)
+
+# Semiancho de la caja acotante relativo a la escala de los términos independientes
+DEFAULT_BOUND_FACTOR = 1e6
+
+# Umbral para considerar paralelas dos direcciones unitarias
+PARALLEL_EPS = 1e-12
+
+# Tolerancia con la que se decide 0 {≤,≥,=} b (la de Constraint.is_satisfied)
+_NULL_ROW_TOLERANCE = 1e-10
+
+_CODE_LE = INEQUALITY_CODES[InequalityType.MENOR_IGUAL]
+_CODE_GE = INEQUALITY_CODES[InequalityType.MAYOR_IGUAL]
+_CODE_EQ = INEQUALITY_CODES[InequalityType.IGUAL]
+
+
+@dataclass
+class ConvexPolygon:
+    """
+    Polígono convexo en sentido antihorario.
+
+    El lado k va del vértice k al vértice k+1 y está sobre el semiplano
+    edge_tags[k]; por lo tanto el vértice k es la intersección de los lados
+    k-1 y k. Los lados de la caja acotante tienen etiquetas negativas.
+    Las regiones degeneradas (segmentos o puntos) se representan con
+    vértices repetidos.
+    """
+    vertices: List[Tuple[float, float]]
+    edge_tags: List[int]
+
+    def is_empty(self) -> bool:
+        """Indica si la región es vacía"""
+        return not self.vertices
+
+    def vertex_tags(self, k: int) -> Tuple[int, int]:
+        """Etiquetas de los dos semiplanos que definen el vértice k"""
+        return self.edge_tags[k - 1], self.edge_tags[k]
+
+    def is_finite_vertex(self, k: int) -> bool:
+        """Indica si el vértice k proviene solo de restricciones (no de la caja)"""
+        tag_a, tag_b = self.vertex_tags(k)
+        return tag_a >= 0 and tag_b >= 0
+
+    @classmethod
+    def box(cls, bound: float) -> "ConvexPolygon":
+        """Caja acotante |x|, |y| <= bound"""
+        return cls(
+            [(bound, -bound), (bound, bound), (-bound, bound), (-bound, -bound)],
+            [BOX_TAGS[0], BOX_TAGS[1], BOX_TAGS[2], BOX_TAGS[3]]
+        )
+
+    def clip(self, nx: float, ny: float, c: float, tag: int, eps: float) -> "ConvexPolygon":
+        """
+        Recorta el polígono con el semiplano n·x <= c (Sutherland–Hodgman) en O(V).
+
+        Args:
+            nx, ny: Normal del semiplano
+            c: Término independiente
+            tag: Etiqueta del nuevo lado
+            eps: Tolerancia para considerar un vértice dentro del semiplano
+
+        Returns:
+            ConvexPolygon: Polígono recortado (posiblemente vacío)
+        """
+        count = len(self.vertices)
+        if count == 0:
+            return self
+
+        distances = [nx * x + ny * y - c for x, y in self.vertices]
+        if all(d <= eps for d in distances):
+            return self
+
+        vertices, edge_tags = [], []
+        for k in range(count):
+            cur, nxt = self.vertices[k], self.vertices[(k + 1) % count]
+            d_cur, d_nxt = distances[k], distances[(k + 1) % count]
+            cur_in, nxt_in = d_cur <= eps, d_nxt <= eps
+
+            if cur_in:
+                vertices.append(cur)
+                edge_tags.append(self.edge_tags[k])
+            if cur_in != nxt_in:
+                t = d_cur / (d_cur - d_nxt)
+                crossing = (cur[0] + t * (nxt[0] - cur[0]), cur[1] + t * (nxt[1] - cur[1]))
+                vertices.append(crossing)
+                # Al salir se sigue por el nuevo lado; al entrar, por el lado original
+                edge_tags.append(tag if cur_in else self.edge_tags[k])
+
+        return ConvexPolygon(vertices, edge_tags)
+
+
+def constraints_to_half_planes(constraints: List[Constraint]
+                               ) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Convierte las restricciones a semiplanos normalizados n·x <= c con |n| = 1.
+
+    Las restricciones ≥ se multiplican por -1 y las igualdades generan dos
+    semiplanos con la misma etiqueta. Las restricciones con coeficientes nulos
+    se omiten si son triviales.
+
+    Args:
+        constraints: Lista de restricciones
+
+    Returns:
+        Tuple: Componentes nx, ny, término c y etiquetas; None si alguna
+        restricción sin coeficientes es imposible de satisfacer
+    """
+    A, b, codes = constraints_to_arrays(constraints)
+    norm = np.hypot(A[:, 0], A[:, 1])
+
+    # 0 {≤,≥,=} b: se cumple siempre o nunca
+    null = norm == 0.0
+    if null.any():
+        null_b, null_codes = b[null], codes[null]
+        satisfied = np.where(null_codes == _CODE_LE, null_b >= -_NULL_ROW_TOLERANCE,
+                             np.where(null_codes == _CODE_GE, null_b <= _NULL_ROW_TOLERANCE,
+                                      np.abs(null_b) <= _NULL_ROW_TOLERANCE))
+        if not satisfied.all():
+            return None
+
+    # Las igualdades aportan dos semiplanos consecutivos (signo + y luego -)
+    rows = np.flatnonzero(~null)
+    tags = np.repeat(rows, np.where(codes[rows] == _CODE_EQ, 2, 1))
+    sign = np.where(codes[tags] == _CODE_GE, -1.0, 1.0)
+    second = np.zeros(len(tags), dtype=bool)
+    second[1:] = tags[1:] == tags[:-1]
+    sign[second] = -1.0
+
+    norm = norm[tags]
+    return (sign * A[tags, 0] / norm, sign * A[tags, 1] / norm, sign * b[tags] / norm,
+            tags.astype(np.intp))
+
+
+def half_plane_intersection(nx: np.ndarray, ny: np.ndarray, c: np.ndarray, tags: np.ndarray,
+                            eps: float, bound: float) -> Optional[ConvexPolygon]:
+    """
+    Calcula la intersección de los semiplanos n·x <= c dentro de la caja |x|, |y| <= bound.
+
+    Args:
+        nx, ny: Normales unitarias de los semiplanos
+        c: Términos independientes normalizados
+        tags: Etiqueta de cada semiplano (índice de la restricción)
+        eps: Tolerancia para decidir si un punto queda fuera de un semiplano
+        bound: Semiancho de la caja acotante
+
+    Returns:
+        ConvexPolygon: Región resultante (vacía si no es factible), o None si
+        la configuración es demasiado degenerada para decidirla con seguridad
+    """
+    # Agregar la caja acotante: x <= B, y <= B, -x <= B, -y <= B
+    nx = np.concatenate((nx, [1.0, 0.0, -1.0, 0.0]))
+    ny = np.concatenate((ny, [0.0, 1.0, 0.0, -1.0]))
+    c = np.concatenate((c, [bound] * 4))
+    tags = np.concatenate((tags, BOX_TAGS))
+
+    # La región queda a la izquierda de la dirección d = (-ny, nx)
+    angles = np.arctan2(nx, -ny)
+    order = np.lexsort((c, angles))
+
+    nx_l, ny_l, c_l, tags_l = nx.tolist(), ny.tolist(), c.tolist(), tags.tolist()
+
+    def intersect(i: int, j: int) -> Optional[Tuple[float, float]]:
+        det = nx_l[i] * ny_l[j] - nx_l[j] * ny_l[i]
+        if abs(det) <= PARALLEL_EPS:
+            return None
+        return ((c_l[i] * ny_l[j] - c_l[j] * ny_l[i]) / det,
+                (nx_l[i] * c_l[j] - nx_l[j] * c_l[i]) / det)
+
+    def is_out(i: int, point: Tuple[float, float]) -> bool:
+        return nx_l[i] * point[0] + ny_l[i] * point[1] - c_l[i] > eps
+
+    dq = deque()
+
+    for h in order.tolist():
+        while len(dq) >= 2:
+            point = intersect(dq[-1], dq[-2])
+            if point is None or not is_out(h, point):
+                break
+            dq.pop()
+
+        while len(dq) >= 2:
+            point = intersect(dq[0], dq[1])
+            if point is None or not is_out(h, point):
+                break
+            dq.popleft()
+
+        if dq:
+            back = dq[-1]
+            cross = nx_l[h] * ny_l[back] - nx_l[back] * ny_l[h]
+
+            if abs(cross) <= PARALLEL_EPS:
+                dot = nx_l[h] * nx_l[back] + ny_l[h] * ny_l[back]
+
+                if dot > 0:
+                    # Misma dirección: conservar el más restrictivo (c menor)
+                    if c_l[h] < c_l[back]:
+                        dq.pop()
+                    else:
+                        continue
+                else:
+                    # Direcciones opuestas contiguas: franja vacía o de ancho nulo
+                    width = c_l[h] + c_l[back]
+                    if width < -eps:
+                        return ConvexPolygon([], [])
+                    if width <= eps:
+                        return line_intersection(back, nx, ny, c, tags, eps)
+                    return None
+
+        dq.append(h)
+
+    # Limpieza final de los extremos de la cola
+    while len(dq) >= 3:
+        point = intersect(dq[-1], dq[-2])
+        if point is None or not is_out(dq[0], point):
+            break
+        dq.pop()
+
+    while len(dq) >= 3:
+        point = intersect(dq[0], dq[1])
+        if point is None or not is_out(dq[-1], point):
+            break
+        dq.popleft()
+
+    if len(dq) < 3:
+        return ConvexPolygon([], [])
+
+    edges = list(dq)
+    vertices = []
+    for k in range(len(edges)):
+        point = intersect(edges[k - 1], edges[k])
+        if point is None:
+            return None
+        vertices.append(point)
+
+    # Con regiones degeneradas la cola puede conservar semiplanos incompatibles:
+    # el centroide de un polígono convexo válido debe cumplir todos los semiplanos
+    centroid_x = sum(v[0] for v in vertices) / len(vertices)
+    centroid_y = sum(v[1] for v in vertices) / len(vertices)
+    if np.any(nx * centroid_x + ny * centroid_y - c > eps):
+        return None
+
+    return ConvexPolygon(vertices, [tags_l[h] for h in edges])
+
+
+def line_intersection(line: int, nx: np.ndarray, ny: np.ndarray, c: np.ndarray,
+                      tags: np.ndarray, eps: float) -> ConvexPolygon:
+    """
+    Intersecta todos los semiplanos con la recta n·x = c del semiplano `line`.
+
+    Se usa cuando la región tiene ancho nulo (igualdades o franjas degeneradas):
+    la recta se parametriza como p0 + t·d y cada semiplano acota t, en O(m).
+
+    Args:
+        line: Índice del semiplano cuya frontera contiene la región
+        nx, ny, c, tags: Semiplanos (incluida la caja acotante)
+        eps: Tolerancia de factibilidad
+
+    Returns:
+        ConvexPolygon: Segmento o punto representado como polígono degenerado
+    """
+    n0x, n0y, c0 = float(nx[line]), float(ny[line]), float(c[line])
+    line_tag = int(tags[line])
+    p0x, p0y = n0x * c0, n0y * c0
+    dx, dy = -n0y, n0x
+
+    k = nx * dx + ny * dy
+    r = c - (nx * p0x + ny * p0y)
+
+    parallel = np.abs(k) <= PARALLEL_EPS
+    if np.any(r[parallel] < -eps):
+        return ConvexPolygon([], [])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = r / k
+
+    upper = np.flatnonzero(~parallel & (k > 0))
+    lower = np.flatnonzero(~parallel & (k < 0))
+    hi_index = upper[np.argmin(t[upper])]
+    lo_index = lower[np.argmax(t[lower])]
+    t_hi, t_lo = float(t[hi_index]), float(t[lo_index])
+
+    if t_lo > t_hi + eps * (1.0 + abs(t_hi)):
+        return ConvexPolygon([], [])
+    if t_lo > t_hi:
+        t_lo = t_hi
+
+    start = (p0x + t_lo * dx, p0y + t_lo * dy)
+    end = (p0x + t_hi * dx, p0y + t_hi * dy)
+
+    tag_hi, tag_lo = int(tags[hi_index]), int(tags[lo_index])
+    return ConvexPolygon([start, end, end, start], [line_tag, tag_hi, line_tag, tag_lo])
+
+
+def polygon_tolerances(constraints: List[Constraint], eps_factor: float = 1e-9,
+                       bound_factor: float = DEFAULT_BOUND_FACTOR) -> Tuple[float, float]:
+    """
+    Calcula la tolerancia y el tamaño de la caja acotante según la escala del problema.
+
+    Args:
+        constraints: Lista de restricciones
+        eps_factor: Tolerancia relativa a la escala de los términos independientes
+        bound_factor: Tamaño de la caja acotante relativo a esa misma escala
+
+    Returns:
+        Tuple[float, float]: (eps, bound)
+    """
+    A, b, _ = constraints_to_arrays(constraints)
+    norm = np.hypot(A[:, 0], A[:, 1])
+    nonzero = norm > 0.0
+    scale = max(1.0, float(np.max(np.abs(b[nonzero]) / norm[nonzero], initial=0.0)))
+    return eps_factor * scale, bound_factor * scale
+
+
+def clip_constraint(polygon: ConvexPolygon, constraint: Constraint, tag: int, eps: float) -> ConvexPolygon:
+    """
+    Recorta un polígono con una restricción (las igualdades recortan por ambos lados).
+
+    Args:
+        polygon: Polígono a recortar
+        constraint: Restricción
+        tag: Etiqueta de la restricción
+        eps: Tolerancia de factibilidad
+
+    Returns:
+        ConvexPolygon: Polígono recortado
+    """
+    half_planes = constraints_to_half_planes([constraint])
+    if half_planes is None:
+        return ConvexPolygon([], [])
+
+    for nx, ny, c in zip(*(array.tolist() for array in half_planes[:3])):
+        polygon = polygon.clip(nx, ny, c, tag, eps)
+    return polygon
+
+
+def build_feasible_polygon(constraints: List[Constraint], eps_factor: float = 1e-9,
+                           bound_factor: float = DEFAULT_BOUND_FACTOR,
+                           eps: Optional[float] = None, bound: Optional[float] = None
+                           ) -> Optional[ConvexPolygon]:
+    """
+    Construye el polígono factible de un conjunto de restricciones.
+
+    Si hay igualdades la región está contenida en la recta de la primera de
+    ellas y se resuelve el caso unidimensional directamente.
+
+    Args:
+        constraints: Lista de restricciones
+        eps_factor: Tolerancia relativa a la escala de los términos independientes
+        bound_factor: Tamaño de la caja acotante relativo a esa misma escala
+        eps: Tolerancia absoluta (reemplaza a eps_factor)
+        bound: Semiancho absoluto de la caja acotante (reemplaza a bound_factor)
+
+    Returns:
+        ConvexPolygon: Región factible, o None si no se pudo decidir con seguridad
+    """
+    half_planes = constraints_to_half_planes(constraints)
+    if half_planes is None:
+        return ConvexPolygon([], [])
+
+    nx, ny, c, tags = half_planes
+    default_eps, default_bound = polygon_tolerances(constraints, eps_factor, bound_factor)
+    eps = default_eps if eps is None else eps
+    bound = default_bound if bound is None else bound
+
+    for index, constraint in enumerate(constraints):
+        if constraint.inequality_type == InequalityType.IGUAL:
+            line = np.flatnonzero(tags == index)
+            if line.size:
+                box_nx = np.concatenate((nx, [1.0, 0.0, -1.0, 0.0]))
+                box_ny = np.concatenate((ny, [0.0, 1.0, 0.0, -1.0]))
+                box_c = np.concatenate((c, [bound] * 4))
+                box_tags = np.concatenate((tags, BOX_TAGS))
+                return line_intersection(int(line[0]), box_nx, box_ny, box_c, box_tags, eps)
+
+    return half_plane_intersection(nx, ny, c, tags, eps, bound)
+
+
+def polygon_finite_vertices(polygon: ConvexPolygon) -> List[Tuple[float, float, int, int]]:
+    """
+    Vértices del polígono definidos por dos restricciones (sin la caja acotante).
+
+    Args:
+        polygon: Polígono factible
+
+    Returns:
+        List[Tuple]: Coordenadas y etiquetas (x1, x2, tag_a, tag_b) en orden antihorario
+    """
+    result = []
+    for k, (x1, x2) in enumerate(polygon.vertices):
+        if polygon.is_finite_vertex(k):
+            tag_a, tag_b = polygon.vertex_tags(k)
+            result.append((x1, x2, tag_a, tag_b))
+    return result
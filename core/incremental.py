@@ -0,0 +1,158 @@
+"""
+Solver incremental: mantiene el polígono factible mientras se agregan,
+eliminan o modifican restricciones, sin recalcular todas las intersecciones.
+"""
+from typing import Dict, List, Optional
+
+from .models import LinearProgrammingProblem, Constraint, Solution
+from .halfplane import (
+    ConvexPolygon, build_feasible_polygon, clip_constraint, polygon_tolerances
+)
+
+
+class IncrementalSolver:
+    """
+    Mantiene la región factible de un problema que cambia restricción a restricción.
+
+    - Agregar una restricción recorta el polígono actual en O(V).
+    - Eliminar o modificar una restricción que no forma ningún lado del
+      polígono solo requiere revisar sus lados (O(V)); si la restricción
+      estaba activa, la región se reconstruye por intersección de semiplanos.
+
+    Cada restricción se identifica con el entero devuelto por add_constraint.
+    """
+
+    def __init__(self, problem: LinearProgrammingProblem, tolerance: float = 1e-10):
+        """
+        Args:
+            problem: Problema inicial (se le agregan X1 ≥ 0 y X2 ≥ 0 si faltan)
+            tolerance: Tolerancia numérica del solver usado para evaluar vértices
+        """
+        from .solver import LinearProgrammingSolver
+
+        problem.add_non_negativity_constraints()
+        self.objective_function = problem.objective_function
+        self._solver = LinearProgrammingSolver(tolerance=tolerance)
+
+        self._constraints: Dict[int, Constraint] = {}
+        self._next_handle = 0
+        self._eps, self._bound = polygon_tolerances(problem.constraints)
+        self._solution: Optional[Solution] = None
+
+        for constraint in problem.constraints:
+            self._constraints[self._new_handle()] = constraint
+        self._rebuild()
+
+    def _new_handle(self) -> int:
+        handle = self._next_handle
+        self._next_handle += 1
+        return handle
+
+    @property
+    def constraints(self) -> List[Constraint]:
+        """Restricciones actuales en orden de inserción"""
+        return list(self._constraints.values())
+
+    @property
+    def polygon(self) -> ConvexPolygon:
+        """Polígono factible actual (lados etiquetados con el identificador de la restricción)"""
+        return self._polygon
+
+    def _rebuild(self):
+        """Reconstruye el polígono desde cero con las restricciones actuales"""
+        handles = list(self._constraints)
+        constraints = [self._constraints[h] for h in handles]
+
+        polygon = build_feasible_polygon(constraints, eps=self._eps, bound=self._bound)
+        if polygon is None:
+            # Caso degenerado: recortar la caja con cada restricción en orden
+            polygon = ConvexPolygon.box(self._bound)
+            for index, constraint in enumerate(constraints):
+                polygon = clip_constraint(polygon, constraint, index, self._eps)
+
+        # Traducir las etiquetas (posiciones en la lista) a identificadores
+        polygon.edge_tags = [handles[tag] if tag >= 0 else tag for tag in polygon.edge_tags]
+        self._polygon = polygon
+        self._solution = None
+
+    def _is_active(self, handle: int) -> bool:
+        """Indica si la restricción forma algún lado del polígono"""
+        return handle in self._polygon.edge_tags
+
+    def add_constraint(self, constraint: Constraint) -> int:
+        """
+        Agrega una restricción recortando el polígono actual.
+
+        Args:
+            constraint: Restricción nueva
+
+        Returns:
+            int: Identificador de la restricción
+        """
+        handle = self._new_handle()
+        self._constraints[handle] = constraint
+
+        if self._needs_larger_box(constraint):
+            self._rebuild()
+        else:
+            self._polygon = clip_constraint(self._polygon, constraint, handle, self._eps)
+            self._solution = None
+        return handle
+
+    def _needs_larger_box(self, constraint: Constraint) -> bool:
+        """
+        Verifica si la restricción tiene una escala mayor que la usada para la
+        caja acotante; en ese caso actualiza las tolerancias.
+        """
+        eps, bound = polygon_tolerances([constraint])
+        if bound <= self._bound:
+            return False
+        self._eps, self._bound = eps, bound
+        return True
+
+    def remove_constraint(self, handle: int):
+        """
+        Elimina una restricción.
+
+        Args:
+            handle: Identificador devuelto por add_constraint
+
+        Raises:
+            KeyError: Si la restricción no existe
+        """
+        del self._constraints[handle]
+
+        # Si la región es vacía cualquier restricción puede ser la causa
+        if self._polygon.is_empty() or self._is_active(handle):
+            self._rebuild()
+
+    def update_constraint(self, handle: int, constraint: Constraint):
+        """
+        Reemplaza una restricción existente.
+
+        Args:
+            handle: Identificador de la restricción
+            constraint: Nueva versión de la restricción
+
+        Raises:
+            KeyError: Si la restricción no existe
+        """
+        if handle not in self._constraints:
+            raise KeyError(handle)
+
+        self._constraints[handle] = constraint
+
+        if self._needs_larger_box(constraint) or self._polygon.is_empty() or self._is_active(handle):
+            self._rebuild()
+        else:
+            # La versión anterior no acotaba la región: basta con recortar
+            self._polygon = clip_constraint(self._polygon, constraint, handle, self._eps)
+            self._solution = None
+
+    @property
+    def solution(self) -> Solution:
+        """Solución correspondiente a las restricciones actuales"""
+        if self._solution is None:
+            problem = LinearProgrammingProblem(self.objective_function, self.constraints)
+            self._solution = self._solver._solution_from_polygon(problem, self._polygon)
+        return self._solution
@@ -0,0 +1,310 @@
+"""
+Almacenamiento de la matriz de restricciones de los problemas de n variables.
+DenseMatrix envuelve un array de NumPy y SparseMatrix guarda solo los
+coeficientes no nulos (CSR, con la vista CSC construida bajo demanda); ambas
+ofrecen las mismas operaciones para que el simplex no dependa del formato.
+"""
+from typing import Dict, Iterable, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from .vectorized import constraint_bounds
+
+
+class DenseMatrix:
+    """Matriz de restricciones densa"""
+
+    def __init__(self, array: np.ndarray):
+        self.array = np.asarray(array, dtype=np.float64)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.array.shape
+
+    @property
+    def nnz(self) -> int:
+        return int(np.count_nonzero(self.array))
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """A x"""
+        return self.array @ x
+
+    def rmatvec(self, y: np.ndarray) -> np.ndarray:
+        """Aᵀ y"""
+        return self.array.T @ y
+
+    def column(self, j: int) -> np.ndarray:
+        """Columna j como vector denso"""
+        return self.array[:, j].copy()
+
+    def column_norms_squared(self) -> np.ndarray:
+        """Norma euclídea al cuadrado de cada columna"""
+        return np.sum(self.array ** 2, axis=0)
+
+    def columns(self, cols: np.ndarray) -> "DenseMatrix":
+        """Submatriz con las columnas indicadas"""
+        return DenseMatrix(self.array[:, cols])
+
+    def dense_rows(self, rows: np.ndarray) -> np.ndarray:
+        """Filas indicadas como array denso"""
+        return self.array[rows]
+
+    def toarray(self) -> np.ndarray:
+        return self.array.copy()
+
+
+class SparseMatrix:
+    """
+    Matriz de restricciones dispersa en formato CSR.
+
+    Los productos se calculan con np.bincount sobre los coeficientes no nulos,
+    en O(nnz) y sin materializar la matriz densa. La vista por columnas (CSC)
+    se construye la primera vez que se necesita una columna.
+    """
+
+    def __init__(self, shape: Tuple[int, int], indptr: np.ndarray, indices: np.ndarray, data: np.ndarray):
+        """
+        Args:
+            shape: Dimensiones (m, n)
+            indptr: Inicio de cada fila en indices/data (m + 1,)
+            indices: Columna de cada coeficiente (nnz,)
+            data: Valor de cada coeficiente (nnz,)
+
+        Raises:
+            ValueError: Si los arrays no forman una matriz CSR válida
+        """
+        m, n = shape
+        self._shape = (int(m), int(n))
+        index_type = np.int32 if max(m, n) < 2 ** 31 else np.int64
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=index_type)
+        self.data = np.asarray(data, dtype=np.float64)
+
+        if len(self.indptr) != m + 1 or self.indptr[0] != 0 or self.indptr[-1] != len(self.data):
+            raise ValueError("indptr no corresponde a las filas de la matriz")
+        if len(self.indices) != len(self.data):
+            raise ValueError("indices y data deben tener la misma longitud")
+        if len(self.indices) and (self.indices.min() < 0 or self.indices.max() >= n):
+            raise ValueError("Índice de columna fuera de rango")
+
+        self._row_ids: Optional[np.ndarray] = None
+        self._csc: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+    @classmethod
+    def from_coo(cls, shape: Tuple[int, int], rows: np.ndarray, cols: np.ndarray,
+                 values: np.ndarray) -> "SparseMatrix":
+        """
+        Construye la matriz a partir de tripletas (fila, columna, valor).
+
+        Los coeficientes repetidos se suman y los ceros se descartan.
+        """
+        m, n = shape
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+
+        if len(rows) and (rows.min() < 0 or rows.max() >= m):
+            raise ValueError("Índice de fila fuera de rango")
+        if len(cols) and (cols.min() < 0 or cols.max() >= n):
+            raise ValueError("Índice de columna fuera de rango")
+
+        # Ordenar por (fila, columna) y sumar duplicados
+        keys = rows * n + cols
+        order = np.argsort(keys, kind="stable")
+        keys, values = keys[order], values[order]
+        unique_keys, starts = np.unique(keys, return_index=True)
+        summed = np.add.reduceat(values, starts) if len(values) else values
+
+        nonzero = summed != 0
+        unique_keys, summed = unique_keys[nonzero], summed[nonzero]
+        row_of = unique_keys // max(n, 1)
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(row_of, minlength=m))))
+        return cls(shape, indptr, unique_keys % max(n, 1), summed)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Union[Dict[int, float], Tuple[Sequence[int], Sequence[float]]]],
+                  num_columns: int) -> "SparseMatrix":
+        """
+        Construye la matriz fila a fila.
+
+        Args:
+            rows: Cada fila como diccionario {columna: valor} o par (columnas, valores)
+            num_columns: Número de variables n
+
+        Returns:
+            SparseMatrix: Matriz con una fila por elemento de rows
+        """
+        row_ids, cols, values = [], [], []
+        m = 0
+        for m, row in enumerate(rows, 1):
+            if isinstance(row, dict):
+                row_cols, row_values = list(row.keys()), list(row.values())
+            else:
+                row_cols, row_values = row
+            row_ids.append(np.full(len(row_cols), m - 1, dtype=np.int64))
+            cols.append(np.asarray(row_cols, dtype=np.int64))
+            values.append(np.asarray(row_values, dtype=np.float64))
+
+        if not row_ids:
+            return cls((0, num_columns), np.zeros(1), np.zeros(0), np.zeros(0))
+        return cls.from_coo((m, num_columns), np.concatenate(row_ids),
+                            np.concatenate(cols), np.concatenate(values))
+
+    @classmethod
+    def from_dense(cls, array: np.ndarray) -> "SparseMatrix":
+        """Convierte un array denso guardando solo los coeficientes no nulos"""
+        array = np.asarray(array, dtype=np.float64)
+        rows, cols = np.nonzero(array)
+        return cls.from_coo(array.shape, rows, cols, array[rows, cols])
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self._shape
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    @property
+    def density(self) -> float:
+        m, n = self._shape
+        return self.nnz / (m * n) if m and n else 0.0
+
+    @property
+    def row_ids(self) -> np.ndarray:
+        """Fila de cada coeficiente (forma COO de los índices CSR)"""
+        if self._row_ids is None:
+            self._row_ids = np.repeat(np.arange(self._shape[0], dtype=self.indices.dtype),
+                                      np.diff(self.indptr))
+        return self._row_ids
+
+    def _columns_view(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vista CSC: (inicio de cada columna, filas, valores)"""
+        if self._csc is None:
+            order = np.argsort(self.indices, kind="stable")
+            col_indptr = np.concatenate(([0], np.cumsum(np.bincount(self.indices, minlength=self._shape[1]))))
+            self._csc = (col_indptr, self.row_ids[order], self.data[order])
+        return self._csc
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """A x en O(nnz)"""
+        return np.bincount(self.row_ids, weights=self.data * x[self.indices], minlength=self._shape[0])
+
+    def rmatvec(self, y: np.ndarray) -> np.ndarray:
+        """Aᵀ y en O(nnz)"""
+        return np.bincount(self.indices, weights=self.data * y[self.row_ids], minlength=self._shape[1])
+
+    def row(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Columnas y valores no nulos de la fila i"""
+        start, stop = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:stop], self.data[start:stop]
+
+    def column(self, j: int) -> np.ndarray:
+        """Columna j como vector denso"""
+        col_indptr, rows, values = self._columns_view()
+        column = np.zeros(self._shape[0])
+        start, stop = col_indptr[j], col_indptr[j + 1]
+        column[rows[start:stop]] = values[start:stop]
+        return column
+
+    def column_norms_squared(self) -> np.ndarray:
+        """Norma euclídea al cuadrado de cada columna"""
+        return np.bincount(self.indices, weights=self.data ** 2, minlength=self._shape[1])
+
+    def columns(self, cols: np.ndarray) -> "SparseMatrix":
+        """Submatriz dispersa con las columnas indicadas (en ese orden)"""
+        cols = np.asarray(cols, dtype=np.int64)
+        col_indptr, rows, values = self._columns_view()
+        starts, lengths = col_indptr[cols], col_indptr[cols + 1] - col_indptr[cols]
+
+        # Posiciones de los coeficientes de cada columna pedida, concatenadas
+        owner = np.repeat(np.arange(len(cols)), lengths)
+        offsets = np.arange(len(owner)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        positions = np.repeat(starts, lengths) + offsets
+
+        return SparseMatrix.from_coo((self._shape[0], len(cols)), rows[positions], owner, values[positions])
+
+    def dense_rows(self, rows: np.ndarray) -> np.ndarray:
+        """Filas indicadas como array denso"""
+        rows = np.asarray(rows, dtype=np.int64)
+        result = np.zeros((len(rows), self._shape[1]))
+        counts = self.indptr[rows + 1] - self.indptr[rows]
+        target = np.repeat(np.arange(len(rows)), counts)
+        offsets = np.arange(len(target)) - np.repeat(np.cumsum(counts) - counts, counts)
+        positions = np.repeat(self.indptr[rows], counts) + offsets
+        result[target, self.indices[positions]] = self.data[positions]
+        return result
+
+    def toarray(self) -> np.ndarray:
+        result = np.zeros(self._shape)
+        result[self.row_ids, self.indices] = self.data
+        return result
+
+
+ConstraintMatrix = Union[DenseMatrix, SparseMatrix]
+
+
+def as_constraint_matrix(A) -> ConstraintMatrix:
+    """Envuelve un array denso en DenseMatrix; las matrices ya envueltas se devuelven igual"""
+    if isinstance(A, (DenseMatrix, SparseMatrix)):
+        return A
+    return DenseMatrix(A)
+
+
+def feasibility_violations(matrix: ConstraintMatrix, b: np.ndarray, codes: np.ndarray,
+                           x: np.ndarray, tolerance: float = 1e-9) -> np.ndarray:
+    """
+    Verifica A x (≤, ≥, =) b sin densificar la matriz.
+
+    Args:
+        matrix: Matriz de restricciones
+        b: Términos independientes (m,)
+        codes: Códigos de desigualdad (m,)
+        x: Punto a verificar (n,)
+        tolerance: Tolerancia de factibilidad
+
+    Returns:
+        np.ndarray: Índices de las restricciones violadas
+    """
+    values = matrix.matvec(x)
+    lower, upper = constraint_bounds(b, codes, tolerance)
+    return np.flatnonzero((values < lower) | (values > upper))
+
+
+def max_feasible_step(matrix: ConstraintMatrix, b: np.ndarray, codes: np.ndarray,
+                      x: np.ndarray, direction: np.ndarray,
+                      tolerance: float = 1e-9) -> Tuple[float, int]:
+    """
+    Prueba de razón: mayor t ≥ 0 tal que x + t·d sigue siendo factible.
+
+    Considera las restricciones y x ≥ 0; basta un producto A d disperso.
+
+    Args:
+        matrix: Matriz de restricciones
+        b: Términos independientes (m,)
+        codes: Códigos de desigualdad (m,)
+        x: Punto factible (n,)
+        direction: Dirección de movimiento (n,)
+        tolerance: Variación mínima considerada distinta de cero
+
+    Returns:
+        Tuple[float, int]: Paso máximo (inf si no hay límite) y restricción que
+        lo bloquea (m + j si es xⱼ ≥ 0, -1 si no hay límite)
+    """
+    values = matrix.matvec(x)
+    change = matrix.matvec(direction)
+    lower, upper = constraint_bounds(b, codes, 0.0)
+
+    # Distancia a cada cota dividida por la velocidad con que se acerca
+    with np.errstate(divide="ignore", invalid="ignore"):
+        to_upper = np.where(change > tolerance, (upper - values) / change, np.inf)
+        to_lower = np.where(change < -tolerance, (lower - values) / change, np.inf)
+        to_zero = np.where(direction < -tolerance, -x / direction, np.inf)
+
+    steps = np.concatenate((np.minimum(to_upper, to_lower), to_zero))
+    if len(steps) == 0:
+        return np.inf, -1
+    blocking = int(np.argmin(steps))
+    step = float(steps[blocking])
+    if np.isinf(step):
+        return np.inf, -1
+    return max(step, 0.0), blocking
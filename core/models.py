@@ -1,9 +1,15 @@
 """
 Modelos de datos para la aplicación de programación lineal.
 """
-from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from collections.abc import MutableSequence
+from dataclasses import dataclass, field, fields
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional, Union
 from enum import Enum
+import numpy as np
+
+
+# Tolerancia absoluta con la que se comparan puntos (ver Point.__eq__)
+POINT_TOLERANCE = 1e-6
 
 
 class OptimizationType(Enum):
@@ -12,6 +18,19 @@ class OptimizationType(Enum):
     MINIMIZAR = "minimizar"
 
 
+class SolveMethod(Enum):
+    """Algoritmo usado para construir la región factible"""
+    ENUMERACION = "enumeracion"  # Todas las intersecciones por pares, luego filtrado
+    SEMIPLANOS = "semiplanos"    # Intersección de semiplanos ordenados por ángulo
+
+
+class PresolveReason(Enum):
+    """Motivo por el que el presolve elimina una restricción"""
+    DUPLICADA = "duplicada"
+    DOMINADA = "dominada por una restricción paralela"
+    REDUNDANTE = "redundante con X₁ ≥ 0, X₂ ≥ 0"
+
+
 class InequalityType(Enum):
     """Tipo de desigualdad"""
     MENOR_IGUAL = "≤"
@@ -19,6 +38,33 @@ class InequalityType(Enum):
     IGUAL = "="
 
 
+# Códigos numéricos del tipo de desigualdad para representaciones en arrays
+INEQUALITY_CODES = {
+    InequalityType.MENOR_IGUAL: 0,
+    InequalityType.MAYOR_IGUAL: 1,
+    InequalityType.IGUAL: 2,
+}
+
+# Tipo de desigualdad de cada código (posición = código)
+INEQUALITY_TYPES = tuple(sorted(INEQUALITY_CODES, key=INEQUALITY_CODES.get))
+
+
+def _with_slots(cls):
+    """
+    Recrea una dataclass con __slots__ para que sus instancias no tengan __dict__.
+
+    Equivale a @dataclass(slots=True), disponible recién desde Python 3.10.
+    Los valores por defecto ya quedaron en el __init__ generado, así que se
+    quitan de la clase para que no choquen con los slots.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key not in names and key not in ("__dict__", "__weakref__")}
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_with_slots
 @dataclass
 class Constraint:
     """Representa una restricción del problema de programación lineal"""
@@ -61,26 +107,213 @@ class ObjectiveFunction:
         return self.c1 * x1 + self.c2 * x2
 
 
+class ConstraintSet(MutableSequence):
+    """
+    Conjunto de restricciones guardado en arrays contiguos.
+
+    Los coeficientes (m, 2) y los términos independientes (m,) son float64 y
+    el tipo de desigualdad es un código int8 (ver INEQUALITY_CODES), unos 25
+    bytes por restricción. Se comporta como una lista de Constraint: los
+    objetos Constraint se crean al indexar o iterar y son copias, por lo que
+    modificar uno no cambia el conjunto (se debe reasignar con cs[i] = ...).
+    """
+    __slots__ = ("_A", "_b", "_codes", "_size")
+
+    def __init__(self, constraints: Iterable[Constraint] = ()):
+        """
+        Args:
+            constraints: Restricciones iniciales (otra ConstraintSet se copia sin
+                crear objetos Constraint)
+        """
+        if isinstance(constraints, ConstraintSet):
+            self._A, self._b, self._codes = (array.copy() for array in constraints.to_arrays())
+            self._size = len(constraints)
+            return
+
+        constraints = list(constraints)
+        self._size = len(constraints)
+        self._A = np.array([(c.a1, c.a2) for c in constraints], dtype=np.float64).reshape(-1, 2)
+        self._b = np.array([c.b for c in constraints], dtype=np.float64)
+        self._codes = np.array([INEQUALITY_CODES[c.inequality_type] for c in constraints], dtype=np.int8)
+
+    @classmethod
+    def from_arrays(cls, A, b, codes) -> "ConstraintSet":
+        """
+        Construye el conjunto a partir de arrays (se copian).
+
+        Args:
+            A: Coeficientes (m, 2)
+            b: Términos independientes (m,)
+            codes: Códigos de desigualdad (m,)
+
+        Returns:
+            ConstraintSet: Conjunto con esas restricciones
+
+        Raises:
+            ValueError: Si las dimensiones no coinciden o hay códigos inválidos
+        """
+        A = np.array(A, dtype=np.float64).reshape(-1, 2)
+        b = np.array(b, dtype=np.float64).ravel()
+        codes = np.array(codes, dtype=np.int8).ravel()
+        if not len(A) == len(b) == len(codes):
+            raise ValueError("A, b y codes deben tener una fila por restricción")
+        if codes.size and (codes.min() < 0 or codes.max() >= len(INEQUALITY_TYPES)):
+            raise ValueError("Código de desigualdad inválido")
+
+        constraint_set = cls()
+        constraint_set._A, constraint_set._b, constraint_set._codes = A, b, codes
+        constraint_set._size = len(b)
+        return constraint_set
+
+    @property
+    def A(self) -> np.ndarray:
+        """Coeficientes (m, 2); es una vista de solo lectura del almacenamiento"""
+        return self._readonly(self._A[:self._size])
+
+    @property
+    def b(self) -> np.ndarray:
+        """Términos independientes (m,); vista de solo lectura"""
+        return self._readonly(self._b[:self._size])
+
+    @property
+    def codes(self) -> np.ndarray:
+        """Códigos de desigualdad (m,); vista de solo lectura"""
+        return self._readonly(self._codes[:self._size])
+
+    @property
+    def nbytes(self) -> int:
+        """Memoria ocupada por los arrays (incluida la capacidad reservada)"""
+        return self._A.nbytes + self._b.nbytes + self._codes.nbytes
+
+    @staticmethod
+    def _readonly(view: np.ndarray) -> np.ndarray:
+        view.flags.writeable = False
+        return view
+
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vistas (A, b, codes) de las restricciones, sin copiar"""
+        return self.A, self.b, self.codes
+
+    def take(self, indices: Iterable[int]) -> "ConstraintSet":
+        """Nuevo conjunto con las restricciones indicadas, en ese orden"""
+        indices = np.fromiter(indices, dtype=np.intp)
+        return ConstraintSet.from_arrays(self.A[indices], self.b[indices], self.codes[indices])
+
+    def copy(self) -> "ConstraintSet":
+        return ConstraintSet(self)
+
+    def _constraint(self, k: int) -> Constraint:
+        a1, a2 = self._A[k].tolist()
+        return Constraint(a1, a2, INEQUALITY_TYPES[self._codes[k]], float(self._b[k]))
+
+    def _position(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("índice de restricción fuera de rango")
+        return index
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Constraint, "ConstraintSet"]:
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(self._size)))
+        return self._constraint(self._position(index))
+
+    def __setitem__(self, index: int, constraint: Constraint):
+        k = self._position(index)
+        self._A[k] = (constraint.a1, constraint.a2)
+        self._b[k] = constraint.b
+        self._codes[k] = INEQUALITY_CODES[constraint.inequality_type]
+
+    def __delitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            positions = list(range(*index.indices(self._size)))
+        else:
+            positions = [self._position(index)]
+        keep = np.ones(self._size, dtype=bool)
+        keep[positions] = False
+        self._A, self._b, self._codes = self.A[keep], self.b[keep], self.codes[keep]
+        self._size = len(self._b)
+
+    def insert(self, index: int, constraint: Constraint):
+        index = min(max(index + self._size if index < 0 else index, 0), self._size)
+        self.append(constraint)
+        if index < self._size - 1:
+            # Desplazar las filas siguientes una posición
+            for array in (self._A, self._b, self._codes):
+                array[index + 1:self._size] = array[index:self._size - 1].copy()
+            self[index] = constraint
+
+    def append(self, constraint: Constraint):
+        """Agrega una restricción en O(1) amortizado (la capacidad se duplica)"""
+        if self._size == len(self._b):
+            capacity = max(4, 2 * self._size)
+            A = np.empty((capacity, 2), dtype=np.float64)
+            b = np.empty(capacity, dtype=np.float64)
+            codes = np.empty(capacity, dtype=np.int8)
+            A[:self._size], b[:self._size], codes[:self._size] = self.A, self.b, self.codes
+            self._A, self._b, self._codes = A, b, codes
+        self._size += 1
+        self[self._size - 1] = constraint
+
+    def __iter__(self) -> Iterator[Constraint]:
+        types = [INEQUALITY_TYPES[code] for code in self.codes.tolist()]
+        for (a1, a2), inequality_type, b in zip(self.A.tolist(), types, self.b.tolist()):
+            yield Constraint(a1, a2, inequality_type, b)
+
+    def __eq__(self, other):
+        if isinstance(other, ConstraintSet):
+            return (len(self) == len(other) and np.array_equal(self.A, other.A) and
+                    np.array_equal(self.b, other.b) and np.array_equal(self.codes, other.codes))
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"ConstraintSet({list(self)!r})"
+
+
 @dataclass
 class LinearProgrammingProblem:
-    """Problema completo de programación lineal"""
+    """
+    Problema completo de programación lineal.
+
+    Las restricciones se guardan siempre como ConstraintSet; se puede pasar
+    cualquier iterable de Constraint y se convierte al construir el problema.
+    """
     objective_function: ObjectiveFunction
-    constraints: List[Constraint]
+    constraints: ConstraintSet
+    integer_variables: Tuple[bool, bool] = (False, False)  # Integralidad de X1 y X2
+    
+    def __post_init__(self):
+        if not isinstance(self.constraints, ConstraintSet):
+            self.constraints = ConstraintSet(self.constraints)
     
     def __str__(self):
         lines = [str(self.objective_function)]
         lines.append("Sujeto a:")
         for constraint in self.constraints:
             lines.append(f"  {constraint}")
+        names = [name for name, flag in zip(("X₁", "X₂"), self.integer_variables) if flag]
+        if names:
+            lines.append(f"  {', '.join(names)} enteras")
         return "\n".join(lines)
     
+    def has_integer_variables(self) -> bool:
+        """Indica si alguna variable debe tomar valores enteros"""
+        return any(self.integer_variables)
+    
     def add_non_negativity_constraints(self):
         """Agrega restricciones de no negatividad si no existen"""
         # Verificar si ya existen restricciones X1 >= 0 y X2 >= 0
-        has_x1_non_neg = any(c.a1 == 1 and c.a2 == 0 and c.inequality_type == InequalityType.MAYOR_IGUAL and c.b == 0 
-                            for c in self.constraints)
-        has_x2_non_neg = any(c.a1 == 0 and c.a2 == 1 and c.inequality_type == InequalityType.MAYOR_IGUAL and c.b == 0 
-                            for c in self.constraints)
+        A, b, codes = self.constraints.to_arrays()
+        is_lower_bound = (codes == INEQUALITY_CODES[InequalityType.MAYOR_IGUAL]) & (b == 0)
+        has_x1_non_neg = bool(np.any(is_lower_bound & (A[:, 0] == 1) & (A[:, 1] == 0)))
+        has_x2_non_neg = bool(np.any(is_lower_bound & (A[:, 0] == 0) & (A[:, 1] == 1)))
         
         if not has_x1_non_neg:
             self.constraints.append(Constraint(1, 0, InequalityType.MAYOR_IGUAL, 0))
@@ -88,7 +321,8 @@ class LinearProgrammingProblem:
             self.constraints.append(Constraint(0, 1, InequalityType.MAYOR_IGUAL, 0))
 
 
-@dataclass 
+@_with_slots
+@dataclass
 class Point:
     """Punto en el plano cartesiano"""
     x1: float
@@ -100,15 +334,17 @@ class Point:
     def __eq__(self, other):
         if not isinstance(other, Point):
             return False
-        tolerance = 1e-6
-        return (abs(self.x1 - other.x1) < tolerance and 
-                abs(self.x2 - other.x2) < tolerance)
+        return (abs(self.x1 - other.x1) < POINT_TOLERANCE and 
+                abs(self.x2 - other.x2) < POINT_TOLERANCE)
     
     def __hash__(self):
-        # Redondear para hacer hasheable con tolerancia
+        # Redondear para hacer hasheable con tolerancia. Dos puntos iguales
+        # pueden caer a ambos lados del redondeo, así que para deduplicar con
+        # tolerancia se debe usar core.spatial.PointGrid en lugar de un set.
         return hash((round(self.x1, 6), round(self.x2, 6)))
 
 
+@_with_slots
 @dataclass
 class VertexEvaluation:
     """Evaluación de un vértice"""
@@ -121,6 +357,122 @@ class VertexEvaluation:
         return f"{self.point} → Z = {self.objective_value:.3f} {status}"
 
 
+@dataclass
+class RemovedConstraint:
+    """Restricción eliminada durante el presolve"""
+    index: int                        # Posición en problem.constraints
+    constraint: Constraint
+    reason: PresolveReason
+    kept_index: Optional[int] = None  # Restricción que la vuelve innecesaria
+    
+    def __str__(self):
+        text = f"{self.constraint}: {self.reason.value}"
+        if self.kept_index is not None:
+            text += f" (restricción {self.kept_index + 1})"
+        return text
+
+
+@dataclass
+class SensitivityReport:
+    """
+    Análisis de sensibilidad en el vértice óptimo.
+
+    Los índices se refieren a problem.constraints (incluye X1 ≥ 0 y X2 ≥ 0).
+    Los precios sombra y los rangos son None si el vértice no tiene una base
+    óptima (por ejemplo, cuando la región no está acotada).
+    """
+    binding: List[int]                                      # Restricciones activas en el óptimo
+    slacks: List[float]                                     # Holgura (≤), excedente (≥) o desvío (=)
+    basis: Optional[Tuple[int, int]] = None                 # Par de restricciones que define el vértice
+    shadow_prices: Optional[List[float]] = None             # Variación de Z* por unidad de b
+    objective_ranges: Optional[List[Tuple[float, float]]] = None  # Rangos de c1 y c2 con el mismo óptimo
+    rhs_ranges: Optional[List[Tuple[float, float]]] = None  # Rango de b de cada restricción con la misma base
+    
+    def is_binding(self, index: int) -> bool:
+        """Indica si la restricción está activa en el óptimo"""
+        return index in self.binding
+
+
+@dataclass
+class BranchAndBoundReport:
+    """
+    Resumen de la búsqueda de ramificación y acotamiento.
+
+    La cota es el mejor valor de la relajación entre los nodos que quedaron
+    sin explorar (o el valor entero óptimo si la búsqueda terminó).
+    """
+    relaxation_point: Optional[Point]    # Óptimo de la relajación lineal (nodo raíz)
+    relaxation_value: Optional[float]
+    nodes_explored: int = 0
+    nodes_pruned: int = 0                # Podados por cota o por ser infactibles
+    max_depth: int = 0
+    best_bound: Optional[float] = None
+    incumbent_value: Optional[float] = None
+    node_limit_reached: bool = False
+    
+    @property
+    def absolute_gap(self) -> Optional[float]:
+        """Diferencia entre la cota y la mejor solución entera encontrada"""
+        if self.best_bound is None or self.incumbent_value is None:
+            return None
+        return abs(self.best_bound - self.incumbent_value)
+    
+    @property
+    def gap(self) -> Optional[float]:
+        """Brecha de optimalidad relativa a max(1, |Z entero|)"""
+        if self.absolute_gap is None:
+            return None
+        return self.absolute_gap / max(1.0, abs(self.incumbent_value))
+    
+    def __str__(self):
+        gap = "sin solución entera" if self.gap is None else f"brecha {self.gap:.2%}"
+        limit = " (límite de nodos alcanzado)" if self.node_limit_reached else ""
+        return (f"{self.nodes_explored} nodos explorados, {self.nodes_pruned} podados, "
+                f"profundidad {self.max_depth}, {gap}{limit}")
+
+
+# Nombres de las fases registradas en SolveStats.phase_times
+PHASE_PRESOLVE = "presolve"
+PHASE_HALF_PLANES = "semiplanos"
+PHASE_INTERSECTIONS = "intersecciones"
+PHASE_FEASIBILITY = "factibilidad"
+PHASE_EVALUATION = "evaluación"
+PHASE_OPTIMUM = "óptimo"
+PHASE_SENSITIVITY = "sensibilidad"
+PHASE_BRANCH_AND_BOUND = "ramificación"
+
+
+@dataclass
+class SolveStats:
+    """
+    Tiempos por fase y contadores de una resolución.
+
+    Solo se registran si el solver se creó con collect_stats=True; los
+    contadores se obtienen del tamaño de los resultados de cada fase, así que
+    no agregan trabajo dentro de los bucles.
+    """
+    phase_times: Dict[str, float] = field(default_factory=dict)  # Segundos por fase, en orden de ejecución
+    pairs_examined: int = 0           # Pares de restricciones evaluados
+    parallel_pairs_skipped: int = 0   # Pares descartados por ser paralelos
+    points_tested: int = 0            # Puntos verificados contra todas las restricciones
+    duplicates_removed: int = 0       # Vértices factibles repetidos descartados
+    
+    @property
+    def total_time(self) -> float:
+        """Suma de los tiempos de todas las fases en segundos"""
+        return sum(self.phase_times.values())
+    
+    def add_time(self, phase: str, seconds: float):
+        """Acumula el tiempo de una fase (una fase puede ejecutarse más de una vez)"""
+        self.phase_times[phase] = self.phase_times.get(phase, 0.0) + seconds
+    
+    def __str__(self):
+        phases = ", ".join(f"{phase} {seconds * 1000:.1f} ms" for phase, seconds in self.phase_times.items())
+        return (f"{self.total_time * 1000:.1f} ms ({phases}); {self.pairs_examined} pares, "
+                f"{self.parallel_pairs_skipped} paralelos, {self.points_tested} puntos, "
+                f"{self.duplicates_removed} duplicados")
+
+
 @dataclass
 class Solution:
     """Solución completa del problema"""
@@ -131,6 +483,10 @@ class Solution:
     optimal_point: Optional[Point]
     optimal_value: Optional[float]
     is_feasible: bool = True
+    presolve_removed: List[RemovedConstraint] = field(default_factory=list)
+    sensitivity: Optional[SensitivityReport] = None
+    branch_and_bound: Optional[BranchAndBoundReport] = None
+    stats: Optional[SolveStats] = None
     
     def __str__(self):
         if not self.is_feasible:
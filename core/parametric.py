@@ -0,0 +1,269 @@
+"""
+Análisis paramétrico de la función objetivo y de los términos independientes.
+ObjectiveSweep construye el polígono factible una sola vez y responde cada
+consulta (c1, c2) con una búsqueda binaria sobre los conos normales de sus
+vértices; rhs_sweep resuelve el problema para una malla de valores de b.
+"""
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+import math
+import numpy as np
+
+from .models import LinearProgrammingProblem, Point, OptimizationType, InequalityType
+from .halfplane import ConvexPolygon, build_feasible_polygon, clip_constraint, polygon_tolerances
+from .vectorized import INEQUALITY_CODES, constraints_to_arrays, constraint_bounds
+from .batch import DEFAULT_MAX_CELLS_PER_CHUNK, best_feasible_vertices
+
+
+class ObjectiveSweep:
+    """
+    Barrido de la función objetivo sobre restricciones fijas.
+
+    El vértice k del polígono es óptimo para las direcciones c comprendidas
+    entre las normales exteriores de sus lados adyacentes. Estas normales
+    recorren el círculo en orden al avanzar por el polígono, así que el
+    vértice óptimo se localiza con una búsqueda binaria en O(log V).
+
+    Como en el método gráfico, solo se consideran los vértices definidos por
+    restricciones: si la región es no acotada y el óptimo cae en la caja
+    acotante, se elige el mejor extremo de la cadena de vértices finitos
+    (la función objetivo es unimodal a lo largo del polígono).
+    """
+
+    def __init__(self, problem: LinearProgrammingProblem):
+        """
+        Args:
+            problem: Problema cuyas restricciones se mantienen fijas
+                (se le agregan X1 ≥ 0 y X2 ≥ 0 si faltan)
+        """
+        problem.add_non_negativity_constraints()
+        self.problem = problem
+
+        polygon = build_feasible_polygon(problem.constraints)
+        if polygon is None:
+            eps, bound = polygon_tolerances(problem.constraints)
+            polygon = ConvexPolygon.box(bound)
+            for index, constraint in enumerate(problem.constraints):
+                polygon = clip_constraint(polygon, constraint, index, eps)
+
+        self._prepare(polygon)
+
+    def _prepare(self, polygon: ConvexPolygon):
+        """Ordena los vértices por el ángulo de inicio de su cono normal"""
+        vertices, finite = [], []
+        for k, vertex in enumerate(polygon.vertices):
+            is_finite = polygon.is_finite_vertex(k)
+            if vertices and Point(*vertices[-1]) == Point(*vertex):
+                finite[-1] = finite[-1] or is_finite
+                continue
+            vertices.append(vertex)
+            finite.append(is_finite)
+
+        if len(vertices) > 1 and Point(*vertices[0]) == Point(*vertices[-1]):
+            finite[0] = finite[0] or finite[-1]
+            vertices.pop()
+            finite.pop()
+
+        self.vertices = np.array(vertices, dtype=np.float64).reshape(-1, 2)
+        self.is_finite = np.array(finite, dtype=bool)
+        count = len(vertices)
+
+        self.is_feasible = bool(self.is_finite.any())
+        if count <= 1:
+            self._cone_start = np.zeros(count)
+            self._cone_vertex = np.arange(count)
+            self._chain_ends = (0, 0)
+            return
+
+        # Normal exterior del lado k (de v_k a v_k+1) en un polígono antihorario
+        edges = np.roll(self.vertices, -1, axis=0) - self.vertices
+        normal_angles = np.arctan2(-edges[:, 0], edges[:, 1])
+
+        # El cono del vértice k empieza en la normal del lado k-1
+        start = np.roll(normal_angles, 1)
+        order = np.argsort(start, kind="stable")
+        self._cone_start = start[order]
+        self._cone_vertex = order
+
+        # Extremos de la cadena de vértices finitos (cuando hay vértices de la caja)
+        if self.is_finite.all() or not self.is_feasible:
+            self._chain_ends = (0, 0)
+        else:
+            prev_finite = np.roll(self.is_finite, 1)
+            next_finite = np.roll(self.is_finite, -1)
+            first = int(np.flatnonzero(self.is_finite & ~prev_finite)[0])
+            last = int(np.flatnonzero(self.is_finite & ~next_finite)[0])
+            self._chain_ends = (first, last)
+
+    def _locate(self, c1: np.ndarray, c2: np.ndarray) -> np.ndarray:
+        """Índice del vértice que maximiza c1·x1 + c2·x2 para cada dirección"""
+        if len(self._cone_start) <= 1:
+            return np.zeros(c1.shape, dtype=np.intp)
+
+        theta = np.arctan2(c2, c1)
+        position = np.searchsorted(self._cone_start, theta, side="right") - 1
+        # Los ángulos anteriores al primer cono pertenecen al último (vuelta completa)
+        position = np.where(position < 0, len(self._cone_start) - 1, position)
+        best = self._cone_vertex[position]
+
+        if not self.is_finite.all():
+            first, last = self._chain_ends
+            value_first = c1 * self.vertices[first, 0] + c2 * self.vertices[first, 1]
+            value_last = c1 * self.vertices[last, 0] + c2 * self.vertices[last, 1]
+            chain_best = np.where(value_first >= value_last, first, last)
+            best = np.where(self.is_finite[best], best, chain_best)
+
+        return best
+
+    def query_many(self, c1: np.ndarray, c2: np.ndarray,
+                   maximize=True) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Resuelve el problema para muchas funciones objetivo a la vez.
+
+        Args:
+            c1: Coeficientes de X1 (N,)
+            c2: Coeficientes de X2 (N,)
+            maximize: True/False o array (N,) con el sentido de cada consulta
+
+        Returns:
+            Tuple: Puntos óptimos (N, 2) y valores óptimos (N,); NaN si no hay solución
+        """
+        c1 = np.asarray(c1, dtype=np.float64)
+        c2 = np.asarray(c2, dtype=np.float64)
+
+        if not self.is_feasible:
+            return np.full(c1.shape + (2,), np.nan), np.full(c1.shape, np.nan)
+
+        sign = np.where(np.asarray(maximize), 1.0, -1.0)
+        best = self._locate(sign * c1, sign * c2)
+
+        points = self.vertices[best]
+        values = c1 * points[..., 0] + c2 * points[..., 1]
+        return points, values
+
+    def query(self, c1: float, c2: float,
+              optimization_type: Optional[OptimizationType] = None) -> Tuple[Optional[Point], Optional[float]]:
+        """
+        Resuelve el problema para una función objetivo.
+
+        Args:
+            c1: Coeficiente de X1
+            c2: Coeficiente de X2
+            optimization_type: Sentido de la optimización (por defecto, el del problema)
+
+        Returns:
+            Tuple[Point, float]: Punto y valor óptimo, o (None, None) si no es factible
+        """
+        if optimization_type is None:
+            optimization_type = self.problem.objective_function.optimization_type
+
+        points, values = self.query_many(np.array([c1]), np.array([c2]),
+                                         optimization_type == OptimizationType.MAXIMIZAR)
+        if math.isnan(values[0]):
+            return None, None
+        return Point(float(points[0, 0]), float(points[0, 1])), float(values[0])
+
+
+@dataclass
+class RHSSweepResult:
+    """
+    Resultado de un barrido de términos independientes.
+
+    Los índices de active_constraints siguen la convención de
+    BatchSolution: K y K+1 son X1 ≥ 0 y X2 ≥ 0, con K el número de
+    restricciones del problema.
+    """
+    indices: Tuple[int, ...]        # Restricciones cuyo b varía
+    b_values: np.ndarray            # (G, len(indices)) valores de b en cada punto
+    optimal_points: np.ndarray      # (G, 2), NaN si no hay solución
+    optimal_values: np.ndarray      # (G,), NaN si no hay solución
+    is_feasible: np.ndarray         # (G,)
+    active_constraints: np.ndarray  # (G, 2) par que define el óptimo, -1 si no hay
+
+    def __len__(self) -> int:
+        return self.optimal_values.shape[0]
+
+    @property
+    def breakpoint_indices(self) -> np.ndarray:
+        """Posiciones del barrido donde cambia la base óptima (o la factibilidad)"""
+        basis = np.sort(self.active_constraints, axis=1)
+        changed = np.any(basis[1:] != basis[:-1], axis=1)
+        return np.flatnonzero(changed) + 1
+
+    @property
+    def breakpoints(self) -> np.ndarray:
+        """Valores de b en los que empieza una nueva base óptima (B, len(indices))"""
+        return self.b_values[self.breakpoint_indices]
+
+
+def rhs_sweep(problem: LinearProgrammingProblem, indices: Sequence[int], b_values,
+              tolerance: float = 1e-10,
+              max_cells_per_chunk: int = DEFAULT_MAX_CELLS_PER_CHUNK) -> RHSSweepResult:
+    """
+    Resuelve el problema para muchos valores de b de algunas restricciones.
+
+    Los coeficientes no cambian, así que los pares paralelos se descartan una
+    sola vez; cada punto del barrido es un problema de batch.best_feasible_vertices
+    que comparte la matriz A, por lo que la memoria queda acotada por
+    max_cells_per_chunk aunque un solo punto tenga O(k²) pares. Los
+    resultados coinciden con LinearProgrammingSolver.solve punto a punto.
+
+    Args:
+        problem: Problema base (no se modifica)
+        indices: Índices en problem.constraints de las restricciones que varían
+        b_values: Array (G,) si varía una restricción, o (G, len(indices)) con
+            los valores de cada punto del barrido (por ejemplo, una malla aplanada)
+        tolerance: Tolerancia para determinantes y factibilidad
+        max_cells_per_chunk: Máximo de evaluaciones por bloque (ver best_feasible_vertices)
+
+    Returns:
+        RHSSweepResult: Curva de Z* y bases óptimas a lo largo del barrido
+
+    Raises:
+        ValueError: Si algún índice no existe o las dimensiones de b_values
+            no corresponden a indices
+    """
+    indices = tuple(int(i) for i in indices)
+    b_values = np.asarray(b_values, dtype=np.float64)
+    if b_values.ndim == 1:
+        b_values = b_values[:, None]
+    if b_values.ndim != 2 or b_values.shape[1] != len(indices):
+        raise ValueError("b_values debe tener una columna por cada índice de restricción")
+
+    k = len(problem.constraints)
+    if any(not 0 <= i < k for i in indices):
+        raise ValueError(f"Índices de restricción fuera de rango (el problema tiene {k})")
+
+    A, b, codes = constraints_to_arrays(problem.constraints)
+    A = np.vstack((A.reshape(-1, 2), [[1.0, 0.0], [0.0, 1.0]]))
+    b = np.concatenate((b, [0.0, 0.0]))
+    codes = np.concatenate((codes, np.full(2, INEQUALITY_CODES[InequalityType.MAYOR_IGUAL], dtype=np.int8)))
+
+    # Estructura fija: pares con determinante no nulo, en el orden de solve_many
+    ii, jj = np.triu_indices(k + 2, 1)
+    det = A[ii, 0] * A[jj, 1] - A[jj, 0] * A[ii, 1]
+    valid = np.abs(det) >= tolerance
+    ii, jj = ii[valid], jj[valid]
+
+    objective = problem.objective_function
+    sign = 1.0 if objective.optimization_type == OptimizationType.MAXIMIZAR else -1.0
+
+    # Un problema por punto del barrido: solo cambian las columnas de indices
+    g = b_values.shape[0]
+    B = np.repeat(b[None, :], g, axis=0)
+    B[:, list(indices)] = b_values
+    lower, upper = constraint_bounds(B, np.broadcast_to(codes, B.shape), tolerance)
+
+    optimal_points, optimal_values, is_feasible, active = best_feasible_vertices(
+        np.broadcast_to(A, (g,) + A.shape), B, lower, upper,
+        np.broadcast_to([objective.c1, objective.c2], (g, 2)), np.full(g, sign),
+        ii, jj, tolerance, max_cells_per_chunk=max_cells_per_chunk)
+
+    return RHSSweepResult(
+        indices=indices,
+        b_values=b_values,
+        optimal_points=optimal_points,
+        optimal_values=optimal_values,
+        is_feasible=is_feasible,
+        active_constraints=active
+    )
@@ -0,0 +1,164 @@
+"""
+Presolve para problemas de programación lineal de 2 variables.
+Elimina restricciones duplicadas, dominadas por paralelas más ajustadas y
+redundantes frente a la no negatividad antes de calcular intersecciones.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import math
+
+from .models import Constraint, ConstraintSet, InequalityType, PresolveReason, RemovedConstraint
+
+
+# Decimales usados para agrupar direcciones normalizadas paralelas
+DIRECTION_DECIMALS = 9
+
+
+@dataclass
+class PresolveResult:
+    """Resultado del presolve"""
+    constraints: ConstraintSet      # Restricciones conservadas, en el orden original
+    kept_indices: List[int]         # Índice original de cada restricción conservada
+    removed: List[RemovedConstraint]
+
+
+def _normalized_row(constraint: Constraint) -> Optional[Tuple[float, float, float, float, float]]:
+    """
+    Normaliza una restricción a la forma lo <= n·x <= hi con |n| = 1 y el
+    primer coeficiente no nulo de n positivo.
+
+    Returns:
+        Tuple: (n1, n2, lo, hi, escala) o None si los coeficientes son nulos
+    """
+    norm = math.hypot(constraint.a1, constraint.a2)
+    if norm == 0.0:
+        return None
+
+    sign = 1.0 if (constraint.a1 > 0 or (constraint.a1 == 0 and constraint.a2 > 0)) else -1.0
+    n1, n2 = sign * constraint.a1 / norm, sign * constraint.a2 / norm
+    c = sign * constraint.b / norm
+
+    inequality = constraint.inequality_type
+    if inequality == InequalityType.IGUAL:
+        return n1, n2, c, c, norm
+    # Multiplicar por un signo negativo invierte el sentido de la desigualdad
+    if (inequality == InequalityType.MENOR_IGUAL) == (sign > 0):
+        return n1, n2, -math.inf, c, norm
+    return n1, n2, c, math.inf, norm
+
+
+def _is_non_negativity(constraint: Constraint) -> bool:
+    """Verifica si la restricción es X1 ≥ 0 o X2 ≥ 0 (con cualquier escala positiva)"""
+    return (constraint.inequality_type == InequalityType.MAYOR_IGUAL and constraint.b == 0 and
+            ((constraint.a1 > 0 and constraint.a2 == 0) or (constraint.a1 == 0 and constraint.a2 > 0)))
+
+
+def presolve(constraints: List[Constraint], tolerance: float = 1e-10) -> PresolveResult:
+    """
+    Reduce el conjunto de restricciones sin cambiar la región factible.
+
+    1. Agrupa las restricciones por dirección normalizada y conserva, en cada
+       grupo, la cota inferior y superior más ajustadas (y las igualdades).
+    2. Si X1 ≥ 0 y X2 ≥ 0 están presentes, elimina las desigualdades que se
+       cumplen en todo el primer cuadrante.
+
+    Args:
+        constraints: Restricciones del problema
+        tolerance: Tolerancia para comparar términos independientes normalizados
+
+    Returns:
+        PresolveResult: Restricciones conservadas y detalle de las eliminadas
+    """
+    # Los objetos Constraint se crean una sola vez al recorrer el conjunto
+    constraint_set = constraints if isinstance(constraints, ConstraintSet) else ConstraintSet(constraints)
+    constraints = list(constraint_set)
+
+    removed: Dict[int, RemovedConstraint] = {}
+    rows = [_normalized_row(constraint) for constraint in constraints]
+
+    # Agrupar restricciones paralelas con el mismo sentido de la normal
+    groups: Dict[Tuple[float, float], List[int]] = {}
+    for index, row in enumerate(rows):
+        if row is not None:
+            key = (round(row[0], DIRECTION_DECIMALS) + 0.0, round(row[1], DIRECTION_DECIMALS) + 0.0)
+            groups.setdefault(key, []).append(index)
+
+    for members in groups.values():
+        if len(members) > 1:
+            _reduce_parallel_group(constraints, rows, members, tolerance, removed)
+
+    has_box = (any(c.a1 == 1 and c.a2 == 0 and _is_non_negativity(c) for c in constraints) and
+               any(c.a1 == 0 and c.a2 == 1 and _is_non_negativity(c) for c in constraints))
+
+    for index, constraint in enumerate(constraints):
+        if index in removed:
+            continue
+
+        row = rows[index]
+        if row is None:
+            # 0 {≤,≥,=} b: redundante si siempre se cumple
+            if constraint.is_satisfied(0.0, 0.0, tolerance):
+                removed[index] = RemovedConstraint(index, constraint, PresolveReason.REDUNDANTE)
+            continue
+
+        if not has_box or _is_non_negativity(constraint) or constraint.inequality_type == InequalityType.IGUAL:
+            continue
+
+        # _normalized_row deja n1 > 0, o n1 = 0 y n2 > 0, así que una cota
+        # n·x ≤ hi con n ≤ 0 llega como lo ≤ n·x con n ≥ 0. Si además n2 ≥ 0,
+        # sobre el primer cuadrante n·x toma todos los valores de 0 a +inf y la
+        # cota inferior es redundante si no supera 0
+        _, n2, lo, _, _ = row
+        if lo != -math.inf and n2 >= 0 and lo <= tolerance:
+            removed[index] = RemovedConstraint(index, constraint, PresolveReason.REDUNDANTE)
+
+    kept_indices = [index for index in range(len(constraints)) if index not in removed]
+    return PresolveResult(
+        constraints=constraint_set.take(kept_indices),
+        kept_indices=kept_indices,
+        removed=[removed[index] for index in sorted(removed)]
+    )
+
+
+def _reduce_parallel_group(constraints: List[Constraint], rows: list, members: List[int],
+                           tolerance: float, removed: Dict[int, RemovedConstraint]):
+    """
+    Elimina las restricciones de un grupo paralelo que no ajustan el intervalo lo <= n·x <= hi.
+
+    Las restricciones de no negatividad se prefieren como representantes para
+    que la comprobación contra el primer cuadrante siga siendo válida.
+    """
+    def preference(index: int) -> Tuple[int, int]:
+        return (0 if _is_non_negativity(constraints[index]) else 1, index)
+
+    equalities = [i for i in members if constraints[i].inequality_type == InequalityType.IGUAL]
+
+    if equalities:
+        # Una igualdad fija n·x: las paralelas compatibles con ella sobran
+        anchor = equalities[0]
+        value = rows[anchor][2]
+        for index in members:
+            if index == anchor:
+                continue
+            lo, hi = rows[index][2], rows[index][3]
+            if index in equalities:
+                if abs(lo - value) <= tolerance:
+                    removed[index] = RemovedConstraint(index, constraints[index], PresolveReason.DUPLICADA, anchor)
+            elif lo - tolerance <= value <= hi + tolerance:
+                removed[index] = RemovedConstraint(index, constraints[index], PresolveReason.DOMINADA, anchor)
+        return
+
+    for bound, tighter in ((3, min), (2, max)):
+        candidates = [i for i in members if math.isfinite(rows[i][bound])]
+        if len(candidates) < 2:
+            continue
+
+        best_value = tighter(rows[i][bound] for i in candidates)
+        ties = [i for i in candidates if abs(rows[i][bound] - best_value) <= tolerance]
+        keeper = min(ties, key=preference)
+
+        for index in candidates:
+            if index == keeper:
+                continue
+            reason = PresolveReason.DUPLICADA if index in ties else PresolveReason.DOMINADA
+            removed[index] = RemovedConstraint(index, constraints[index], reason, keeper)
@@ -0,0 +1,291 @@
+"""
+Ejecución por lotes de problemas guardados en disco.
+Reparte los problemas (directorio de JSON o flujo JSONL) entre varios
+procesos con ProcessPoolExecutor y emite los resultados como JSONL.
+"""
+import json
+import os
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from .serialization import problem_from_dict, solution_to_dict
+
+
+@dataclass
+class ProblemResult:
+    """Resultado de un problema del lote"""
+    source: str                     # Archivo o "archivo:línea" de origen
+    solution: Optional[dict] = None
+    error: Optional[str] = None
+    timed_out: bool = False
+    elapsed: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Convierte el resultado a diccionario serializable"""
+        return {
+            "source": self.source,
+            "solution": self.solution,
+            "error": self.error,
+            "timed_out": self.timed_out,
+            "elapsed": self.elapsed
+        }
+
+
+@dataclass
+class BatchReport:
+    """Progreso y rendimiento acumulado de un lote"""
+    completed: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Problemas resueltos por segundo"""
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def __str__(self):
+        return (f"{self.completed} problemas ({self.failed} con error, {self.timed_out} por tiempo) "
+                f"en {self.elapsed:.2f} s - {self.throughput:.1f} problemas/s")
+
+
+class ProblemTimeout(Exception):
+    """Se superó el tiempo máximo de resolución de un problema"""
+
+
+class ProblemSourceError(Exception):
+    """No se pudo leer un problema del lote (archivo ilegible o JSON inválido)"""
+
+
+def _read_json_file(file_path: str) -> Union[dict, ProblemSourceError]:
+    """Lee un archivo JSON, devolviendo el error en lugar de lanzarlo"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        return ProblemSourceError(f"No se pudo leer el problema: {e}")
+
+
+def iter_problem_sources(path: str) -> Iterator[Tuple[str, Union[dict, ProblemSourceError]]]:
+    """
+    Lee los problemas de un directorio de archivos JSON o de un archivo JSONL.
+
+    Un archivo o una línea que no se puede leer no interrumpe el lote: en su
+    lugar se entrega un ProblemSourceError, que _solve_one convierte en un
+    resultado con error como el de cualquier problema inválido.
+
+    Args:
+        path: Directorio, archivo .json, archivo JSONL o "-" para leer JSONL de stdin
+
+    Yields:
+        Tuple: Origen del problema y su diccionario (o el error de lectura)
+    """
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if name.endswith(".json"):
+                file_path = os.path.join(path, name)
+                yield file_path, _read_json_file(file_path)
+        return
+
+    if path.endswith(".json"):
+        yield path, _read_json_file(path)
+        return
+
+    stream = sys.stdin if path == "-" else open(path, 'r', encoding='utf-8')
+    try:
+        for line_number, line in enumerate(stream, 1):
+            if line.strip():
+                try:
+                    problem_data = json.loads(line)
+                except json.JSONDecodeError as e:
+                    problem_data = ProblemSourceError(f"JSON inválido: {e}")
+                yield f"{path}:{line_number}", problem_data
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def _raise_timeout(signum, frame):
+    raise ProblemTimeout()
+
+
+def _solve_one(source: str, problem_data: Union[dict, ProblemSourceError], solver_options: dict,
+               timeout: Optional[float]) -> ProblemResult:
+    """Resuelve un problema dentro del proceso trabajador"""
+    from .solver import LinearProgrammingSolver
+
+    start = time.perf_counter()
+    use_alarm = timeout is not None and hasattr(signal, "setitimer")
+
+    try:
+        if use_alarm:
+            signal.signal(signal.SIGALRM, _raise_timeout)
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+
+        if isinstance(problem_data, ProblemSourceError):
+            raise problem_data
+        problem = problem_from_dict(problem_data)
+        solution = LinearProgrammingSolver(**solver_options).solve(problem)
+        result = ProblemResult(source, solution=solution_to_dict(solution))
+    except ProblemTimeout:
+        result = ProblemResult(source, error=f"Tiempo máximo excedido ({timeout} s)", timed_out=True)
+    except Exception as e:
+        result = ProblemResult(source, error=str(e))
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def _solve_chunk(chunk: List[Tuple[str, dict]], solver_options: dict,
+                 timeout: Optional[float]) -> List[ProblemResult]:
+    """Resuelve un bloque de problemas en un proceso trabajador"""
+    return [_solve_one(source, data, solver_options, timeout) for source, data in chunk]
+
+
+def _chunks(items: Iterable[Tuple[str, dict]], chunk_size: int) -> Iterator[List[Tuple[str, dict]]]:
+    """Agrupa un iterable en listas de tamaño chunk_size"""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_batch(problems: Iterable[Tuple[str, dict]], workers: Optional[int] = None,
+              chunk_size: int = 16, timeout: Optional[float] = None, ordered: bool = True,
+              solver_options: Optional[dict] = None,
+              progress: Optional[Callable[[BatchReport], None]] = None) -> Iterator[ProblemResult]:
+    """
+    Resuelve un flujo de problemas repartiéndolos entre varios procesos.
+
+    Solo se mantienen en vuelo unos pocos bloques por trabajador, así que el
+    flujo de entrada se consume de forma incremental.
+
+    Args:
+        problems: Pares (origen, diccionario del problema o ProblemSourceError)
+        workers: Número de procesos (por defecto, los núcleos disponibles)
+        chunk_size: Problemas enviados a un proceso en cada tarea
+        timeout: Tiempo máximo por problema en segundos (None = sin límite)
+        ordered: Si es True, los resultados salen en el orden de entrada
+        solver_options: Argumentos para LinearProgrammingSolver
+        progress: Función llamada con el BatchReport tras cada bloque
+
+    Yields:
+        ProblemResult: Resultado de cada problema
+    """
+    solver_options = solver_options or {}
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = workers * 4
+    report = BatchReport()
+
+    chunks = enumerate(_chunks(problems, max(1, chunk_size)))
+    pending: Dict = {}
+    finished: Dict[int, List[ProblemResult]] = {}
+    next_to_emit = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        def submit_more():
+            while len(pending) < max_in_flight:
+                try:
+                    index, chunk = next(chunks)
+                except StopIteration:
+                    return
+                future = executor.submit(_solve_chunk, chunk, solver_options, timeout)
+                pending[future] = index
+
+        submit_more()
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                index = pending.pop(future)
+                results = future.result()
+
+                for result in results:
+                    report.completed += 1
+                    if result.error is not None:
+                        report.failed += 1
+                    if result.timed_out:
+                        report.timed_out += 1
+
+                if ordered:
+                    finished[index] = results
+                else:
+                    yield from results
+
+                if progress is not None:
+                    progress(report)
+
+            if ordered:
+                while next_to_emit in finished:
+                    yield from finished.pop(next_to_emit)
+                    next_to_emit += 1
+
+            submit_more()
+
+
+def main(argv: Optional[List[str]] = None, output: TextIO = sys.stdout) -> int:
+    """
+    Punto de entrada de línea de comandos del ejecutor por lotes.
+
+    Args:
+        argv: Argumentos (por defecto sys.argv[1:])
+        output: Flujo donde se escriben los resultados JSONL
+
+    Returns:
+        int: Código de salida (1 si algún problema falló)
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Resuelve problemas por lotes en varios procesos")
+    parser.add_argument("path", help="Directorio de archivos .json, archivo JSONL o '-' para stdin")
+    parser.add_argument("--workers", type=int, default=None, help="Número de procesos")
+    parser.add_argument("--chunk-size", type=int, default=16, help="Problemas por tarea")
+    parser.add_argument("--timeout", type=float, default=None, help="Segundos máximos por problema")
+    parser.add_argument("--unordered", action="store_true", help="Emitir resultados al completarse")
+    parser.add_argument("--quiet", action="store_true", help="No mostrar el progreso en stderr")
+    args = parser.parse_args(argv)
+
+    last_report = BatchReport()
+
+    def track(report: BatchReport):
+        nonlocal last_report
+        last_report = report
+        if not args.quiet:
+            print(f"\r{report}", end="", file=sys.stderr, flush=True)
+
+    results = run_batch(
+        iter_problem_sources(args.path),
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        timeout=args.timeout,
+        ordered=not args.unordered,
+        progress=track
+    )
+
+    for result in results:
+        output.write(json.dumps(result.to_dict(), ensure_ascii=False) + "\n")
+
+    if not args.quiet and last_report.completed:
+        print(file=sys.stderr)
+    return 1 if last_report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""
+Análisis de sensibilidad a partir del vértice óptimo.
+Obtiene restricciones activas, holguras, precios sombra y rangos de
+optimalidad usando solo las dos restricciones que definen el vértice, en O(m)
+y sin volver a resolver el problema.
+"""
+from itertools import combinations
+from typing import List, Optional, Tuple
+import math
+import numpy as np
+
+from .models import LinearProgrammingProblem, Point, SensitivityReport, InequalityType, OptimizationType
+from .vectorized import INEQUALITY_CODES, constraints_to_arrays
+
+
+# Tolerancia relativa para considerar activa una restricción en el vértice óptimo
+ACTIVE_TOLERANCE = 1e-9
+
+_CODE_LE = INEQUALITY_CODES[InequalityType.MENOR_IGUAL]
+_CODE_GE = INEQUALITY_CODES[InequalityType.MAYOR_IGUAL]
+
+
+def _ratio_interval(g: np.ndarray, h: np.ndarray) -> Tuple[float, float]:
+    """
+    Intervalo de t que mantiene g + t·h ≥ 0 en todas las componentes.
+
+    Args:
+        g: Valores actuales (≥ 0)
+        h: Variación por unidad de t
+
+    Returns:
+        Tuple[float, float]: Extremos del intervalo (pueden ser infinitos)
+    """
+    scale = ACTIVE_TOLERANCE * max(1.0, float(np.max(np.abs(h), initial=0.0)))
+    increasing, decreasing = h > scale, h < -scale
+    lower = float(np.max(-g[increasing] / h[increasing], initial=-math.inf))
+    upper = float(np.min(-g[decreasing] / h[decreasing], initial=math.inf))
+    return lower, upper
+
+
+def _choose_basis(A: np.ndarray, outward: np.ndarray, binding: List[int],
+                  target: np.ndarray) -> Optional[Tuple[int, int, np.ndarray, np.ndarray]]:
+    """
+    Elige un par de restricciones activas cuyos multiplicadores prueban la optimalidad.
+
+    Args:
+        A: Coeficientes de las restricciones (m, 2)
+        outward: +1 para ≤, -1 para ≥ y 0 para = (sentido de la normal exterior)
+        binding: Índices de las restricciones activas
+        target: Vector objetivo orientado a maximizar
+
+    Returns:
+        Tuple: (i, j, B, y) con B la matriz 2x2 del par y target = yᵢ·aᵢ + yⱼ·aⱼ,
+        o None si ningún par es dual factible
+    """
+    for i, j in combinations(binding, 2):
+        B = A[[i, j]]
+        det = B[0, 0] * B[1, 1] - B[1, 0] * B[0, 1]
+        if abs(det) <= ACTIVE_TOLERANCE * np.linalg.norm(B[0]) * np.linalg.norm(B[1]):
+            continue
+
+        y = np.linalg.solve(B.T, target)
+        tolerance = ACTIVE_TOLERANCE * max(1.0, float(np.max(np.abs(y))))
+        if np.all(y * outward[[i, j]] >= -tolerance):
+            return i, j, B, y
+
+    return None
+
+
+def analyze_sensitivity(problem: LinearProgrammingProblem, point: Point) -> SensitivityReport:
+    """
+    Calcula el análisis de sensibilidad en el punto óptimo.
+
+    Con la base (i, j) que define el vértice, los precios sombra y son la
+    solución de Bᵀy = c; el vértice sigue siendo óptimo mientras los
+    multiplicadores conserven su signo (rangos de c) y se desplaza a lo largo
+    de B⁻¹eₖ al variar bₖ hasta que otra restricción lo corta (rangos de b).
+
+    Args:
+        problem: Problema resuelto (con X1 ≥ 0 y X2 ≥ 0 ya agregadas)
+        point: Vértice óptimo
+
+    Returns:
+        SensitivityReport: Restricciones activas, holguras, precios sombra y rangos
+    """
+    A, b, codes = constraints_to_arrays(problem.constraints)
+    x = np.array([point.x1, point.x2])
+    values = A @ x
+
+    # Holgura con signo: positiva cuando la restricción se cumple con margen
+    signed_slack = np.where(codes == _CODE_GE, values - b, b - values)
+    slacks = np.where(codes == INEQUALITY_CODES[InequalityType.IGUAL], np.abs(values - b), signed_slack)
+
+    scale = np.maximum(1.0, np.maximum(np.abs(b), np.abs(A) @ np.abs(x)))
+    binding = np.flatnonzero(np.abs(values - b) <= ACTIVE_TOLERANCE * scale).tolist()
+
+    report = SensitivityReport(binding=binding, slacks=slacks.tolist())
+
+    objective = problem.objective_function
+    sense = 1.0 if objective.optimization_type == OptimizationType.MAXIMIZAR else -1.0
+    outward = np.where(codes == _CODE_LE, 1.0, np.where(codes == _CODE_GE, -1.0, 0.0))
+
+    chosen = _choose_basis(A, outward, binding, sense * np.array([objective.c1, objective.c2]))
+    if chosen is None:
+        return report
+
+    i, j, B, y = chosen
+    basis = [i, j]
+    report.basis = (i, j)
+
+    shadow_prices = np.zeros(len(b))
+    shadow_prices[basis] = sense * y
+    report.shadow_prices = shadow_prices.tolist()
+
+    # Rangos de c: los multiplicadores deben mantener su signo
+    multipliers = np.maximum(y * outward[basis], 0.0)
+    objective_ranges = []
+    for q, coefficient in enumerate((objective.c1, objective.c2)):
+        w = np.linalg.solve(B.T, np.eye(2)[q]) * sense
+        lower, upper = _ratio_interval(multipliers, w * outward[basis])
+        objective_ranges.append((coefficient + lower, coefficient + upper))
+    report.objective_ranges = objective_ranges
+
+    # Rangos de b de las restricciones que no están en la base
+    rhs_ranges = [
+        (float(values[r]), math.inf) if codes[r] == _CODE_LE else
+        (-math.inf, float(values[r])) if codes[r] == _CODE_GE else
+        (float(b[r]), float(b[r]))
+        for r in range(len(b))
+    ]
+
+    # Rangos de b de la base: el vértice se mueve en la dirección B⁻¹eₖ
+    others = np.ones(len(b), dtype=bool)
+    others[basis] = False
+    margin = np.maximum(signed_slack[others], 0.0)
+    is_equality = codes[others] == INEQUALITY_CODES[InequalityType.IGUAL]
+    outward_others = np.where(is_equality, 1.0, outward[others])
+
+    for position, k in enumerate(basis):
+        direction = np.linalg.solve(B, np.eye(2)[position])
+        change = A[others] @ direction * -outward_others
+        g = np.concatenate((np.where(is_equality, 0.0, margin), np.zeros(int(is_equality.sum()))))
+        h = np.concatenate((change, -change[is_equality]))
+        lower, upper = _ratio_interval(g, h)
+        rhs_ranges[k] = (float(b[k]) + lower, float(b[k]) + upper)
+    report.rhs_ranges = rhs_ranges
+
+    return report
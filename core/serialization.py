@@ -0,0 +1,171 @@
+"""
+Conversión de problemas y soluciones al formato JSON de la aplicación.
+"""
+import math
+from typing import List, Optional, Tuple
+
+from .models import (
+    LinearProgrammingProblem, ObjectiveFunction, Constraint, Point, Solution,
+    SensitivityReport, BranchAndBoundReport, SolveStats, InequalityType, OptimizationType
+)
+
+
+def problem_to_dict(problem: LinearProgrammingProblem) -> dict:
+    """Convierte un problema a diccionario para serialización"""
+    problem_data = {
+        "objective_function": {
+            "c1": problem.objective_function.c1,
+            "c2": problem.objective_function.c2,
+            "optimization_type": problem.objective_function.optimization_type.value
+        },
+        "constraints": [
+            {
+                "a1": constraint.a1,
+                "a2": constraint.a2,
+                "inequality_type": constraint.inequality_type.value,
+                "b": constraint.b
+            }
+            for constraint in problem.constraints
+            if not ((constraint.a1 == 1 and constraint.a2 == 0) or
+                   (constraint.a1 == 0 and constraint.a2 == 1))  # Excluir no negatividad
+        ]
+    }
+    # Solo se escribe si hay variables enteras para no alterar los archivos existentes
+    if problem.has_integer_variables():
+        problem_data["integer_variables"] = list(problem.integer_variables)
+    return problem_data
+
+
+def problem_from_dict(problem_data: dict) -> LinearProgrammingProblem:
+    """
+    Construye un problema a partir del diccionario generado por problem_to_dict.
+
+    Args:
+        problem_data: Diccionario con función objetivo y restricciones
+
+    Returns:
+        LinearProgrammingProblem: Problema equivalente
+
+    Raises:
+        ValueError: Si faltan campos o tienen valores inválidos
+    """
+    try:
+        obj_func = problem_data["objective_function"]
+        objective_function = ObjectiveFunction(
+            float(obj_func["c1"]),
+            float(obj_func["c2"]),
+            OptimizationType(obj_func["optimization_type"])
+        )
+
+        constraints = [
+            Constraint(
+                float(constraint_data["a1"]),
+                float(constraint_data["a2"]),
+                InequalityType(constraint_data["inequality_type"]),
+                float(constraint_data["b"])
+            )
+            for constraint_data in problem_data["constraints"]
+        ]
+
+        integer_variables = tuple(bool(flag) for flag in problem_data.get("integer_variables", (False, False)))
+        if len(integer_variables) != 2:
+            raise ValueError("integer_variables debe tener un valor por variable")
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Formato de problema inválido: {e}")
+
+    return LinearProgrammingProblem(objective_function, constraints, integer_variables)
+
+
+def _point_to_list(point: Optional[Point]) -> Optional[list]:
+    """Convierte un punto a lista [x1, x2]"""
+    return None if point is None else [point.x1, point.x2]
+
+
+def _ranges_to_list(ranges: Optional[List[Tuple[float, float]]]) -> Optional[list]:
+    """Convierte rangos a listas [mín, máx], con None en los extremos infinitos"""
+    if ranges is None:
+        return None
+    return [[None if math.isinf(value) else value for value in bounds] for bounds in ranges]
+
+
+def sensitivity_to_dict(report: Optional[SensitivityReport]) -> Optional[dict]:
+    """Convierte el análisis de sensibilidad a diccionario serializable en JSON"""
+    if report is None:
+        return None
+    return {
+        "binding": report.binding,
+        "slacks": report.slacks,
+        "basis": None if report.basis is None else list(report.basis),
+        "shadow_prices": report.shadow_prices,
+        "objective_ranges": _ranges_to_list(report.objective_ranges),
+        "rhs_ranges": _ranges_to_list(report.rhs_ranges)
+    }
+
+
+def branch_and_bound_to_dict(report: Optional[BranchAndBoundReport]) -> Optional[dict]:
+    """Convierte el resumen de ramificación y acotamiento a diccionario serializable en JSON"""
+    if report is None:
+        return None
+    return {
+        "relaxation_point": _point_to_list(report.relaxation_point),
+        "relaxation_value": report.relaxation_value,
+        "nodes_explored": report.nodes_explored,
+        "nodes_pruned": report.nodes_pruned,
+        "max_depth": report.max_depth,
+        "best_bound": report.best_bound,
+        "gap": report.gap,
+        "node_limit_reached": report.node_limit_reached
+    }
+
+
+def stats_to_dict(stats: Optional[SolveStats]) -> Optional[dict]:
+    """Convierte las estadísticas de resolución a diccionario serializable en JSON"""
+    if stats is None:
+        return None
+    return {
+        "phase_times": dict(stats.phase_times),
+        "total_time": stats.total_time,
+        "pairs_examined": stats.pairs_examined,
+        "parallel_pairs_skipped": stats.parallel_pairs_skipped,
+        "points_tested": stats.points_tested,
+        "duplicates_removed": stats.duplicates_removed
+    }
+
+
+def solution_to_dict(solution: Solution) -> dict:
+    """
+    Convierte una solución a diccionario para serialización.
+
+    Los puntos de intersección se resumen con su cantidad, ya que pueden ser O(m²).
+
+    Args:
+        solution: Solución a convertir
+
+    Returns:
+        dict: Representación serializable en JSON
+    """
+    return {
+        "is_feasible": solution.is_feasible,
+        "optimal_point": _point_to_list(solution.optimal_point),
+        "optimal_value": solution.optimal_value,
+        "intersection_count": len(solution.intersection_points),
+        "feasible_vertices": [_point_to_list(vertex) for vertex in solution.feasible_vertices],
+        "vertex_evaluations": [
+            {
+                "point": _point_to_list(evaluation.point),
+                "objective_value": evaluation.objective_value
+            }
+            for evaluation in solution.vertex_evaluations
+        ],
+        "presolve_removed": [
+            {
+                "index": removed.index,
+                "reason": removed.reason.value,
+                "kept_index": removed.kept_index
+            }
+            for removed in solution.presolve_removed
+        ],
+        "sensitivity": sensitivity_to_dict(solution.sensitivity),
+        "branch_and_bound": branch_and_bound_to_dict(solution.branch_and_bound),
+        "stats": stats_to_dict(solution.stats)
+    }
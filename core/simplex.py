@@ -0,0 +1,478 @@
+"""
+Backend simplex revisado para problemas de n variables.
+Mantiene la base factorizada como LU con pivoteo parcial más una lista de
+actualizaciones eta (forma producto) y la refactoriza periódicamente. La
+matriz de restricciones puede ser densa o dispersa (ver core.matrix).
+"""
+from enum import Enum
+from typing import List, Optional, Tuple, Union
+import numpy as np
+
+from .models import LinearProgrammingProblem, InequalityType, OptimizationType
+from .general import GeneralProblem, GeneralSolution, SolutionStatus
+from .vectorized import INEQUALITY_CODES
+from .matrix import ConstraintMatrix
+
+
+# Número de actualizaciones eta tras las que se refactoriza la base
+DEFAULT_REFACTOR_INTERVAL = 64
+
+# Filas por bloque en las sustituciones triangulares de la LU
+TRIANGULAR_BLOCK_SIZE = 64
+
+# Pivote mínimo relativo al mayor elemento de la columna entrante
+PIVOT_TOLERANCE = 1e-7
+
+# Pivotes degenerados consecutivos tras los que se usa la regla de Bland
+DEGENERATE_PIVOT_LIMIT = 50
+
+_CODE_LE = INEQUALITY_CODES[InequalityType.MENOR_IGUAL]
+_CODE_GE = INEQUALITY_CODES[InequalityType.MAYOR_IGUAL]
+
+
+class PricingRule(Enum):
+    """Regla para elegir la variable que entra a la base"""
+    DANTZIG = "dantzig"                                # Costo reducido más negativo
+    BLAND = "bland"                                    # Menor índice (evita ciclos)
+    ARISTA_MAS_PRONUNCIADA = "arista_mas_pronunciada"  # Steepest edge (Goldfarb-Reid)
+
+
+class SingularBasisError(Exception):
+    """La matriz básica es numéricamente singular"""
+
+
+class LUFactorization:
+    """Factorización PA = LU densa con pivoteo parcial"""
+
+    def __init__(self, A: np.ndarray, pivot_tolerance: float = 1e-11):
+        """
+        Args:
+            A: Matriz cuadrada (k, k)
+            pivot_tolerance: Pivote mínimo antes de considerar A singular
+
+        Raises:
+            SingularBasisError: Si A es numéricamente singular
+        """
+        lu = np.array(A, dtype=np.float64)
+        k = lu.shape[0]
+        perm = np.arange(k)
+
+        for i in range(k):
+            p = i + int(np.argmax(np.abs(lu[i:, i])))
+            if abs(lu[p, i]) < pivot_tolerance:
+                raise SingularBasisError(f"Pivote nulo en la columna {i}")
+            if p != i:
+                lu[[i, p]] = lu[[p, i]]
+                perm[[i, p]] = perm[[p, i]]
+
+            lu[i + 1:, i] /= lu[i, i]
+            lu[i + 1:, i + 1:] -= np.outer(lu[i + 1:, i], lu[i, i + 1:])
+
+        # L (diagonal unitaria) y U comparten la misma matriz
+        self._lu = lu
+        self._perm = perm
+
+        # Inversas de los bloques diagonales: las sustituciones avanzan de a
+        # un bloque con productos matriciales en lugar de fila a fila
+        self._blocks = []
+        for start in range(0, k, TRIANGULAR_BLOCK_SIZE):
+            stop = min(start + TRIANGULAR_BLOCK_SIZE, k)
+            diagonal = lu[start:stop, start:stop]
+            lower = np.tril(diagonal, -1) + np.eye(stop - start)
+            upper = np.triu(diagonal)
+            self._blocks.append((start, stop, np.linalg.inv(lower), np.linalg.inv(upper)))
+
+    def solve(self, a: np.ndarray) -> np.ndarray:
+        """Resuelve A x = a"""
+        lu = self._lu
+        x = np.array(a, dtype=np.float64)[self._perm]
+
+        # L z = P a (hacia adelante) y U x = z (hacia atrás)
+        for start, stop, lower_inv, _ in self._blocks:
+            x[start:stop] = lower_inv @ (x[start:stop] - lu[start:stop, :start] @ x[:start])
+        for start, stop, _, upper_inv in reversed(self._blocks):
+            x[start:stop] = upper_inv @ (x[start:stop] - lu[start:stop, stop:] @ x[stop:])
+        return x
+
+    def solve_transpose(self, c: np.ndarray) -> np.ndarray:
+        """Resuelve Aᵀ y = c"""
+        lu = self._lu
+        v = np.array(c, dtype=np.float64)
+
+        # Uᵀ t = c (hacia adelante) y Lᵀ s = t (hacia atrás)
+        for start, stop, _, upper_inv in self._blocks:
+            v[start:stop] = upper_inv.T @ (v[start:stop] - lu[:start, start:stop].T @ v[:start])
+        for start, stop, lower_inv, _ in reversed(self._blocks):
+            v[start:stop] = lower_inv.T @ (v[start:stop] - lu[stop:, start:stop].T @ v[stop:])
+
+        y = np.empty(len(v))
+        y[self._perm] = v
+        return y
+
+
+class BasisFactorization:
+    """
+    Factorización de la matriz básica B de la forma estándar.
+
+    Las columnas de holguras y artificiales son vectores unitarios, así que
+    se eliminan directamente: solo el núcleo K = A[R, T] (columnas
+    estructurales básicas T y filas R no cubiertas por columnas unitarias) se
+    factoriza con LU. Cada cambio de base agrega una matriz eta E (la
+    identidad con la columna r reemplazada por B⁻¹aq), de modo que
+    Bₖ = B₀E₁…Eₖ.
+    """
+
+    def __init__(self, matrix: ConstraintMatrix, row_sign: np.ndarray, basis: np.ndarray,
+                 slack_coef: np.ndarray):
+        """
+        Args:
+            matrix: Matriz de restricciones original (m, n)
+            row_sign: Signo aplicado a cada fila en la forma estándar
+            basis: Variable básica de cada posición (ver _SimplexRun)
+            slack_coef: Coeficiente de la holgura de cada fila en la forma estándar
+
+        Raises:
+            SingularBasisError: Si la base es numéricamente singular
+        """
+        m, n = len(basis), matrix.shape[1]
+        self._m = m
+        self._row_sign = row_sign
+
+        is_unit = basis >= n
+        self._unit_positions = np.flatnonzero(is_unit)
+        self._unit_rows = (basis[is_unit] - n) % m
+        self._unit_coef = np.where(basis[is_unit] < n + m, slack_coef[self._unit_rows], 1.0)
+
+        self._struct_positions = np.flatnonzero(~is_unit)
+        covered = np.zeros(m, dtype=bool)
+        covered[self._unit_rows] = True
+        self._kernel_rows = np.flatnonzero(~covered)
+
+        if len(self._kernel_rows) != len(self._struct_positions) or np.any(self._unit_coef == 0):
+            raise SingularBasisError("Las columnas unitarias de la base no son independientes")
+
+        self._block = None
+        self._lu = None
+        if len(self._struct_positions):
+            self._block = matrix.columns(basis[self._struct_positions])
+            kernel = self._block.dense_rows(self._kernel_rows) * row_sign[self._kernel_rows, None]
+            self._lu = LUFactorization(kernel)
+
+        self._etas: List[Tuple[int, np.ndarray]] = []
+
+    @property
+    def num_updates(self) -> int:
+        return len(self._etas)
+
+    @property
+    def kernel_size(self) -> int:
+        """Dimensión del núcleo factorizado con LU"""
+        return len(self._struct_positions)
+
+    def ftran(self, a: np.ndarray) -> np.ndarray:
+        """Resuelve B x = a"""
+        x = np.zeros(self._m)
+        residual = np.array(a, dtype=np.float64)
+
+        if self._lu is not None:
+            x_struct = self._lu.solve(residual[self._kernel_rows])
+            x[self._struct_positions] = x_struct
+            residual -= self._row_sign * self._block.matvec(x_struct)
+        x[self._unit_positions] = residual[self._unit_rows] / self._unit_coef
+
+        for r, w in self._etas:
+            x_r = x[r] / w[r]
+            x -= x_r * w
+            x[r] = x_r
+        return x
+
+    def btran(self, c: np.ndarray) -> np.ndarray:
+        """Resuelve Bᵀ y = c"""
+        v = np.array(c, dtype=np.float64)
+        for r, w in reversed(self._etas):
+            v[r] = (v[r] - (w @ v - w[r] * v[r])) / w[r]
+
+        y = np.zeros(self._m)
+        y[self._unit_rows] = v[self._unit_positions] / self._unit_coef
+        if self._lu is not None:
+            rhs = v[self._struct_positions] - self._block.rmatvec(self._row_sign * y)
+            y[self._kernel_rows] = self._lu.solve_transpose(rhs)
+        return y
+
+    def update(self, r: int, w: np.ndarray):
+        """
+        Registra el cambio de base en la posición r.
+
+        Args:
+            r: Posición de la variable que sale
+            w: Columna entrante ya transformada (B⁻¹aq)
+        """
+        self._etas.append((r, np.array(w, dtype=np.float64)))
+
+
+class RevisedSimplexSolver:
+    """
+    Resuelve problemas de n variables con el método simplex revisado en dos fases.
+
+    Las variables de holgura y artificiales no se materializan en la matriz:
+    sus columnas son vectores unitarios que se manejan por separado.
+    """
+
+    def __init__(self, pricing: PricingRule = PricingRule.ARISTA_MAS_PRONUNCIADA,
+                 tolerance: float = 1e-9, max_iterations: Optional[int] = None,
+                 refactor_interval: int = DEFAULT_REFACTOR_INTERVAL):
+        """
+        Args:
+            pricing: Regla de selección de la variable entrante
+            tolerance: Tolerancia de optimalidad y factibilidad
+            max_iterations: Máximo de iteraciones (por defecto, 50·(m + n))
+            refactor_interval: Actualizaciones eta antes de refactorizar la base
+        """
+        self.pricing = pricing
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.refactor_interval = refactor_interval
+
+    def solve(self, problem: Union[GeneralProblem, LinearProgrammingProblem]) -> GeneralSolution:
+        """
+        Resuelve el problema.
+
+        Args:
+            problem: Problema de n variables, o de 2 variables (se convierte)
+
+        Returns:
+            GeneralSolution: Estado, punto óptimo, precios sombra y holguras
+        """
+        if isinstance(problem, LinearProgrammingProblem):
+            problem = GeneralProblem.from_problem(problem)
+        return _SimplexRun(problem, self).run()
+
+
+class _SimplexRun:
+    """
+    Estado de una resolución.
+
+    Índices de variables: 0..n-1 estructurales, n+r holgura de la fila r y
+    n+m+r artificial de la fila r. Las filas con b < 0 se multiplican por -1.
+    """
+
+    def __init__(self, problem: GeneralProblem, options: RevisedSimplexSolver):
+        self.problem = problem
+        self.options = options
+        self.tol = options.tolerance
+
+        m, n = problem.num_constraints, problem.num_variables
+        self.m, self.n = m, n
+        self.matrix = problem.matrix
+        self.max_iterations = options.max_iterations or 50 * (m + n) + 100
+        self.iterations = 0
+
+        codes = problem.codes
+        self.row_sign = np.where(problem.b < 0, -1.0, 1.0)
+        self.b = problem.b * self.row_sign
+        self.slack_coef = np.where(codes == _CODE_LE, 1.0, np.where(codes == _CODE_GE, -1.0, 0.0)) * self.row_sign
+
+        # Minimizar internamente
+        self.sense = 1.0 if problem.optimization_type == OptimizationType.MINIMIZAR else -1.0
+
+        # Variables que pueden entrar: estructurales y holguras de desigualdades
+        self.eligible = np.concatenate((np.ones(n, dtype=bool), self.slack_coef != 0, np.zeros(m, dtype=bool)))
+
+        # Base inicial: holgura con coeficiente +1 o artificial
+        rows = np.arange(m)
+        self.basis = np.where(self.slack_coef > 0, n + rows, n + m + rows)
+        self.is_basic = np.zeros(n + 2 * m, dtype=bool)
+        self.is_basic[self.basis] = True
+        self.factor = BasisFactorization(self.matrix, self.row_sign, self.basis, self.slack_coef)
+        self.x_B = self.b.copy()
+
+        # Pesos de steepest edge: ‖B⁻¹aj‖² + 1 con la base identidad inicial
+        self.weights = np.ones(n + 2 * m)
+        self.weights[:n] += self.matrix.column_norms_squared()
+        self.weights[n:] += np.concatenate((self.slack_coef ** 2, np.ones(m)))
+
+    # --- Columnas de la forma estándar ---
+
+    def _column(self, j: int) -> np.ndarray:
+        """Columna de la variable j en la forma estándar"""
+        if j < self.n:
+            return self.matrix.column(j) * self.row_sign
+        column = np.zeros(self.m)
+        r = (j - self.n) % self.m
+        column[r] = self.slack_coef[r] if j < self.n + self.m else 1.0
+        return column
+
+    def _unit(self, r: int) -> np.ndarray:
+        """Vector unitario eᵣ"""
+        unit = np.zeros(self.m)
+        unit[r] = 1.0
+        return unit
+
+    def _row_products(self, y: np.ndarray) -> np.ndarray:
+        """Productos aⱼ·y de todas las columnas (estructurales, holguras y artificiales)"""
+        structural = self.matrix.rmatvec(y * self.row_sign)
+        return np.concatenate((structural, self.slack_coef * y, y))
+
+    # --- Mantenimiento de la base ---
+
+    def _refactor(self):
+        """Refactoriza la base y recalcula x_B para eliminar el error acumulado"""
+        self.factor = BasisFactorization(self.matrix, self.row_sign, self.basis, self.slack_coef)
+        self.x_B = self.factor.ftran(self.b)
+        self.x_B[np.abs(self.x_B) < self.tol * 1e-3] = 0.0
+
+    def _pivot(self, q: int, r: int, w: np.ndarray, theta: float):
+        """Ingresa la variable q en la posición r de la base"""
+        self.x_B -= theta * w
+        self.x_B[r] = theta
+        np.maximum(self.x_B, 0.0, out=self.x_B)
+
+        leaving = self.basis[r]
+        self.is_basic[leaving] = False
+        self.is_basic[q] = True
+        self.basis[r] = q
+
+        if self.factor.num_updates >= self.options.refactor_interval:
+            self._refactor()
+        else:
+            self.factor.update(r, w)
+
+    def _update_weights(self, q: int, r: int, w: np.ndarray, leaving: int):
+        """Actualización de Goldfarb-Reid de los pesos de steepest edge"""
+        rho = self.factor.btran(self._unit(r))
+        alpha = self._row_products(rho)
+        tau = self._row_products(self.factor.btran(w))
+
+        # El peso de la columna entrante se conoce exactamente: 1 + ‖B⁻¹aq‖²
+        gamma_q = float(w @ w) + 1.0
+        nonbasic = ~self.is_basic
+        ratio = alpha[nonbasic] / w[r]
+        updated = self.weights[nonbasic] - 2.0 * ratio * tau[nonbasic] + ratio ** 2 * gamma_q
+        self.weights[nonbasic] = np.maximum(updated, 1.0 + ratio ** 2)
+        self.weights[leaving] = max(gamma_q / w[r] ** 2, 1.0)
+
+    # --- Iteraciones ---
+
+    def _choose_entering(self, reduced: np.ndarray, candidates: np.ndarray, use_bland: bool) -> int:
+        """Elige la variable entrante entre los candidatos con costo reducido negativo"""
+        if use_bland or self.options.pricing == PricingRule.BLAND:
+            return int(candidates[0])
+        if self.options.pricing == PricingRule.DANTZIG:
+            return int(candidates[np.argmin(reduced[candidates])])
+        score = reduced[candidates] ** 2 / self.weights[candidates]
+        return int(candidates[np.argmax(score)])
+
+    def _ratio_test(self, w: np.ndarray, use_bland: bool) -> Optional[int]:
+        """
+        Prueba de razón de Harris en dos pasadas.
+
+        La primera calcula el paso máximo admitiendo una infactibilidad de
+        tolerance; la segunda elige, entre las filas que bloquean antes de ese
+        paso, la de pivote más grande (o la de menor índice con Bland).
+
+        Returns:
+            int: Posición de la variable que sale, o None si la dirección no está acotada
+        """
+        pivot_tolerance = max(self.tol, PIVOT_TOLERANCE * float(np.max(np.abs(w), initial=0.0)))
+        rows = np.flatnonzero(w > pivot_tolerance)
+        if len(rows) == 0:
+            return None
+
+        x_rows, w_rows = self.x_B[rows], w[rows]
+        theta_max = np.min((x_rows + self.tol) / w_rows)
+        ties = rows[x_rows / w_rows <= theta_max]
+        if use_bland:
+            return int(ties[np.argmin(self.basis[ties])])
+        return int(ties[np.argmax(w[ties])])
+
+    def _iterate(self, cost: np.ndarray) -> SolutionStatus:
+        """Ejecuta iteraciones simplex con el vector de costos dado hasta terminar"""
+        degenerate = 0
+
+        while self.iterations < self.max_iterations:
+            y = self.factor.btran(cost[self.basis])
+            reduced = cost - self._row_products(y)
+
+            scale = max(1.0, float(np.max(np.abs(cost), initial=0.0)))
+            candidates = np.flatnonzero(self.eligible & ~self.is_basic & (reduced < -self.tol * scale))
+            if len(candidates) == 0:
+                return SolutionStatus.OPTIMA
+
+            use_bland = degenerate >= DEGENERATE_PIVOT_LIMIT
+            q = self._choose_entering(reduced, candidates, use_bland)
+            w = self.factor.ftran(self._column(q))
+
+            r = self._ratio_test(w, use_bland)
+            if r is None:
+                return SolutionStatus.NO_ACOTADA
+
+            theta = self.x_B[r] / w[r]
+            degenerate = degenerate + 1 if theta <= self.tol else 0
+            leaving = self.basis[r]
+
+            if self.options.pricing == PricingRule.ARISTA_MAS_PRONUNCIADA:
+                self._update_weights(q, r, w, leaving)
+            self._pivot(q, r, w, max(theta, 0.0))
+            self.iterations += 1
+
+        return SolutionStatus.LIMITE_ITERACIONES
+
+    def _drive_out_artificials(self):
+        """Saca de la base las artificiales que quedaron en cero tras la fase I"""
+        artificial_start = self.n + self.m
+        for r in np.flatnonzero(self.basis >= artificial_start):
+            rho = self.factor.btran(self._unit(r))
+            alpha = self._row_products(rho)
+            alpha[~self.eligible | self.is_basic] = 0.0
+
+            q = int(np.argmax(np.abs(alpha)))
+            if abs(alpha[q]) <= self.tol:
+                # Fila redundante: la artificial queda en cero para siempre
+                continue
+            w = self.factor.ftran(self._column(q))
+            self._pivot(q, int(r), w, 0.0)
+
+    def run(self) -> GeneralSolution:
+        """Ejecuta las dos fases y construye la solución"""
+        problem = self.problem
+        m, n = self.m, self.n
+
+        if np.any(self.basis >= n + m):
+            cost = np.zeros(n + 2 * m)
+            cost[n + m:] = 1.0
+            status = self._iterate(cost)
+            if status == SolutionStatus.LIMITE_ITERACIONES:
+                return GeneralSolution(problem, status, iterations=self.iterations)
+
+            infeasibility = float(np.sum(self.x_B[self.basis >= n + m]))
+            if infeasibility > self.tol * max(1.0, float(np.max(np.abs(self.b), initial=0.0))):
+                return GeneralSolution(problem, SolutionStatus.INFACTIBLE, iterations=self.iterations)
+            self._drive_out_artificials()
+
+        cost = np.zeros(n + 2 * m)
+        cost[:n] = self.sense * problem.c
+        status = self._iterate(cost)
+        if status != SolutionStatus.OPTIMA:
+            return GeneralSolution(problem, status, iterations=self.iterations)
+
+        self._refactor()
+        x = np.zeros(n + 2 * m)
+        x[self.basis] = self.x_B
+        point = x[:n]
+
+        y = self.factor.btran(cost[self.basis])
+        values = problem.constraint_values(point)
+        codes = problem.codes
+        slacks = np.where(codes == _CODE_LE, problem.b - values,
+                          np.where(codes == _CODE_GE, values - problem.b, np.abs(values - problem.b)))
+
+        return GeneralSolution(
+            problem=problem,
+            status=SolutionStatus.OPTIMA,
+            optimal_point=point,
+            optimal_value=problem.evaluate(point),
+            shadow_prices=self.sense * y * self.row_sign,
+            slacks=slacks,
+            iterations=self.iterations,
+            basis=self.basis.tolist()
+        )
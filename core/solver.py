@@ -2,46 +2,136 @@
 Solver para problemas de programación lineal de 2 variables.
 Implementa el método gráfico para encontrar la solución óptima.
 """
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 from itertools import combinations
+import time
 import numpy as np
 
 from .models import (
-    LinearProgrammingProblem, Point, Solution, VertexEvaluation,
-    Constraint, InequalityType, OptimizationType
+    LinearProgrammingProblem, Point, Solution, VertexEvaluation, SolveStats,
+    Constraint, InequalityType, OptimizationType, SolveMethod, SensitivityReport,
+    PHASE_PRESOLVE, PHASE_HALF_PLANES, PHASE_INTERSECTIONS, PHASE_FEASIBILITY,
+    PHASE_EVALUATION, PHASE_OPTIMUM, PHASE_SENSITIVITY
 )
+from .halfplane import ConvexPolygon, build_feasible_polygon, polygon_finite_vertices
+from .spatial import deduplicate_points
+from .presolve import presolve
+from .sensitivity import analyze_sensitivity
+from .branch_bound import BranchAndBoundSolver
+from .exact import exact_pairwise_intersections, exact_feasibility_mask
+from .batch import ProblemBatch, BatchSolution, solve_many
+from .vectorized import (
+    INEQUALITY_CODES, DEFAULT_MAX_PAIRS_PER_CHUNK, DEFAULT_MAX_CELLS_PER_CHUNK,
+    constraints_to_arrays, pairwise_intersections, feasibility_mask
+)
+
+
+class SolveCancelled(Exception):
+    """Se interrumpió la resolución desde el callback de progreso"""
 
 
 class LinearProgrammingSolver:
     """Resuelve problemas de programación lineal de 2 variables usando método gráfico"""
     
-    def __init__(self, tolerance: float = 1e-10):
+    def __init__(self, tolerance: float = 1e-10, vectorize_threshold: int = 32,
+                 method: SolveMethod = SolveMethod.ENUMERACION, presolve: bool = False,
+                 exact: bool = False, collect_stats: bool = False,
+                 progress: Optional[Callable[[str, float], None]] = None):
+        """
+        Args:
+            tolerance: Tolerancia numérica para determinantes y factibilidad
+            vectorize_threshold: Número de restricciones a partir del cual se
+                usa el motor vectorizado de NumPy para las intersecciones
+            method: Algoritmo para construir la región factible
+            presolve: Si es True, elimina restricciones duplicadas, dominadas y
+                redundantes antes de calcular intersecciones
+            exact: Si es True, decide el paralelismo de las rectas y la
+                factibilidad de los vértices con predicados exactos (ver
+                core.exact) en lugar de la tolerancia absoluta; siempre usa
+                enumeración, ya que los semiplanos se recortan con tolerancia
+            collect_stats: Si es True, cada solución incluye en Solution.stats
+                los tiempos por fase y los contadores de la resolución
+            progress: Función llamada al comenzar cada fase y antes de cada
+                bloque de las fases largas con el nombre de la fase y la
+                fracción completada; si lanza SolveCancelled (o cualquier
+                otra excepción) la resolución se interrumpe en ese punto
+        """
         self.tolerance = tolerance
+        self.vectorize_threshold = vectorize_threshold
+        self.method = method
+        self.presolve = presolve
+        self.exact = exact
+        self.collect_stats = collect_stats
+        self.progress = progress
     
     def solve(self, problem: LinearProgrammingProblem) -> Solution:
         """
         Resuelve el problema de programación lineal completo.
         
+        Si alguna variable es entera se resuelve con ramificación y acotamiento
+        (ver core.branch_bound) sobre la relajación lineal.
+        
         Args:
             problem: Problema de programación lineal a resolver
             
         Returns:
             Solution: Solución completa del problema
         """
+        if problem.has_integer_variables():
+            return BranchAndBoundSolver(self).solve(problem)
+        return self.solve_relaxation(problem)
+    
+    def solve_relaxation(self, problem: LinearProgrammingProblem) -> Solution:
+        """
+        Resuelve el problema ignorando la integralidad de las variables.
+        
+        Args:
+            problem: Problema de programación lineal a resolver
+            
+        Returns:
+            Solution: Solución de la relajación lineal
+        """
+        stats = SolveStats() if self.collect_stats else None
+        
         # Agregar restricciones de no negatividad
         problem.add_non_negativity_constraints()
         
-        # Calcular todas las intersecciones
-        intersection_points = self._calculate_intersections(problem.constraints)
+        # Presolve: trabajar solo con las restricciones que aportan a la región
+        constraints = problem.constraints
+        removed = []
+        if self.presolve:
+            reduced = self._timed(stats, PHASE_PRESOLVE, presolve, constraints, self.tolerance)
+            constraints, removed = reduced.constraints, reduced.removed
+        
+        if self.method == SolveMethod.SEMIPLANOS and not self.exact:
+            solution = self._solve_half_planes(problem, constraints, stats)
+            if solution is not None:
+                solution.presolve_removed = removed
+                return solution
+        
+        if self.exact:
+            intersection_points, feasible_vertices = self._calculate_exact_vertices(constraints, stats)
+        else:
+            # Calcular todas las intersecciones
+            intersection_points = self._timed(stats, PHASE_INTERSECTIONS,
+                                              self._calculate_intersections, constraints)
+            
+            # Encontrar vértices factibles
+            feasible_vertices = self._timed(stats, PHASE_FEASIBILITY, self._find_feasible_vertices,
+                                            intersection_points, constraints, stats)
         
-        # Encontrar vértices factibles
-        feasible_vertices = self._find_feasible_vertices(intersection_points, problem.constraints)
+        if stats is not None:
+            stats.pairs_examined = len(constraints) * (len(constraints) - 1) // 2
+            stats.parallel_pairs_skipped = stats.pairs_examined - len(intersection_points)
+            stats.points_tested = len(intersection_points)
         
         # Evaluar función objetivo en cada vértice
-        vertex_evaluations = self._evaluate_vertices(feasible_vertices, problem.objective_function)
+        vertex_evaluations = self._timed(stats, PHASE_EVALUATION, self._evaluate_vertices,
+                                         feasible_vertices, problem.objective_function)
         
         # Encontrar solución óptima
-        optimal_point, optimal_value = self._find_optimal_solution(vertex_evaluations, problem.objective_function)
+        optimal_point, optimal_value = self._timed(stats, PHASE_OPTIMUM, self._find_optimal_solution,
+                                                   vertex_evaluations, problem.objective_function)
         
         return Solution(
             problem=problem,
@@ -50,7 +140,111 @@ class LinearProgrammingSolver:
             vertex_evaluations=vertex_evaluations,
             optimal_point=optimal_point,
             optimal_value=optimal_value,
-            is_feasible=len(feasible_vertices) > 0
+            is_feasible=len(feasible_vertices) > 0,
+            presolve_removed=removed,
+            sensitivity=self._timed(stats, PHASE_SENSITIVITY, self._analyze_sensitivity, problem, optimal_point),
+            stats=stats
+        )
+    
+    def solve_many(self, batch: ProblemBatch) -> BatchSolution:
+        """
+        Resuelve un lote de problemas apilados en arrays con operaciones vectorizadas.
+        
+        Args:
+            batch: Lote de problemas (ver ProblemBatch.from_problems)
+            
+        Returns:
+            BatchSolution: Puntos y valores óptimos; las soluciones completas
+            se materializan bajo demanda con BatchSolution.solution(i)
+        """
+        return solve_many(batch, self.tolerance)
+    
+    def _timed(self, stats: Optional[SolveStats], phase: str, function, *args):
+        """
+        Ejecuta function(*args) y, si se están registrando estadísticas, acumula su duración.
+        
+        También informa el comienzo de la fase al callback de progreso.
+        
+        Args:
+            stats: Estadísticas de la resolución en curso, o None si están desactivadas
+            phase: Nombre de la fase (ver las constantes PHASE_* de core.models)
+            function: Función que implementa la fase
+            
+        Returns:
+            El resultado de function
+        """
+        if self.progress is not None:
+            self.progress(phase, 0.0)
+        if stats is None:
+            return function(*args)
+        start = time.perf_counter()
+        result = function(*args)
+        stats.add_time(phase, time.perf_counter() - start)
+        return result
+    
+    def _phase_progress(self, phase: str) -> Optional[Callable[[float], None]]:
+        """Adapta el callback de progreso a las funciones que avanzan por bloques"""
+        if self.progress is None:
+            return None
+        progress = self.progress
+        return lambda fraction: progress(phase, fraction)
+    
+    def _solve_half_planes(self, problem: LinearProgrammingProblem, constraints: List[Constraint],
+                           stats: Optional[SolveStats] = None) -> Optional[Solution]:
+        """
+        Resuelve construyendo el polígono factible por intersección de semiplanos en O(m log m).
+        
+        Los puntos de intersección reportados son únicamente los vértices del polígono.
+        
+        Args:
+            problem: Problema con las restricciones de no negatividad ya agregadas
+            constraints: Restricciones con las que se construye la región
+            stats: Estadísticas donde registrar tiempos y contadores (opcional)
+            
+        Returns:
+            Solution: Solución del problema, o None si el caso es demasiado
+            degenerado y debe resolverse por enumeración
+        """
+        polygon = self._timed(stats, PHASE_HALF_PLANES, build_feasible_polygon, constraints)
+        if polygon is None:
+            return None
+        
+        return self._solution_from_polygon(problem, polygon, stats)
+    
+    def _solution_from_polygon(self, problem: LinearProgrammingProblem, polygon: ConvexPolygon,
+                               stats: Optional[SolveStats] = None) -> Solution:
+        """
+        Construye la solución a partir del polígono factible ya calculado.
+        
+        Args:
+            problem: Problema resuelto
+            polygon: Región factible del problema
+            stats: Estadísticas donde registrar tiempos y contadores (opcional)
+            
+        Returns:
+            Solution: Solución con los vértices del polígono como puntos de intersección
+        """
+        # Los vértices degenerados aparecen repetidos
+        polygon_vertices = [Point(x1, x2) for x1, x2, _, _ in polygon_finite_vertices(polygon)]
+        feasible_vertices = deduplicate_points(polygon_vertices)
+        if stats is not None:
+            stats.duplicates_removed += len(polygon_vertices) - len(feasible_vertices)
+        
+        vertex_evaluations = self._timed(stats, PHASE_EVALUATION, self._evaluate_vertices,
+                                         feasible_vertices, problem.objective_function)
+        optimal_point, optimal_value = self._timed(stats, PHASE_OPTIMUM, self._find_optimal_solution,
+                                                   vertex_evaluations, problem.objective_function)
+        
+        return Solution(
+            problem=problem,
+            intersection_points=list(feasible_vertices),
+            feasible_vertices=feasible_vertices,
+            vertex_evaluations=vertex_evaluations,
+            optimal_point=optimal_point,
+            optimal_value=optimal_value,
+            is_feasible=len(feasible_vertices) > 0,
+            sensitivity=self._timed(stats, PHASE_SENSITIVITY, self._analyze_sensitivity, problem, optimal_point),
+            stats=stats
         )
     
     def _calculate_intersections(self, constraints: List[Constraint]) -> List[Point]:
@@ -63,6 +257,9 @@ class LinearProgrammingSolver:
         Returns:
             List[Point]: Lista de puntos de intersección
         """
+        if len(constraints) >= self.vectorize_threshold:
+            return self._calculate_intersections_vectorized(constraints)
+        
         intersection_points = []
         
         # Convertir restricciones a formato matricial para cálculo
@@ -76,6 +273,49 @@ class LinearProgrammingSolver:
         
         return intersection_points
     
+    def _calculate_intersections_vectorized(self, constraints: List[Constraint]) -> List[Point]:
+        """
+        Calcula todas las intersecciones con operaciones en bloque de NumPy.
+        
+        Solo se construyen objetos Point para los pares no paralelos.
+        
+        Args:
+            constraints: Lista de restricciones
+            
+        Returns:
+            List[Point]: Lista de puntos de intersección
+        """
+        A, b, _ = constraints_to_arrays(constraints)
+        _, _, x1, x2 = pairwise_intersections(A, b, self.tolerance,
+                                              progress=self._phase_progress(PHASE_INTERSECTIONS))
+        
+        return list(map(Point, x1.tolist(), x2.tolist()))
+    
+    def _calculate_exact_vertices(self, constraints: List[Constraint],
+                                  stats: Optional[SolveStats] = None) -> Tuple[List[Point], List[Point]]:
+        """
+        Calcula las intersecciones y los vértices factibles con predicados exactos.
+        
+        Args:
+            constraints: Lista de restricciones
+            stats: Estadísticas donde registrar tiempos y contadores (opcional)
+            
+        Returns:
+            Tuple[List[Point], List[Point]]: Puntos de intersección y vértices factibles
+        """
+        A, b, codes = constraints_to_arrays(constraints)
+        ii, jj, x1, x2 = self._timed(stats, PHASE_INTERSECTIONS, exact_pairwise_intersections, A, b,
+                                     DEFAULT_MAX_PAIRS_PER_CHUNK, self._phase_progress(PHASE_INTERSECTIONS))
+        mask = self._timed(stats, PHASE_FEASIBILITY, exact_feasibility_mask, A, b, codes, ii, jj,
+                           DEFAULT_MAX_CELLS_PER_CHUNK, self._phase_progress(PHASE_FEASIBILITY))
+        
+        intersection_points = list(map(Point, x1.tolist(), x2.tolist()))
+        candidates = np.flatnonzero(mask).tolist()
+        feasible_vertices = deduplicate_points(intersection_points[index] for index in candidates)
+        if stats is not None:
+            stats.duplicates_removed += len(candidates) - len(feasible_vertices)
+        return intersection_points, feasible_vertices
+    
     def _convert_constraints_to_matrix_form(self, constraints: List[Constraint]) -> List[Tuple[float, float, float]]:
         """
         Convierte restricciones a forma matricial [a1, a2, b] donde a1*x1 + a2*x2 = b
@@ -86,15 +326,11 @@ class LinearProgrammingSolver:
         Returns:
             List[Tuple]: Lista de coeficientes [a1, a2, b]
         """
-        matrix_form = []
-        
-        for constraint in constraints:
-            # Para intersecciones, tratamos todas como igualdades
-            # Si es ≥, convertimos multiplicando por -1
-            if constraint.inequality_type == InequalityType.MAYOR_IGUAL:
-                matrix_form.append((-constraint.a1, -constraint.a2, -constraint.b))
-            else:  # ≤ o =
-                matrix_form.append((constraint.a1, constraint.a2, constraint.b))
+        # Para intersecciones, tratamos todas como igualdades
+        # Si es ≥, convertimos multiplicando por -1
+        A, b, codes = constraints_to_arrays(constraints)
+        sign = np.where(codes == INEQUALITY_CODES[InequalityType.MAYOR_IGUAL], -1.0, 1.0)
+        matrix_form = list(zip((sign * A[:, 0]).tolist(), (sign * A[:, 1]).tolist(), (sign * b).tolist()))
         
         return matrix_form
     
@@ -127,43 +363,36 @@ class LinearProgrammingSolver:
         return Point(x1, x2)
     
     def _find_feasible_vertices(self, intersection_points: List[Point], 
-                               constraints: List[Constraint]) -> List[Point]:
+                               constraints: List[Constraint],
+                               stats: Optional[SolveStats] = None) -> List[Point]:
         """
         Filtra los puntos de intersección para encontrar solo los vértices factibles.
         
         Args:
             intersection_points: Todos los puntos de intersección
             constraints: Restricciones del problema
+            stats: Estadísticas donde registrar los duplicados descartados (opcional)
             
         Returns:
             List[Point]: Vértices que satisfacen todas las restricciones
         """
-        feasible_vertices = []
+        if not intersection_points:
+            return []
         
-        for point in intersection_points:
-            if self._is_point_feasible(point, constraints):
-                # Evitar duplicados con tolerancia
-                if not any(point == existing for existing in feasible_vertices):
-                    feasible_vertices.append(point)
+        # Evaluar todas las restricciones sobre todos los puntos como A @ X
+        A, b, codes = constraints_to_arrays(constraints)
+        x1 = np.fromiter((p.x1 for p in intersection_points), dtype=np.float64, count=len(intersection_points))
+        x2 = np.fromiter((p.x2 for p in intersection_points), dtype=np.float64, count=len(intersection_points))
+        mask = feasibility_mask(A, b, codes, x1, x2, self.tolerance,
+                                progress=self._phase_progress(PHASE_FEASIBILITY))
         
+        # Evitar duplicados con tolerancia
+        candidates = np.flatnonzero(mask).tolist()
+        feasible_vertices = deduplicate_points(intersection_points[index] for index in candidates)
+        if stats is not None:
+            stats.duplicates_removed += len(candidates) - len(feasible_vertices)
         return feasible_vertices
     
-    def _is_point_feasible(self, point: Point, constraints: List[Constraint]) -> bool:
-        """
-        Verifica si un punto satisface todas las restricciones.
-        
-        Args:
-            point: Punto a verificar
-            constraints: Lista de restricciones
-            
-        Returns:
-            bool: True si el punto es factible
-        """
-        for constraint in constraints:
-            if not constraint.is_satisfied(point.x1, point.x2, self.tolerance):
-                return False
-        return True
-    
     def _evaluate_vertices(self, vertices: List[Point], 
                           objective_function) -> List[VertexEvaluation]:
         """
@@ -211,31 +440,18 @@ class LinearProgrammingSolver:
         
         return best_evaluation.point, best_evaluation.objective_value
     
-    def get_constraint_line_points(self, constraint: Constraint, 
-                                 x_range: Tuple[float, float] = (0, 50),
-                                 num_points: int = 1000) -> Tuple[np.ndarray, np.ndarray]:
+    def _analyze_sensitivity(self, problem: LinearProgrammingProblem,
+                             optimal_point: Optional[Point]) -> Optional[SensitivityReport]:
         """
-        Obtiene puntos para graficar una línea de restricción.
+        Calcula el análisis de sensibilidad en el vértice óptimo.
         
         Args:
-            constraint: Restricción a graficar
-            x_range: Rango de valores X
-            num_points: Número de puntos a generar
+            problem: Problema resuelto
+            optimal_point: Punto óptimo encontrado
             
         Returns:
-            Tuple[np.ndarray, np.ndarray]: Arrays de coordenadas X e Y
-        """
-        x_values = np.linspace(x_range[0], x_range[1], num_points)
-        
-        if abs(constraint.a2) < self.tolerance:
-            # Línea vertical
-            if abs(constraint.a1) > self.tolerance:
-                x_line = constraint.b / constraint.a1
-                return np.full_like(x_values, x_line), x_values
-            else:
-                # Restricción degenerada
-                return x_values, np.zeros_like(x_values)
-        else:
-            # Línea normal: y = (b - a1*x) / a2
-            y_values = (constraint.b - constraint.a1 * x_values) / constraint.a2
-            return x_values, y_values
+            SensitivityReport: Análisis de sensibilidad, o None si no hay óptimo
+        """
+        if optimal_point is None:
+            return None
+        return analyze_sensitivity(problem, optimal_point)
@@ -0,0 +1,83 @@
+"""
+Índice espacial para comparar puntos con tolerancia en tiempo esperado O(1).
+"""
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .models import Point, POINT_TOLERANCE
+
+
+class PointGrid:
+    """
+    Rejilla hash de celdas de lado POINT_TOLERANCE.
+
+    Dos puntos iguales según Point.__eq__ difieren en menos de una celda por
+    coordenada, así que basta revisar la celda del punto y sus 8 vecinas.
+    """
+    
+    def __init__(self, tolerance: float = POINT_TOLERANCE):
+        self.tolerance = tolerance
+        self._cells: Dict[Tuple[int, int], List[Point]] = {}
+    
+    def _cell(self, point: Point) -> Tuple[int, int]:
+        """Calcula la celda que contiene un punto"""
+        return (math.floor(point.x1 / self.tolerance),
+                math.floor(point.x2 / self.tolerance))
+    
+    def find(self, point: Point) -> Optional[Point]:
+        """
+        Busca un punto almacenado igual (con tolerancia) al punto dado.
+        
+        Args:
+            point: Punto a buscar
+            
+        Returns:
+            Point: Punto almacenado equivalente o None si no existe
+        """
+        cx, cy = self._cell(point)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for existing in self._cells.get((cx + dx, cy + dy), ()):
+                    if existing == point:
+                        return existing
+        return None
+    
+    def add(self, point: Point) -> bool:
+        """
+        Agrega un punto si no existe uno equivalente.
+        
+        Args:
+            point: Punto a agregar
+            
+        Returns:
+            bool: True si el punto fue agregado
+        """
+        if self.find(point) is not None:
+            return False
+        self._cells.setdefault(self._cell(point), []).append(point)
+        return True
+    
+    def __contains__(self, point: Point) -> bool:
+        return self.find(point) is not None
+    
+    @classmethod
+    def from_points(cls, points: Iterable[Point]) -> "PointGrid":
+        """Construye una rejilla con todos los puntos dados (sin deduplicar)"""
+        grid = cls()
+        for point in points:
+            grid._cells.setdefault(grid._cell(point), []).append(point)
+        return grid
+
+
+def deduplicate_points(points: Iterable[Point]) -> List[Point]:
+    """
+    Elimina puntos repetidos (con tolerancia) conservando el orden de aparición.
+    
+    Args:
+        points: Puntos a deduplicar
+        
+    Returns:
+        List[Point]: Primer representante de cada grupo de puntos iguales
+    """
+    grid = PointGrid()
+    return [point for point in points if grid.add(point)]
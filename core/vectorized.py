@@ -0,0 +1,190 @@
+"""
+Motor vectorizado (NumPy) para el método gráfico.
+Calcula en bloque las intersecciones entre todos los pares de restricciones.
+"""
+from typing import Callable, List, Optional, Tuple
+import numpy as np
+
+from .models import Constraint, ConstraintSet, InequalityType, INEQUALITY_CODES
+
+# Número máximo de pares procesados por bloque (acota la memoria usada)
+DEFAULT_MAX_PAIRS_PER_CHUNK = 1 << 20
+
+
+def constraints_to_arrays(constraints: List[Constraint]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convierte una lista de restricciones a arrays contiguos.
+
+    Una ConstraintSet ya guarda sus restricciones así: se devuelven sus
+    arrays sin copiarlos (vistas de solo lectura).
+
+    Args:
+        constraints: Lista de restricciones o ConstraintSet
+
+    Returns:
+        Tuple: Matriz de coeficientes A (m, 2), vector b (m,) y códigos de desigualdad (m,)
+    """
+    if isinstance(constraints, ConstraintSet):
+        return constraints.to_arrays()
+
+    m = len(constraints)
+    A = np.empty((m, 2), dtype=np.float64)
+    b = np.empty(m, dtype=np.float64)
+    codes = np.empty(m, dtype=np.int8)
+
+    for k, constraint in enumerate(constraints):
+        A[k, 0] = constraint.a1
+        A[k, 1] = constraint.a2
+        b[k] = constraint.b
+        codes[k] = INEQUALITY_CODES[constraint.inequality_type]
+
+    return A, b, codes
+
+
+def pairwise_intersections(A: np.ndarray, b: np.ndarray, tolerance: float,
+                           max_pairs_per_chunk: int = DEFAULT_MAX_PAIRS_PER_CHUNK,
+                           progress: Optional[Callable[[float], None]] = None
+                           ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calcula las intersecciones de todos los pares (i, j) con i < j mediante la
+    regla de Cramer aplicada en bloque.
+
+    Los pares se recorren en el mismo orden que itertools.combinations y se
+    descartan los pares paralelos (|det| < tolerance).
+
+    Args:
+        A: Matriz de coeficientes (m, 2)
+        b: Vector de términos independientes (m,)
+        tolerance: Tolerancia para considerar un determinante nulo
+        max_pairs_per_chunk: Máximo de pares evaluados en cada bloque
+        progress: Función llamada antes de cada bloque con la fracción de
+            filas procesadas (puede lanzar una excepción para interrumpir)
+
+    Returns:
+        Tuple: Índices i, índices j, coordenadas X1 y coordenadas X2 de cada intersección
+    """
+    m = A.shape[0]
+    a1, a2 = A[:, 0], A[:, 1]
+
+    rows_per_chunk = max(1, max_pairs_per_chunk // max(m, 1))
+
+    parts_i, parts_j, parts_x1, parts_x2 = [], [], [], []
+
+    for start in range(0, max(m - 1, 0), rows_per_chunk):
+        if progress is not None:
+            progress(start / (m - 1))
+        stop = min(start + rows_per_chunk, m - 1)
+
+        # Pares (i, j) del bloque con j > i, en orden de filas
+        block_i = np.arange(start, stop)
+        ii, jj = np.nonzero(block_i[:, None] < np.arange(m)[None, :])
+        ii = block_i[ii]
+
+        det = a1[ii] * a2[jj] - a1[jj] * a2[ii]
+        valid = np.abs(det) >= tolerance
+        ii, jj, det = ii[valid], jj[valid], det[valid]
+
+        # Regla de Cramer
+        x1 = (b[ii] * a2[jj] - b[jj] * a2[ii]) / det
+        x2 = (a1[ii] * b[jj] - a1[jj] * b[ii]) / det
+
+        parts_i.append(ii)
+        parts_j.append(jj)
+        parts_x1.append(x1)
+        parts_x2.append(x2)
+
+    if not parts_i:
+        empty_int = np.empty(0, dtype=np.intp)
+        empty_float = np.empty(0, dtype=np.float64)
+        return empty_int, empty_int.copy(), empty_float, empty_float.copy()
+
+    return (np.concatenate(parts_i), np.concatenate(parts_j),
+            np.concatenate(parts_x1), np.concatenate(parts_x2))
+
+
+# Máximo de celdas (restricciones x puntos) evaluadas por bloque de factibilidad
+DEFAULT_MAX_CELLS_PER_CHUNK = 1 << 22
+
+# Restricciones evaluadas a la vez antes de descartar puntos infactibles
+DEFAULT_CONSTRAINTS_PER_BLOCK = 16
+
+
+def constraint_bounds(b: np.ndarray, codes: np.ndarray, tolerance: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Precalcula las cotas inferior y superior de cada restricción.
+
+    Con ellas todas las desigualdades se verifican como lower <= A @ x <= upper:
+    ≤ usa (-inf, b + tol], ≥ usa [b - tol, inf) e = usa [b - tol, b + tol].
+
+    Args:
+        b: Vector de términos independientes (m,)
+        codes: Códigos de desigualdad (m,)
+        tolerance: Tolerancia de factibilidad
+
+    Returns:
+        Tuple: Cotas inferiores y superiores (m,)
+    """
+    code_le = INEQUALITY_CODES[InequalityType.MENOR_IGUAL]
+    code_ge = INEQUALITY_CODES[InequalityType.MAYOR_IGUAL]
+
+    lower = np.where(codes == code_le, -np.inf, b - tolerance)
+    upper = np.where(codes == code_ge, np.inf, b + tolerance)
+    return lower, upper
+
+
+def feasibility_mask(A: np.ndarray, b: np.ndarray, codes: np.ndarray,
+                     x1: np.ndarray, x2: np.ndarray, tolerance: float,
+                     max_cells_per_chunk: int = DEFAULT_MAX_CELLS_PER_CHUNK,
+                     progress: Optional[Callable[[float], None]] = None) -> np.ndarray:
+    """
+    Determina qué puntos satisfacen todas las restricciones evaluando A @ X por bloques.
+
+    Args:
+        A: Matriz de coeficientes (m, 2)
+        b: Vector de términos independientes (m,)
+        codes: Códigos de desigualdad (m,)
+        x1: Coordenadas X1 de los puntos (n,)
+        x2: Coordenadas X2 de los puntos (n,)
+        tolerance: Tolerancia de factibilidad
+        max_cells_per_chunk: Máximo de evaluaciones restricción-punto por bloque
+        progress: Función llamada antes de cada bloque con la fracción de
+            puntos procesados (puede lanzar una excepción para interrumpir)
+
+    Returns:
+        np.ndarray: Máscara booleana (n,) con True para los puntos factibles
+    """
+    m = A.shape[0]
+    n = x1.shape[0]
+    mask = np.ones(n, dtype=bool)
+
+    if m == 0 or n == 0:
+        return mask
+
+    lower, upper = constraint_bounds(b, codes, tolerance)
+    lower, upper = lower[:, None], upper[:, None]
+
+    rows_per_block = min(m, DEFAULT_CONSTRAINTS_PER_BLOCK)
+    points_per_chunk = max(1, max_cells_per_chunk // rows_per_block)
+
+    for start in range(0, n, points_per_chunk):
+        if progress is not None:
+            progress(start / n)
+        stop = min(start + points_per_chunk, n)
+        X = np.vstack((x1[start:stop], x2[start:stop]))
+
+        # Evaluar por bloques de restricciones descartando los puntos que ya
+        # fallaron, de modo que los puntos infactibles salen temprano
+        alive = np.arange(stop - start)
+        for row in range(0, m, rows_per_block):
+            block = slice(row, row + rows_per_block)
+            values = A[block] @ X[:, alive]
+            ok = np.all((values >= lower[block]) & (values <= upper[block]), axis=0)
+            alive = alive[ok]
+            if alive.size == 0:
+                break
+
+        chunk_mask = np.zeros(stop - start, dtype=bool)
+        chunk_mask[alive] = True
+        mask[start:stop] = chunk_mask
+
+    return mask
@@ -0,0 +1,132 @@
+"""
+Geometría de la ventana de graficación [0, x_max] x [0, y_max].
+Recorta las rectas de las restricciones analíticamente (dos extremos por
+recta) y construye el polígono de la región factible visible, de modo que
+el gráfico no necesita muestrear cada recta en miles de puntos.
+"""
+from typing import List, Tuple
+import numpy as np
+
+from .models import Constraint, Point
+from .vectorized import constraints_to_arrays, feasibility_mask, DEFAULT_MAX_CELLS_PER_CHUNK
+from .halfplane import polygon_tolerances
+
+
+def clip_lines_to_box(A: np.ndarray, b: np.ndarray, x_max: float, y_max: float
+                      ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Recorta las rectas a₁·x + a₂·y = b a la caja [0, x_max] x [0, y_max] (Liang–Barsky).
+
+    Cada recta se parametriza como p + t·d, con p el punto más cercano al
+    origen y d = (−a₂, a₁), y se acota t con las cuatro paredes de la caja.
+
+    Args:
+        A: Matriz de coeficientes (m, 2)
+        b: Vector de términos independientes (m,)
+        x_max, y_max: Esquina superior derecha de la caja
+
+    Returns:
+        Tuple: Coordenadas x0, y0, x1, y1 de los extremos de cada segmento y
+        una máscara con las rectas que atraviesan la caja
+    """
+    a1, a2 = A[:, 0], A[:, 1]
+    norm2 = a1 * a1 + a2 * a2
+    valid = norm2 > 0.0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        px, py = a1 * b / norm2, a2 * b / norm2
+        dx, dy = -a2, a1
+
+        t0 = np.full(len(b), -np.inf)
+        t1 = np.full(len(b), np.inf)
+        for p, d, high in ((px, dx, x_max), (py, dy, y_max)):
+            moving = d != 0.0
+            ta, tb = -p / d, (high - p) / d
+            t0 = np.where(moving, np.maximum(t0, np.minimum(ta, tb)), t0)
+            t1 = np.where(moving, np.minimum(t1, np.maximum(ta, tb)), t1)
+            # Una recta paralela a esta pared solo cruza la caja si está entre sus lados
+            valid &= moving | ((p >= 0.0) & (p <= high))
+        valid &= t1 > t0
+
+        return px + t0 * dx, py + t0 * dy, px + t1 * dx, py + t1 * dy, valid
+
+
+def feasible_region_in_box(constraints: List[Constraint], vertices: List[Point],
+                           x_max: float, y_max: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Polígono ordenado de la parte de la región factible dentro de la caja.
+
+    Sus vértices son los vértices factibles que caen en la caja, las
+    esquinas de la caja que cumplen todas las restricciones y los extremos
+    factibles de las rectas recortadas (donde un lado de la región cruza el
+    borde de la caja); esto incluye la parte visible de las regiones no
+    acotadas. Como el polígono es convexo, basta ordenarlos por ángulo
+    alrededor de su centroide.
+
+    Args:
+        constraints: Restricciones del problema (con la no negatividad)
+        vertices: Vértices factibles de la solución
+        x_max, y_max: Esquina superior derecha de la caja
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Coordenadas X1 y X2 en orden
+        antihorario; vacías si la región no tiene vértices
+    """
+    if not vertices:
+        return np.empty(0), np.empty(0)
+
+    A, b, codes = constraints_to_arrays(constraints)
+    eps, _ = polygon_tolerances(constraints)
+
+    vx = np.fromiter((v.x1 for v in vertices), dtype=np.float64, count=len(vertices))
+    vy = np.fromiter((v.x2 for v in vertices), dtype=np.float64, count=len(vertices))
+    inside = (vx >= -eps) & (vx <= x_max + eps) & (vy >= -eps) & (vy <= y_max + eps)
+
+    x0, y0, x1, y1, crossing = clip_lines_to_box(A, b, x_max, y_max)
+    px = np.concatenate((vx[inside], x0[crossing], x1[crossing], [0.0, x_max, x_max, 0.0]))
+    py = np.concatenate((vy[inside], y0[crossing], y1[crossing], [0.0, 0.0, y_max, y_max]))
+
+    feasible = feasibility_mask(A, b, codes, px, py, eps)
+    px, py = px[feasible], py[feasible]
+    if len(px) == 0:
+        return px, py
+
+    order = np.argsort(np.arctan2(py - py.mean(), px - px.mean()), kind="stable")
+    return px[order], py[order]
+
+
+def active_constraints(constraints: List[Constraint], vertices: List[Point],
+                       max_cells_per_chunk: int = DEFAULT_MAX_CELLS_PER_CHUNK) -> np.ndarray:
+    """
+    Restricciones cuya recta pasa por algún vértice factible (los lados de la región).
+
+    Una recta está activa en un vértice si su distancia a él no supera la
+    tolerancia de polygon_tolerances. Los vértices se recorren por bloques
+    para acotar la memoria con miles de restricciones.
+
+    Args:
+        constraints: Restricciones del problema
+        vertices: Vértices factibles de la solución
+        max_cells_per_chunk: Máximo de celdas (restricción, vértice) evaluadas por bloque
+
+    Returns:
+        np.ndarray: Máscara booleana (m,) con las restricciones activas
+    """
+    A, b, _ = constraints_to_arrays(constraints)
+    m = len(b)
+    mask = np.zeros(m, dtype=bool)
+    if m == 0 or not vertices:
+        return mask
+
+    eps, _ = polygon_tolerances(constraints)
+    norm = np.hypot(A[:, 0], A[:, 1])
+    tolerance = np.where(norm > 0.0, eps * norm, -1.0)
+    vx = np.fromiter((v.x1 for v in vertices), dtype=np.float64, count=len(vertices))
+    vy = np.fromiter((v.x2 for v in vertices), dtype=np.float64, count=len(vertices))
+
+    vertices_per_chunk = max(1, max_cells_per_chunk // m)
+    for start in range(0, len(vx), vertices_per_chunk):
+        bx, by = vx[start:start + vertices_per_chunk], vy[start:start + vertices_per_chunk]
+        residual = np.abs(A[:, :1] * bx[None, :] + A[:, 1:] * by[None, :] - b[:, None])
+        mask |= (residual <= tolerance[:, None]).any(axis=1)
+    return mask
@@ -6,11 +6,34 @@ import tkinter as tk
 from tkinter import ttk
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch, Polygon
 import numpy as np
-from typing import Optional
+from operator import attrgetter
+from typing import Dict, Optional, Tuple
 
-from core.models import Solution, InequalityType
-from core.solver import LinearProgrammingSolver
+from core.models import Solution
+from core.spatial import PointGrid
+from core.viewport import active_constraints, clip_lines_to_box, feasible_region_in_box
+
+
+# Nivel de detalle: con más restricciones graficadas que este umbral se
+# dibujan en dos LineCollection en lugar de una línea por restricción: las
+# activas en algún vértice factible (lados de la región) en color y el resto
+# atenuadas, sin entradas propias en la leyenda
+LOD_CONSTRAINT_THRESHOLD = 50
+
+# Máximo de restricciones en la leyenda (primero las activas en el óptimo)
+MAX_LEGEND_CONSTRAINTS = 15
+
+# Con más intersecciones que este número se grafica su densidad en una grilla
+# de DENSITY_BINS x DENSITY_BINS celdas en lugar de un punto por intersección
+MAX_SCATTER_POINTS = 2000
+DENSITY_BINS = 100
+
+# Con más vértices factibles que este número no se etiquetan sus coordenadas
+MAX_VERTEX_LABELS = 30
 
 
 class GraphPanel:
@@ -19,10 +42,21 @@ class GraphPanel:
     def __init__(self, parent: tk.Widget):
         self.parent = parent
         self.current_solution: Optional[Solution] = None
-        self.solver = LinearProgrammingSolver()
         
-        # Configuración de colores para las restricciones
+        # Artistas persistentes del gráfico (ver _plot_solution): los de cada
+        # restricción por su posición en el problema, y los de puntos,
+        # óptimo y función objetivo por nombre
+        self._artists: Optional[dict] = None
+        self._constraint_artists: Dict[int, Line2D] = {}
+        self._emphasized_colors: Dict[int, tuple] = {}
+        self._vertex_annotations: list = []
+        self._constraints_key: Optional[tuple] = None
+        self._plot_limits = (50.0, 50.0)
+        
+        # Configuración de colores para las restricciones (la paleta amplia se
+        # usa en el modo de nivel de detalle, donde puede haber más líneas)
         self.constraint_colors = ['red', 'blue', 'green', 'orange', 'purple', 'brown', 'pink', 'gray']
+        self.lod_colors = list(plt.cm.tab20.colors)
         
         self._setup_ui()
     
@@ -54,6 +88,11 @@ class GraphPanel:
     def _setup_initial_plot(self):
         """Configura el gráfico inicial vacío"""
         self.ax.clear()
+        self._artists = None
+        self._constraint_artists = {}
+        self._emphasized_colors = {}
+        self._vertex_annotations = []
+        self._constraints_key = None
         self.ax.set_xlim(0, 50)
         self.ax.set_ylim(0, 50)
         self.ax.set_xlabel('X₁', fontsize=12)
@@ -113,47 +152,154 @@ class GraphPanel:
         self._display_text_results()
     
     def _plot_solution(self):
-        """Genera el gráfico de la solución"""
+        """
+        Actualiza el gráfico con la solución actual.
+        
+        Los artistas se crean una sola vez y se actualizan con set_data,
+        set_offsets y set_xy; solo se agregan o quitan artistas cuando
+        aparecen o desaparecen restricciones, y únicamente en ese caso se
+        recalcula el layout de la figura.
+        """
         if not self.current_solution:
             return
         
         solution = self.current_solution
-        self.ax.clear()
-        
-        # Determinar límites del gráfico
-        x_max, y_max = self._calculate_plot_limits()
-        x_range = np.linspace(0, x_max, 1000)
-        
-        # Graficar restricciones
-        self._plot_constraints(x_range, x_max, y_max)
-        
-        # Graficar puntos de intersección
-        self._plot_intersection_points()
-        
-        # Graficar vértices factibles
-        self._plot_feasible_vertices()
+        relayout = self._artists is None
+        if relayout:
+            self._create_artists()
+        
+        # Con las mismas restricciones la región, los vértices y los límites
+        # no cambian (por ejemplo, al editar solo la función objetivo)
+        constraints_key = self._get_constraints_key(solution)
+        if constraints_key != self._constraints_key:
+            self._constraints_key = constraints_key
+            
+            # Con miles de restricciones hay millones de intersecciones: se
+            # convierten a arrays una sola vez
+            intersections = self._point_arrays(solution.intersection_points)
+            
+            # Determinar límites del gráfico
+            x_max, y_max = self._calculate_plot_limits(*intersections)
+            self._plot_limits = (x_max, y_max)
+            
+            # Restricciones, región factible, puntos de intersección y vértices factibles
+            relayout = self._plot_constraints(x_max, y_max) or relayout
+            self._plot_intersection_points(*intersections)
+            self._plot_feasible_vertices()
+            
+            self.ax.set_xlim(0, x_max)
+            self.ax.set_ylim(0, y_max)
         
-        # Graficar punto óptimo
+        # Punto óptimo y función objetivo
         self._plot_optimal_point()
+        self._plot_objective_function()
+        
+        self._update_legend()
         
-        # Graficar función objetivo
-        self._plot_objective_function(x_range)
+        # El layout solo cambia si cambió el conjunto de restricciones
+        if relayout:
+            self.fig.tight_layout()
+        self.canvas.draw_idle()
+    
+    def _create_artists(self):
+        """Prepara los ejes y crea los artistas persistentes (vacíos) de la solución"""
+        self.ax.clear()
+        self._constraint_artists = {}
+        self._emphasized_colors = {}
+        self._vertex_annotations = []
         
-        # Configurar ejes y título
-        self.ax.set_xlim(0, x_max)
-        self.ax.set_ylim(0, y_max)
         self.ax.set_xlabel('X₁ (Variable 1)', fontsize=12)
         self.ax.set_ylabel('X₂ (Variable 2)', fontsize=12)
         self.ax.set_title('Región Factible y Solución Óptima', fontsize=14, fontweight='bold')
         self.ax.grid(True, alpha=0.3)
-        self.ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
         
-        # Ajustar layout y dibujar
-        self.fig.tight_layout()
-        self.canvas.draw()
+        empty = np.empty((0, 2))
+        self._artists = {
+            'region': self.ax.add_patch(Polygon(empty, closed=True, facecolor='lightgreen', alpha=0.4,
+                                                edgecolor='green', linewidth=1, zorder=1,
+                                                label='Región Factible')),
+            'emphasized': self.ax.add_collection(LineCollection([], linewidths=2), autolim=False),
+            'faded': self.ax.add_collection(LineCollection([], colors='gray', linewidths=0.8, alpha=0.25,
+                                                           zorder=0.8), autolim=False),
+            'intersections': self.ax.scatter(empty[:, 0], empty[:, 1], color='gray', s=30, alpha=0.6,
+                                             label='Intersecciones', marker='o'),
+            'density': self.ax.imshow(np.ma.masked_all((1, 1)), origin='lower', extent=(0, 1, 0, 1),
+                                      cmap='Greys', alpha=0.6, aspect='auto', interpolation='nearest',
+                                      zorder=0.9, visible=False),
+            'vertices': self.ax.scatter(empty[:, 0], empty[:, 1], color='black', s=100, zorder=5,
+                                        label='Vértices Factibles', marker='o'),
+            'optimal': self.ax.scatter(empty[:, 0], empty[:, 1], color='red', s=250, marker='*', zorder=6),
+            'optimal_value': self.ax.annotate('', (0, 0), xytext=(15, 15), textcoords='offset points',
+                                              fontsize=10, fontweight='bold', color='red', zorder=7,
+                                              bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow",
+                                                        alpha=0.7)),
+            'relaxation': self.ax.scatter(empty[:, 0], empty[:, 1], facecolors='none',
+                                          edgecolors='red', s=150, marker='o', zorder=5),
+            'objective': self.ax.plot([], [], 'r--', alpha=0.7, linewidth=2)[0],
+            # Entradas de la leyenda sin artista propio en los ejes
+            'more_constraints': Line2D([], [], linestyle='none'),
+            'density_legend': Patch(facecolor='gray', alpha=0.6, label='Intersecciones (densidad)'),
+        }
+        self._constraints_key = None
+    
+    def _get_constraints_key(self, solution: Solution) -> tuple:
+        """Identifica las restricciones graficadas (coeficientes, términos y tipos exactos)"""
+        A, b, codes = solution.problem.constraints.to_arrays()
+        return A.tobytes(), b.tobytes(), codes.tobytes()
+    
+    def _update_legend(self):
+        """Reconstruye la leyenda con los artistas visibles que tienen etiqueta"""
+        handles = [artist for artist in self._legend_order()
+                   if artist.get_visible() and not artist.get_label().startswith('_')]
+        self.ax.legend(handles=handles, bbox_to_anchor=(1.05, 1), loc='upper left')
+    
+    def _legend_order(self) -> list:
+        """
+        Artistas de la leyenda en el orden en que se dibujaban originalmente.
+        
+        Se muestran a lo sumo MAX_LEGEND_CONSTRAINTS restricciones, primero
+        las activas en el óptimo; las demás se resumen en una sola entrada.
+        En el modo de nivel de detalle las restricciones no tienen línea
+        propia, así que sus entradas son líneas auxiliares del mismo color.
+        """
+        artists = self._artists
+        solution = self.current_solution
+        sensitivity = solution.sensitivity if solution else None
+        binding = set(sensitivity.binding) if sensitivity is not None else set()
+        indices = sorted(self._constraint_artists or self._emphasized_colors,
+                         key=lambda index: (index not in binding, index))
+        
+        shown = sorted(indices[:MAX_LEGEND_CONSTRAINTS])
+        hidden = len(indices) - len(shown)
+        more = artists['more_constraints']
+        more.set_label(f'… y {hidden} restricciones más')
+        more.set_visible(hidden > 0)
+        
+        if self._constraint_artists:
+            lines = [self._constraint_artists[index] for index in shown]
+        else:
+            constraints = solution.problem.constraints
+            lines = [Line2D([], [], color=self._emphasized_colors[index], linewidth=2,
+                            label=self._get_constraint_label(constraints[index])) for index in shown]
+        
+        artists['density_legend'].set_visible(artists['density'].get_visible())
+        return lines + [more, artists['faded'], artists['region'], artists['intersections'],
+                        artists['density_legend'], artists['vertices'], artists['optimal'],
+                        artists['relaxation'], artists['objective']]
+    
+    def _point_arrays(self, points: list) -> Tuple[np.ndarray, np.ndarray]:
+        """Coordenadas X1 y X2 de una lista de puntos como arrays"""
+        x = np.fromiter(map(attrgetter('x1'), points), dtype=np.float64, count=len(points))
+        y = np.fromiter(map(attrgetter('x2'), points), dtype=np.float64, count=len(points))
+        return x, y
     
-    def _calculate_plot_limits(self) -> tuple:
-        """Calcula los límites apropiados para el gráfico"""
+    def _calculate_plot_limits(self, x_all: np.ndarray, y_all: np.ndarray) -> tuple:
+        """
+        Calcula los límites apropiados para el gráfico.
+        
+        Args:
+            x_all, y_all: Coordenadas de los puntos de intersección
+        """
         solution = self.current_solution
         
         if solution.feasible_vertices:
@@ -165,48 +311,83 @@ class GraphPanel:
             x_max, y_max = 50, 50
         
         # Considerar también las intersecciones para el límite
-        if solution.intersection_points:
-            x_coords_all = [p.x1 for p in solution.intersection_points if p.x1 >= 0 and p.x2 >= 0]
-            y_coords_all = [p.x2 for p in solution.intersection_points if p.x1 >= 0 and p.x2 >= 0]
-            if x_coords_all and y_coords_all:
-                x_max = max(x_max, max(x_coords_all) * 1.2)
-                y_max = max(y_max, max(y_coords_all) * 1.2)
+        if len(x_all):
+            in_quadrant = (x_all >= 0) & (y_all >= 0)
+            if in_quadrant.any():
+                x_max = max(x_max, float(x_all[in_quadrant].max()) * 1.2)
+                y_max = max(y_max, float(y_all[in_quadrant].max()) * 1.2)
         
         return min(x_max, 200), min(y_max, 200)  # Límite máximo razonable
     
-    def _plot_constraints(self, x_range: np.ndarray, x_max: float, y_max: float):
-        """Grafica las restricciones del problema"""
-        solution = self.current_solution
+    def _plot_constraints(self, x_max: float, y_max: float) -> bool:
+        """
+        Actualiza las líneas de las restricciones y el polígono de la región factible.
         
-        for i, constraint in enumerate(solution.problem.constraints):
-            # Saltar restricciones de no negatividad (se asumen implícitas)
-            if self._is_non_negativity_constraint(constraint):
-                continue
-            
-            color = self.constraint_colors[i % len(self.constraint_colors)]
+        Cada recta se recorta analíticamente a la ventana, así que se dibuja
+        con sus dos extremos. Cada restricción conserva su línea según su
+        posición en el problema; solo se crean o eliminan líneas cuando
+        cambia el conjunto de restricciones graficadas. Con más de
+        LOD_CONSTRAINT_THRESHOLD restricciones, las que no forman lados de
+        la región factible se dibujan atenuadas en una única LineCollection.
+        
+        Returns:
+            bool: True si se agregaron o quitaron artistas
+        """
+        solution = self.current_solution
+        constraints = solution.problem.constraints
+        A, b, _ = constraints.to_arrays()
+        x0, y0, x1, y1, crossing = clip_lines_to_box(A, b, x_max, y_max)
+        
+        # Saltar restricciones de no negatividad (se asumen implícitas)
+        drawn = [i for i in np.flatnonzero(crossing).tolist()
+                 if not self._is_non_negativity_constraint(constraints[i])]
+        
+        if len(drawn) > LOD_CONSTRAINT_THRESHOLD:
+            active = active_constraints(constraints, solution.feasible_vertices)
+            detailed = []
+            emphasized = [i for i in drawn if active[i]]
+            faded = [i for i in drawn if not active[i]]
+        else:
+            detailed, emphasized, faded = drawn, [], []
+        
+        plotted = set()
+        changed = False
+        for i in detailed:
+            if i not in self._constraint_artists:
+                color = self.constraint_colors[i % len(self.constraint_colors)]
+                self._constraint_artists[i], = self.ax.plot([], [], color=color, linewidth=2)
+                changed = True
             
-            try:
-                # Obtener puntos de la línea
-                x_line, y_line = self.solver.get_constraint_line_points(
-                    constraint, (0, x_max), len(x_range)
-                )
-                
-                # Filtrar puntos dentro de los límites del gráfico
-                valid_indices = (y_line >= 0) & (y_line <= y_max)
-                x_line_valid = x_line[valid_indices]
-                y_line_valid = y_line[valid_indices]
-                
-                if len(x_line_valid) > 1:
-                    # Graficar línea de restricción
-                    label = self._get_constraint_label(constraint)
-                    self.ax.plot(x_line_valid, y_line_valid, color=color, 
-                               label=label, linewidth=2)
-                    
-                    # Sombrear región factible para la restricción
-                    self._shade_feasible_region(constraint, x_line_valid, y_line_valid, color, y_max)
-                    
-            except Exception as e:
-                print(f"Error graficando restricción {i}: {e}")
+            line = self._constraint_artists[i]
+            line.set_data([x0[i], x1[i]], [y0[i], y1[i]])
+            line.set_label(self._get_constraint_label(constraints[i]))
+            plotted.add(i)
+        
+        # Nivel de detalle: un solo artista para cada grupo de restricciones
+        self._emphasized_colors = {i: self.lod_colors[rank % len(self.lod_colors)]
+                                   for rank, i in enumerate(emphasized)}
+        segments = np.stack((np.column_stack((x0, y0)), np.column_stack((x1, y1))), axis=1)
+        emphasized_artist, faded_artist = self._artists['emphasized'], self._artists['faded']
+        emphasized_artist.set_segments(segments[emphasized])
+        emphasized_artist.set_color(list(self._emphasized_colors.values()) or 'none')
+        emphasized_artist.set_visible(bool(emphasized))
+        faded_artist.set_segments(segments[faded])
+        faded_artist.set_label(f'Otras restricciones ({len(faded)})')
+        faded_artist.set_visible(bool(faded))
+        
+        # Quitar las líneas de las restricciones que ya no se grafican
+        for i in set(self._constraint_artists) - plotted:
+            self._constraint_artists.pop(i).remove()
+            changed = True
+        
+        # Sombrear la región factible real (parte visible en la ventana)
+        region = self._artists['region']
+        x_region, y_region = feasible_region_in_box(constraints, solution.feasible_vertices, x_max, y_max)
+        if len(x_region):
+            region.set_xy(np.column_stack((x_region, y_region)))
+        region.set_visible(bool(len(x_region)))
+        
+        return changed
     
     def _is_non_negativity_constraint(self, constraint) -> bool:
         """Verifica si es una restricción de no negatividad"""
@@ -217,75 +398,108 @@ class GraphPanel:
         """Genera etiqueta para una restricción"""
         return f'{constraint.a1:.0f}X₁ + {constraint.a2:.0f}X₂ {constraint.inequality_type.value} {constraint.b:.0f}'
     
-    def _shade_feasible_region(self, constraint, x_line: np.ndarray, y_line: np.ndarray, 
-                              color: str, y_max: float):
-        """Sombrea la región factible de una restricción"""
-        if constraint.inequality_type == InequalityType.MENOR_IGUAL:
-            self.ax.fill_between(x_line, 0, y_line, alpha=0.1, color=color)
-        elif constraint.inequality_type == InequalityType.MAYOR_IGUAL:
-            self.ax.fill_between(x_line, y_line, y_max, alpha=0.1, color=color)
+    def _set_points(self, artist, x_coords: list, y_coords: list):
+        """Actualiza las posiciones de un scatter y lo oculta si no tiene puntos"""
+        artist.set_offsets(np.column_stack((x_coords, y_coords)) if x_coords else np.empty((0, 2)))
+        artist.set_visible(bool(x_coords))
     
-    def _plot_intersection_points(self):
-        """Grafica todos los puntos de intersección"""
-        solution = self.current_solution
+    def _plot_intersection_points(self, x: np.ndarray, y: np.ndarray):
+        """
+        Grafica todos los puntos de intersección.
         
-        if solution.intersection_points:
-            x_coords = [p.x1 for p in solution.intersection_points if p.x1 >= 0 and p.x2 >= 0]
-            y_coords = [p.x2 for p in solution.intersection_points if p.x1 >= 0 and p.x2 >= 0]
-            
-            if x_coords and y_coords:
-                self.ax.scatter(x_coords, y_coords, color='gray', s=30, alpha=0.6, 
-                              label='Intersecciones', marker='o')
+        Con más de MAX_SCATTER_POINTS puntos en la ventana se muestra en
+        cambio su densidad (escala logarítmica) como una imagen.
+        
+        Args:
+            x, y: Coordenadas de los puntos de intersección
+        """
+        scatter, density = self._artists['intersections'], self._artists['density']
+        
+        x_max, y_max = self._plot_limits
+        inside = (x >= 0) & (y >= 0) & (x <= x_max) & (y <= y_max)
+        x, y = x[inside], y[inside]
+        
+        if len(x) <= MAX_SCATTER_POINTS:
+            self._set_points(scatter, x.tolist(), y.tolist())
+            density.set_visible(False)
+            return
+        
+        self._set_points(scatter, [], [])
+        # Histograma de celdas uniformes (filas según X2, como espera imshow)
+        column = np.minimum((x * (DENSITY_BINS / x_max)).astype(np.intp), DENSITY_BINS - 1)
+        row = np.minimum((y * (DENSITY_BINS / y_max)).astype(np.intp), DENSITY_BINS - 1)
+        counts = np.bincount(row * DENSITY_BINS + column,
+                             minlength=DENSITY_BINS * DENSITY_BINS).reshape(DENSITY_BINS, DENSITY_BINS)
+        density.set_data(np.ma.masked_equal(np.log1p(counts), 0.0))
+        density.set_extent((0, x_max, 0, y_max))
+        density.set_clim(0.0, float(np.log1p(counts.max())))
+        density.set_visible(True)
     
     def _plot_feasible_vertices(self):
         """Grafica los vértices factibles"""
         solution = self.current_solution
-        
-        if solution.feasible_vertices:
-            x_coords = [v.x1 for v in solution.feasible_vertices]
-            y_coords = [v.x2 for v in solution.feasible_vertices]
-            
-            self.ax.scatter(x_coords, y_coords, color='black', s=100, zorder=5,
-                           label='Vértices Factibles', marker='o')
-            
-            # Etiquetar vértices
-            for vertex in solution.feasible_vertices:
-                self.ax.annotate(f'({vertex.x1:.1f}, {vertex.x2:.1f})', 
-                               (vertex.x1, vertex.x2),
-                               xytext=(8, 8), textcoords='offset points',
-                               fontsize=9, fontweight='bold')
+        vertices = solution.feasible_vertices
+        
+        self._set_points(self._artists['vertices'], [v.x1 for v in vertices], [v.x2 for v in vertices])
+        
+        # Etiquetar vértices reutilizando las anotaciones existentes (con
+        # demasiados vértices las etiquetas se superponen y no se muestran)
+        labeled = vertices if len(vertices) <= MAX_VERTEX_LABELS else []
+        while len(self._vertex_annotations) < len(labeled):
+            self._vertex_annotations.append(self.ax.annotate(
+                '', (0, 0), xytext=(8, 8), textcoords='offset points',
+                fontsize=9, fontweight='bold'))
+        while len(self._vertex_annotations) > len(labeled):
+            self._vertex_annotations.pop().remove()
+        
+        for annotation, vertex in zip(self._vertex_annotations, labeled):
+            annotation.xy = (vertex.x1, vertex.x2)
+            annotation.set_text(f'({vertex.x1:.1f}, {vertex.x2:.1f})')
     
     def _plot_optimal_point(self):
         """Grafica el punto óptimo"""
         solution = self.current_solution
+        optimal, optimal_value = self._artists['optimal'], self._artists['optimal_value']
         
         if solution.optimal_point:
-            self.ax.scatter(solution.optimal_point.x1, solution.optimal_point.x2, 
-                          color='red', s=250, marker='*', zorder=6,
-                          label=f'Óptimo: ({solution.optimal_point.x1:.1f}, {solution.optimal_point.x2:.1f})')
+            point = solution.optimal_point
+            self._set_points(optimal, [point.x1], [point.x2])
+            optimal.set_label(f'Óptimo: ({point.x1:.1f}, {point.x2:.1f})')
             
             # Anotar valor óptimo
-            self.ax.annotate(f'Z* = {solution.optimal_value:.1f}',
-                           (solution.optimal_point.x1, solution.optimal_point.x2),
-                           xytext=(15, 15), textcoords='offset points',
-                           fontsize=10, fontweight='bold', color='red',
-                           bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7))
+            optimal_value.xy = (point.x1, point.x2)
+            optimal_value.set_text(f'Z* = {solution.optimal_value:.1f}')
+            optimal_value.set_visible(True)
+        else:
+            self._set_points(optimal, [], [])
+            optimal_value.set_visible(False)
+        
+        # Con variables enteras, marcar también el óptimo de la relajación
+        relaxation_artist = self._artists['relaxation']
+        report = solution.branch_and_bound
+        relaxation = report.relaxation_point if report is not None else None
+        if relaxation is not None and relaxation != solution.optimal_point:
+            self._set_points(relaxation_artist, [relaxation.x1], [relaxation.x2])
+            relaxation_artist.set_label(f'Relajación: ({relaxation.x1:.1f}, {relaxation.x2:.1f})')
+        else:
+            self._set_points(relaxation_artist, [], [])
     
-    def _plot_objective_function(self, x_range: np.ndarray):
+    def _plot_objective_function(self):
         """Grafica la línea de la función objetivo"""
         solution = self.current_solution
+        line = self._artists['objective']
+        line.set_visible(False)
         
         if solution.optimal_point and solution.optimal_value is not None:
             obj_func = solution.problem.objective_function
             
-            # Línea de función objetivo que pasa por el óptimo
-            if abs(obj_func.c2) > 1e-10:
-                y_obj = (solution.optimal_value - obj_func.c1 * x_range) / obj_func.c2
-                valid_indices = (y_obj >= 0) & (y_obj <= self.ax.get_ylim()[1])
-                if np.any(valid_indices):
-                    self.ax.plot(x_range[valid_indices], y_obj[valid_indices], 
-                               'r--', alpha=0.7, linewidth=2,
-                               label=f'Función Objetivo (Z = {solution.optimal_value:.1f})')
+            # Línea de función objetivo que pasa por el óptimo, recortada a la ventana
+            x0, y0, x1, y1, crossing = clip_lines_to_box(
+                np.array([[obj_func.c1, obj_func.c2]]), np.array([solution.optimal_value]), *self._plot_limits)
+            if crossing[0]:
+                line.set_data([x0[0], x1[0]], [y0[0], y1[0]])
+                line.set_label(f'Función Objetivo (Z = {solution.optimal_value:.1f})')
+                line.set_visible(True)
     
     def _display_text_results(self):
         """Muestra los resultados textuales"""
@@ -323,11 +537,19 @@ class GraphPanel:
                 lines.append(f"  - {constraint}")
         lines.append("  - X₁ ≥ 0, X₂ ≥ 0\n")
         
+        # Restricciones eliminadas por el presolve
+        if solution.presolve_removed:
+            lines.append(f"=== PRESOLVE: {len(solution.presolve_removed)} RESTRICCIONES ELIMINADAS ===")
+            for removed in solution.presolve_removed:
+                lines.append(f"  - {removed}")
+            lines.append("")
+        
         # Puntos de intersección
         lines.append("=== ANÁLISIS MATEMÁTICO ===")
         lines.append(f"Puntos de intersección encontrados: {len(solution.intersection_points)}")
+        feasible_grid = PointGrid.from_points(solution.feasible_vertices)
         for i, point in enumerate(solution.intersection_points[:10], 1):  # Mostrar máximo 10
-            feasible_mark = "✓" if point in solution.feasible_vertices else "✗"
+            feasible_mark = "✓" if point in feasible_grid else "✗"
             lines.append(f"  {i}. {point} {feasible_mark}")
         
         if len(solution.intersection_points) > 10:
@@ -351,13 +573,73 @@ class GraphPanel:
             lines.append(f"Punto óptimo: X₁* = {solution.optimal_point.x1:.3f}, X₂* = {solution.optimal_point.x2:.3f}")
             lines.append(f"Valor óptimo: Z* = {solution.optimal_value:.3f}\n")
             
+            lines.extend(self._get_branch_and_bound_lines(solution))
+            lines.extend(self._get_sensitivity_lines(solution))
+            
             # Interpretación específica para el ejemplo de startup
             lines.extend(self._get_startup_interpretation(solution))
         else:
             lines.append("No se encontró solución factible.")
+            lines.extend(self._get_branch_and_bound_lines(solution))
         
         return "\n".join(lines)
     
+    def _get_branch_and_bound_lines(self, solution: Solution) -> list:
+        """Genera el resumen de ramificación y acotamiento (solo con variables enteras)"""
+        report = solution.branch_and_bound
+        if report is None:
+            return []
+        
+        lines = ["=== RAMIFICACIÓN Y ACOTAMIENTO ==="]
+        if report.relaxation_point is not None:
+            lines.append(f"Relajación lineal: {report.relaxation_point} → Z = {report.relaxation_value:.3f}")
+        lines.append(f"Nodos explorados: {report.nodes_explored} ({report.nodes_pruned} podados, "
+                     f"profundidad máxima {report.max_depth})")
+        if report.best_bound is not None:
+            lines.append(f"Mejor cota: {report.best_bound:.3f}")
+        if report.gap is not None:
+            lines.append(f"Brecha de optimalidad: {report.gap:.2%}")
+        if report.node_limit_reached:
+            lines.append("Se alcanzó el límite de nodos: la solución puede no ser óptima.")
+        lines.append("")
+        return lines
+    
+    def _get_sensitivity_lines(self, solution: Solution) -> list:
+        """Genera el análisis de sensibilidad de las restricciones del usuario"""
+        sensitivity = solution.sensitivity
+        if sensitivity is None:
+            return []
+        
+        lines = ["=== ANÁLISIS DE SENSIBILIDAD ==="]
+        if sensitivity.shadow_prices is None:
+            lines.append("La región no está acotada en la dirección de optimización:")
+            lines.append("no hay precios sombra ni rangos de optimalidad.")
+        
+        for i, constraint in enumerate(solution.problem.constraints):
+            if self._is_non_negativity_constraint(constraint):
+                continue
+            
+            status = "activa" if sensitivity.is_binding(i) else f"holgura {sensitivity.slacks[i]:.3f}"
+            lines.append(f"• {constraint}: {status}")
+            if sensitivity.shadow_prices is not None:
+                lines.append(f"    precio sombra {sensitivity.shadow_prices[i]:.3f}, "
+                             f"b ∈ {self._format_range(*sensitivity.rhs_ranges[i])}")
+        
+        if sensitivity.objective_ranges is not None:
+            c1_range, c2_range = sensitivity.objective_ranges
+            lines.append("Rangos de la función objetivo con el mismo óptimo:")
+            lines.append(f"• c₁ ∈ {self._format_range(*c1_range)}")
+            lines.append(f"• c₂ ∈ {self._format_range(*c2_range)}")
+        
+        lines.append("")
+        return lines
+    
+    def _format_range(self, low: float, high: float) -> str:
+        """Formatea un rango mostrando los extremos infinitos como ∞"""
+        low_text = "-∞" if np.isinf(low) else f"{low:.3f}"
+        high_text = "∞" if np.isinf(high) else f"{high:.3f}"
+        return f"[{low_text}, {high_text}]"
+    
     def _get_startup_interpretation(self, solution: Solution) -> list:
         """Genera interpretación específica para el problema de la startup"""
         obj_func = solution.problem.objective_function
@@ -367,24 +649,37 @@ class GraphPanel:
             lines = []
             lines.append("=== INTERPRETACIÓN PARA LA STARTUP ===")
             lines.append("La empresa de desarrollo de software debe producir:")
-            lines.append(f"• {solution.optimal_point.x1:.0f} aplicaciones de productividad (A1)")
-            lines.append(f"• {solution.optimal_point.x2:.0f} aplicaciones de entretenimiento (A2)")
-            lines.append(f"Para obtener una ganancia máxima de ${solution.optimal_value:.2f} semanales.\n")
-            
-            # Análisis de recursos
-            desarrollo_usado = 20 * solution.optimal_point.x1 + 15 * solution.optimal_point.x2
-            pruebas_usado = 10 * solution.optimal_point.x1 + 15 * solution.optimal_point.x2
+            x1, x2 = solution.optimal_point.x1, solution.optimal_point.x2
+            is_integral = abs(x1 - round(x1)) < 1e-6 and abs(x2 - round(x2)) < 1e-6
+            quantity = "{:.0f}" if is_integral else "{:.2f}"
+            lines.append(f"• {quantity.format(x1)} aplicaciones de productividad (A1)")
+            lines.append(f"• {quantity.format(x2)} aplicaciones de entretenimiento (A2)")
+            lines.append(f"Para obtener una ganancia máxima de ${solution.optimal_value:.2f} semanales.")
+            if not is_integral:
+                lines.append("Nota: la solución no es entera; marque X₁ y X₂ como enteras para")
+                lines.append("obtener la mejor cantidad de aplicaciones completas.")
+            lines.append("")
             
+            # Análisis de recursos: desarrollo y pruebas son las dos primeras restricciones
+            sensitivity = solution.sensitivity
             lines.append("ANÁLISIS DE RECURSOS:")
-            lines.append(f"• Desarrollo: {desarrollo_usado:.1f}/600 horas ({desarrollo_usado/600*100:.1f}% utilizado)")
-            lines.append(f"• Pruebas: {pruebas_usado:.1f}/450 horas ({pruebas_usado/450*100:.1f}% utilizado)\n")
+            resources = [(index, name) for index, name in enumerate(("Desarrollo", "Pruebas"))
+                         if index < len(solution.problem.constraints)]
+            for index, name in resources:
+                constraint = solution.problem.constraints[index]
+                used = constraint.evaluate(solution.optimal_point.x1, solution.optimal_point.x2)
+                utilization = f" ({used / constraint.b * 100:.1f}% utilizado)" if constraint.b else ""
+                lines.append(f"• {name}: {used:.1f}/{constraint.b:.0f} horas{utilization}")
+            lines.append("")
             
             # Recomendaciones
             lines.append("RECOMENDACIONES:")
-            if desarrollo_usado >= 599:
-                lines.append("• El recurso de desarrollo está al límite.")
-            if pruebas_usado >= 449:
-                lines.append("• El recurso de pruebas está al límite.")
+            for index, name in resources:
+                if sensitivity is not None and sensitivity.is_binding(index):
+                    text = f"• El recurso de {name.lower()} está al límite."
+                    if sensitivity.shadow_prices is not None:
+                        text += f" Cada hora adicional vale ${sensitivity.shadow_prices[index]:.2f}."
+                    lines.append(text)
             
             return lines
         
@@ -10,6 +10,11 @@ from core.models import (
     LinearProgrammingProblem, ObjectiveFunction, Constraint,
     OptimizationType, InequalityType
 )
+from core.cache import problem_fingerprint
+
+
+# Espera (ms) desde la última edición antes de resolver en modo en vivo
+LIVE_DEBOUNCE_MS = 300
 
 
 class ConstraintEntry:
@@ -18,7 +23,8 @@ class ConstraintEntry:
     def __init__(self, parent_frame: ttk.Frame, 
                  on_delete_callback: Callable, 
                  a1: str = "0", a2: str = "0", 
-                 inequality: str = "≤", b: str = "0"):
+                 inequality: str = "≤", b: str = "0",
+                 on_change_callback: Optional[Callable[[], None]] = None):
         self.frame = ttk.Frame(parent_frame)
         self.frame.pack(fill=tk.X, pady=2)
         self.on_delete_callback = on_delete_callback
@@ -29,6 +35,11 @@ class ConstraintEntry:
         self.inequality_var = tk.StringVar(value=inequality)
         self.b_var = tk.StringVar(value=b)
         
+        # Avisar cada edición (modo en vivo del panel)
+        if on_change_callback is not None:
+            for var in (self.a1_var, self.a2_var, self.inequality_var, self.b_var):
+                var.trace_add("write", lambda *args: on_change_callback())
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -101,8 +112,22 @@ class InputPanel:
         self.c1_var = tk.StringVar(value="250")
         self.c2_var = tk.StringVar(value="300")
         
+        # Integralidad de las variables
+        self.integer_x1_var = tk.BooleanVar(value=False)
+        self.integer_x2_var = tk.BooleanVar(value=False)
+        
+        # Modo en vivo: resolver automáticamente tras cada ráfaga de ediciones
+        self.live_var = tk.BooleanVar(value=False)
+        self._live_after_id: Optional[str] = None
+        self._last_solved_fingerprint: Optional[str] = None
+        
         self._setup_ui()
         self._add_default_constraints()
+        
+        for var in (self.optimization_var, self.c1_var, self.c2_var,
+                    self.integer_x1_var, self.integer_x2_var):
+            var.trace_add("write", lambda *args: self._on_input_changed())
+        self.live_var.trace_add("write", lambda *args: self._on_live_toggled())
     
     def _setup_ui(self):
         """Configura la interfaz de usuario del panel"""
@@ -139,6 +164,15 @@ class InputPanel:
         ttk.Label(coef_frame, text="*X₁ + ").pack(side=tk.LEFT)
         ttk.Entry(coef_frame, textvariable=self.c2_var, width=8).pack(side=tk.LEFT)
         ttk.Label(coef_frame, text="*X₂").pack(side=tk.LEFT)
+        
+        # Variables enteras (se resuelven con ramificación y acotamiento)
+        integer_frame = ttk.Frame(obj_frame)
+        integer_frame.pack(fill=tk.X, pady=2)
+        
+        ttk.Checkbutton(integer_frame, text="X₁ entera",
+                        variable=self.integer_x1_var).pack(side=tk.LEFT)
+        ttk.Checkbutton(integer_frame, text="X₂ entera",
+                        variable=self.integer_x2_var).pack(side=tk.LEFT, padx=10)
     
     def _setup_constraints_section(self):
         """Configura la sección de restricciones"""
@@ -163,7 +197,10 @@ class InputPanel:
         solve_btn = ttk.Button(self.frame, text="RESOLVER PROBLEMA",
                               command=self._on_solve_clicked,
                               style="Accent.TButton")
-        solve_btn.pack(pady=20, fill=tk.X)
+        solve_btn.pack(pady=(20, 5), fill=tk.X)
+        
+        ttk.Checkbutton(self.frame, text="Resolver al editar",
+                        variable=self.live_var).pack(anchor=tk.W)
     
     def _add_default_constraints(self):
         """Agrega las restricciones por defecto del ejemplo"""
@@ -172,6 +209,16 @@ class InputPanel:
         # Restricción de pruebas: 10*X1 + 15*X2 <= 450
         self.add_constraint("10", "15", "≤", "450")
     
+    def set_integer_variables(self, integer_variables=(False, False)):
+        """
+        Marca qué variables deben ser enteras.
+        
+        Args:
+            integer_variables: Integralidad de X1 y X2
+        """
+        self.integer_x1_var.set(bool(integer_variables[0]))
+        self.integer_x2_var.set(bool(integer_variables[1]))
+    
     def add_constraint(self, a1: str = "0", a2: str = "0", 
                       inequality: str = "≤", b: str = "0"):
         """
@@ -186,9 +233,11 @@ class InputPanel:
         constraint_entry = ConstraintEntry(
             self.constraints_list_frame,
             self._delete_constraint_callback,
-            a1, a2, inequality, b
+            a1, a2, inequality, b,
+            on_change_callback=self._on_input_changed
         )
         self.constraint_entries.append(constraint_entry)
+        self._on_input_changed()
     
     def _delete_constraint_callback(self, constraint_entry: ConstraintEntry):
         """
@@ -200,6 +249,7 @@ class InputPanel:
         if constraint_entry in self.constraint_entries:
             self.constraint_entries.remove(constraint_entry)
             constraint_entry.destroy()
+            self._on_input_changed()
     
     def clear_all_constraints(self):
         """Elimina todas las restricciones"""
@@ -239,7 +289,9 @@ class InputPanel:
             if not constraints:
                 raise ValueError("Debe ingresar al menos una restricción")
             
-            return LinearProgrammingProblem(objective_function, constraints)
+            integer_variables = (self.integer_x1_var.get(), self.integer_x2_var.get())
+            
+            return LinearProgrammingProblem(objective_function, constraints, integer_variables)
             
         except ValueError as e:
             raise ValueError(f"Error en los datos: {str(e)}")
@@ -248,12 +300,55 @@ class InputPanel:
         """Maneja el evento de clic en el botón resolver"""
         try:
             problem = self.get_problem()
+            self._last_solved_fingerprint = problem_fingerprint(problem)
             self.on_solve_callback(problem)
         except ValueError as e:
             messagebox.showerror("Error en los datos", str(e))
         except Exception as e:
             messagebox.showerror("Error", f"Error inesperado: {str(e)}")
     
+    def _on_input_changed(self):
+        """
+        Reprograma la resolución en vivo tras una edición.
+        
+        Cada edición cancela la resolución pendiente, de modo que una ráfaga
+        de cambios (escribir un número, cargar un ejemplo) produce una sola
+        resolución LIVE_DEBOUNCE_MS después de la última.
+        """
+        if not self.live_var.get():
+            return
+        if self._live_after_id is not None:
+            self.frame.after_cancel(self._live_after_id)
+        self._live_after_id = self.frame.after(LIVE_DEBOUNCE_MS, self._live_solve)
+    
+    def _on_live_toggled(self):
+        """Activa o desactiva el modo en vivo"""
+        if self.live_var.get():
+            self._on_input_changed()
+        elif self._live_after_id is not None:
+            self.frame.after_cancel(self._live_after_id)
+            self._live_after_id = None
+    
+    def _live_solve(self):
+        """
+        Resuelve en modo en vivo si el problema cambió desde la última resolución.
+        
+        Los datos incompletos (un campo vacío o con solo "-" mientras se
+        escribe) se ignoran sin mostrar errores.
+        """
+        self._live_after_id = None
+        try:
+            problem = self.get_problem()
+        except ValueError:
+            return
+        
+        # Las ediciones que no cambian el problema canónico no se resuelven
+        fingerprint = problem_fingerprint(problem)
+        if fingerprint == self._last_solved_fingerprint:
+            return
+        self._last_solved_fingerprint = fingerprint
+        self.on_solve_callback(problem)
+    
     def load_startup_example(self):
         """Carga el ejemplo de la startup de software"""
         # Limpiar restricciones existentes
@@ -263,6 +358,7 @@ class InputPanel:
         self.optimization_var.set("maximizar")
         self.c1_var.set("250")
         self.c2_var.set("300")
+        self.set_integer_variables((False, False))
         
         # Agregar restricciones del ejemplo
         self.add_constraint("20", "15", "≤", "600")  # Desarrollo
@@ -4,23 +4,42 @@ Actúa como orquestador entre los diferentes paneles.
 """
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import copy
 import json
+import queue
+import threading
 from typing import Optional
 
-from core.models import LinearProgrammingProblem
-from core.solver import LinearProgrammingSolver
+from core.models import LinearProgrammingProblem, Solution
+from core.solver import LinearProgrammingSolver, SolveCancelled
+from core.serialization import problem_to_dict
+from core.cache import SolutionCache
 from gui.input_panel import InputPanel
 from gui.graph_panel import GraphPanel
 
 
+# Intervalo (ms) con el que se revisan los mensajes del hilo de resolución
+SOLVE_POLL_MS = 50
+
+
 class MainWindow:
     """Ventana principal de la aplicación"""
     
     def __init__(self):
         self.root = tk.Tk()
-        self.solver = LinearProgrammingSolver()
+        self.solver = LinearProgrammingSolver(presolve=True, collect_stats=True)
+        self.solution_cache = SolutionCache()
         self.current_problem: Optional[LinearProgrammingProblem] = None
         
+        # Resolución en segundo plano: cada pedido tiene un número de generación
+        # y los mensajes de generaciones anteriores (reemplazadas o canceladas)
+        # se descartan
+        self._solve_generation = 0
+        self._solve_cancel: Optional[threading.Event] = None
+        self._solve_problem: Optional[LinearProgrammingProblem] = None
+        self._solve_messages: queue.Queue = queue.Queue()
+        self._polling = False
+        
         self._setup_window()
         self._setup_menu()
         self._setup_panels()
@@ -69,6 +88,8 @@ class MainWindow:
         file_menu.add_separator()
         file_menu.add_command(label="Exportar Resultados...", command=self._export_results, accelerator="Ctrl+E")
         file_menu.add_separator()
+        file_menu.add_command(label="Cancelar Resolución", command=self._cancel_solve, accelerator="Esc")
+        file_menu.add_separator()
         file_menu.add_command(label="Salir", command=self._exit_application, accelerator="Ctrl+Q")
         
         # Menú Ejemplos
@@ -77,6 +98,7 @@ class MainWindow:
         examples_menu.add_command(label="Startup de Software", command=self._load_startup_example)
         examples_menu.add_command(label="Problema de Producción", command=self._load_production_example)
         examples_menu.add_command(label="Mezcla de Productos", command=self._load_mix_example)
+        examples_menu.add_command(label="Producción con Enteros", command=self._load_integer_example)
         
         # Menú Ayuda
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -92,6 +114,7 @@ class MainWindow:
         self.root.bind('<Control-o>', lambda e: self._load_problem())
         self.root.bind('<Control-e>', lambda e: self._export_results())
         self.root.bind('<Control-q>', lambda e: self._exit_application())
+        self.root.bind('<Escape>', lambda e: self._cancel_solve())
     
     def _setup_panels(self):
         """Configura los paneles principales de la aplicación"""
@@ -117,6 +140,11 @@ class MainWindow:
         self.status_label = ttk.Label(self.status_bar, text="Listo - Configure los datos y presione RESOLVER PROBLEMA")
         self.status_label.pack(side=tk.LEFT, padx=5, pady=2)
         
+        # Botón para detener la resolución en curso
+        self.cancel_button = ttk.Button(self.status_bar, text="Cancelar", command=self._cancel_solve,
+                                        state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.RIGHT, padx=5, pady=2)
+        
         # Indicador de progreso (opcional)
         self.progress_var = tk.StringVar(value="")
         self.progress_label = ttk.Label(self.status_bar, textvariable=self.progress_var)
@@ -126,17 +154,144 @@ class MainWindow:
         """
         Callback ejecutado cuando se solicita resolver un problema.
         
+        La resolución corre en un hilo de trabajo para no bloquear la ventana;
+        el resultado se recoge con root.after (ver _poll_solve). Un pedido
+        nuevo cancela el que esté en curso.
+        
         Args:
             problem: Problema de programación lineal a resolver
         """
+        self._cancel_running_solve()
+        
+        # Reutilizar la solución si ya se resolvió un problema equivalente
+        cached = self.solution_cache.get(problem, self.solver)
+        if cached is not None:
+            self._show_solution(problem, cached, from_cache=True)
+            return
+        
+        self._solve_generation += 1
+        self._solve_cancel = threading.Event()
+        self._solve_problem = problem
+        
+        self.status_label.config(text="Resolviendo problema...")
+        self.progress_var.set("Calculando...")
+        self.cancel_button.config(state=tk.NORMAL)
+        
+        worker = threading.Thread(target=self._solve_worker,
+                                  args=(self._solve_generation, problem, self._solve_cancel),
+                                  daemon=True)
+        worker.start()
+        
+        if not self._polling:
+            self._polling = True
+            self.root.after(SOLVE_POLL_MS, self._poll_solve)
+    
+    def _solve_worker(self, generation: int, problem: LinearProgrammingProblem,
+                      cancel: threading.Event):
+        """
+        Resuelve el problema en el hilo de trabajo y publica el progreso y el resultado.
+        
+        No toca ningún widget: todo se comunica por _solve_messages.
+        
+        Args:
+            generation: Número del pedido
+            problem: Problema a resolver (el hilo principal no lo usa hasta recibir el resultado)
+            cancel: Evento que, una vez activado, detiene la resolución en la próxima fase o bloque
+        """
+        def progress(phase: str, fraction: float):
+            if cancel.is_set():
+                raise SolveCancelled()
+            self._solve_messages.put((generation, "progreso", (phase, fraction)))
+        
+        solver = copy.copy(self.solver)
+        solver.progress = progress
+        try:
+            solution = solver.solve(problem)
+        except SolveCancelled:
+            return
+        except Exception as e:
+            self._solve_messages.put((generation, "error", e))
+        else:
+            self._solve_messages.put((generation, "resuelto", solution))
+    
+    def _poll_solve(self):
+        """Procesa los mensajes del hilo de trabajo; se reprograma mientras haya una resolución en curso"""
+        latest_progress = None
+        while True:
+            try:
+                generation, kind, payload = self._solve_messages.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self._solve_generation or self._solve_cancel is None:
+                continue
+            if kind == "progreso":
+                latest_progress = payload
+            else:
+                self._finish_solve(kind, payload)
+        
+        if self._solve_cancel is None:
+            self._polling = False
+            return
+        
+        if latest_progress is not None:
+            phase, fraction = latest_progress
+            self.progress_var.set(f"Calculando: {phase} {fraction:.0%}")
+        self.root.after(SOLVE_POLL_MS, self._poll_solve)
+    
+    def _finish_solve(self, kind: str, payload):
+        """
+        Muestra el resultado de la resolución en curso.
+        
+        Args:
+            kind: "resuelto" o "error"
+            payload: Solución obtenida o excepción lanzada por el solver
+        """
+        problem = self._solve_problem
+        self._solve_cancel = None
+        self._solve_problem = None
+        self.cancel_button.config(state=tk.DISABLED)
+        
+        if kind == "error":
+            self.status_label.config(text="Error al resolver problema")
+            self.progress_var.set("")
+            messagebox.showerror("Error", f"Error al resolver el problema:\\n{str(payload)}")
+            return
+        
+        self.solution_cache.put(problem, self.solver, payload)
+        self._show_solution(problem, payload, from_cache=False)
+    
+    def _cancel_running_solve(self) -> bool:
+        """
+        Detiene la resolución en curso y descarta su resultado.
+        
+        Returns:
+            bool: True si había una resolución en curso
+        """
+        if self._solve_cancel is None:
+            return False
+        self._solve_cancel.set()
+        self._solve_cancel = None
+        self._solve_problem = None
+        self._solve_generation += 1
+        self.cancel_button.config(state=tk.DISABLED)
+        return True
+    
+    def _cancel_solve(self):
+        """Acción Cancelar: detiene la resolución en curso"""
+        if self._cancel_running_solve():
+            self.status_label.config(text="Resolución cancelada")
+            self.progress_var.set("")
+    
+    def _show_solution(self, problem: LinearProgrammingProblem, solution: Solution, from_cache: bool):
+        """
+        Muestra una solución en el gráfico y en la barra de estado.
+        
+        Args:
+            problem: Problema resuelto
+            solution: Solución del problema
+            from_cache: Si la solución se obtuvo de la caché
+        """
         try:
-            # Actualizar estado
-            self.status_label.config(text="Resolviendo problema...")
-            self.progress_var.set("Calculando...")
-            self.root.update()
-            
-            # Resolver problema
-            solution = self.solver.solve(problem)
             self.current_problem = problem
             
             # Mostrar solución
@@ -147,9 +302,19 @@ class MainWindow:
                 status_text = f"Problema resuelto - Óptimo: {solution.optimal_point} = {solution.optimal_value:.3f}"
             else:
                 status_text = "Problema resuelto - Sin solución factible"
+            if from_cache:
+                status_text += " (desde caché)"
             
             self.status_label.config(text=status_text)
-            self.progress_var.set("")
+            
+            # Tiempos por fase y contadores de la resolución (en un acierto de
+            # la caché son los de la resolución que la guardó, no de esta)
+            if solution.stats is None:
+                self.progress_var.set("")
+            elif from_cache:
+                self.progress_var.set(f"Resolución original: {solution.stats}")
+            else:
+                self.progress_var.set(str(solution.stats))
             
         except Exception as e:
             self.status_label.config(text="Error al resolver problema")
@@ -161,10 +326,12 @@ class MainWindow:
         response = messagebox.askyesno("Nuevo Problema", 
                                      "¿Desea limpiar todos los datos y comenzar un nuevo problema?")
         if response:
+            self._cancel_running_solve()
             self.input_panel.clear_all_constraints()
             self.input_panel.c1_var.set("0")
             self.input_panel.c2_var.set("0")
             self.input_panel.optimization_var.set("maximizar")
+            self.input_panel.set_integer_variables((False, False))
             self.graph_panel.clear_display()
             self.current_problem = None
             self.status_label.config(text="Nuevo problema iniciado")
@@ -246,6 +413,7 @@ class MainWindow:
         self.input_panel.optimization_var.set("maximizar")
         self.input_panel.c1_var.set("400")
         self.input_panel.c2_var.set("300")
+        self.input_panel.set_integer_variables((False, False))
         self.input_panel.add_constraint("2", "1", "≤", "100")  # Materia prima
         self.input_panel.add_constraint("1", "2", "≤", "80")   # Mano de obra
         self.status_label.config(text="Ejemplo de producción cargado")
@@ -257,11 +425,26 @@ class MainWindow:
         self.input_panel.optimization_var.set("minimizar")
         self.input_panel.c1_var.set("20")   # Costo Compuesto A
         self.input_panel.c2_var.set("30")   # Costo Compuesto B
+        self.input_panel.set_integer_variables((False, False))
         self.input_panel.add_constraint("1", "1", "≥", "40")   # Volumen mínimo 40 litros
         self.input_panel.add_constraint("2", "1", "≤", "80")   # Concentración máxima regulada
         self.status_label.config(text="Ejemplo de mezcla farmacéutica cargado")
         messagebox.showinfo("Ejemplo", "Ejemplo de mezcla farmacéutica cargado.\n\nProblema: Minimizar costo de producción de jarabe medicinal\nCompuestos: A ($20/L) y B ($30/L)\nRestricciones: Volumen mínimo y concentración regulada.")
     
+    def _load_integer_example(self):
+        """Carga un ejemplo con variables enteras cuya relajación tiene óptimo fraccionario"""
+        self.input_panel.clear_all_constraints()
+        self.input_panel.optimization_var.set("maximizar")
+        self.input_panel.c1_var.set("5")
+        self.input_panel.c2_var.set("8")
+        self.input_panel.set_integer_variables((True, True))
+        self.input_panel.add_constraint("1", "1", "≤", "6")    # Máquinas disponibles
+        self.input_panel.add_constraint("5", "9", "≤", "45")   # Horas de trabajo
+        self.status_label.config(text="Ejemplo de producción con enteros cargado")
+        messagebox.showinfo("Ejemplo", "Ejemplo de producción con variables enteras cargado.\n\n"
+                            "La relajación lineal tiene óptimo fraccionario (2.25, 3.75); "
+                            "la ramificación y acotamiento encuentra el mejor plan entero.")
+    
     def _show_help(self):
         """Muestra la ayuda de la aplicación"""
         help_text = """
@@ -392,24 +575,7 @@ TECNOLOGÍAS:
     
     def _problem_to_dict(self, problem: LinearProgrammingProblem) -> dict:
         """Convierte un problema a diccionario para serialización"""
-        return {
-            "objective_function": {
-                "c1": problem.objective_function.c1,
-                "c2": problem.objective_function.c2,
-                "optimization_type": problem.objective_function.optimization_type.value
-            },
-            "constraints": [
-                {
-                    "a1": constraint.a1,
-                    "a2": constraint.a2,
-                    "inequality_type": constraint.inequality_type.value,
-                    "b": constraint.b
-                }
-                for constraint in problem.constraints
-                if not ((constraint.a1 == 1 and constraint.a2 == 0) or 
-                       (constraint.a1 == 0 and constraint.a2 == 1))  # Excluir no negatividad
-            ]
-        }
+        return problem_to_dict(problem)
     
     def _load_problem_from_dict(self, problem_data: dict):
         """Carga un problema desde un diccionario"""
@@ -421,6 +587,7 @@ TECNOLOGÍAS:
         self.input_panel.c1_var.set(str(obj_func["c1"]))
         self.input_panel.c2_var.set(str(obj_func["c2"]))
         self.input_panel.optimization_var.set(obj_func["optimization_type"])
+        self.input_panel.set_integer_variables(problem_data.get("integer_variables", (False, False)))
         
         # Cargar restricciones
         for constraint_data in problem_data["constraints"]:
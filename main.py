@@ -3,6 +3,12 @@
 Aplicación de Programación Lineal - Solver Gráfico de 2 Variables
 
 Punto de entrada principal de la aplicación modular.
+
+Uso:
+    python main.py                        Abre la interfaz gráfica
+    python main.py solve problema.json    Resuelve sin interfaz gráfica (salida JSON)
+    python main.py solve --stdin          Lee el problema desde la entrada estándar
+    python main.py batch DIRECTORIO       Resuelve por lotes (ver core.runner)
 """
 
 import sys
@@ -11,8 +17,15 @@ import os
 # Agregar el directorio actual al path para imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from core.cli import COMMANDS
+
 def main():
     """Función principal de la aplicación"""
+    # Modo sin interfaz gráfica: solo se importa el paquete core
+    if len(sys.argv) > 1 and sys.argv[1] in COMMANDS:
+        from core.cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+    
     try:
         # Importar y ejecutar la aplicación principal
         from gui.main_window import MainWindow
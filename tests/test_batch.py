@@ -0,0 +1,31 @@
+"""Pruebas del núcleo vectorizado compartido por solve_many y rhs_sweep"""
+import numpy as np
+
+from benchmarks.generators import FAMILIES
+from core.batch import ProblemBatch, solve_many
+from core.parametric import rhs_sweep
+from core.solver import LinearProgrammingSolver
+
+
+def test_solve_many_matches_solver_with_any_cell_budget():
+    problems = [FAMILIES[family](m, seed) for family in ("acotado", "infactible", "paralelas")
+                for m, seed in ((5, 0), (9, 1))]
+    expected = [LinearProgrammingSolver().solve(FAMILIES[family](m, seed)).optimal_value
+                for family in ("acotado", "infactible", "paralelas") for m, seed in ((5, 0), (9, 1))]
+
+    for cells in (1 << 22, 50, 1):
+        result = solve_many(ProblemBatch.from_problems(problems), max_cells_per_chunk=cells)
+        values = [None if np.isnan(v) else v for v in result.optimal_values.tolist()]
+        assert np.allclose(np.array(values, dtype=float), np.array(expected, dtype=float), equal_nan=True)
+
+
+def test_rhs_sweep_is_independent_of_cell_budget():
+    problem = FAMILIES["acotado"](60, 2)
+    b_values = np.linspace(100.0, 300.0, 7)
+    reference = rhs_sweep(problem, [0], b_values)
+
+    # Un presupuesto menor que los pares de un solo punto también debe respetarse
+    small = rhs_sweep(problem, [0], b_values, max_cells_per_chunk=100)
+
+    assert np.array_equal(reference.optimal_values, small.optimal_values, equal_nan=True)
+    assert np.array_equal(reference.active_constraints, small.active_constraints)
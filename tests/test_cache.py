@@ -0,0 +1,57 @@
+"""Pruebas de la caché de soluciones (core.cache)"""
+from core.cache import SolutionCache
+from core.models import (
+    Constraint, InequalityType, LinearProgrammingProblem, ObjectiveFunction, OptimizationType
+)
+from core.solver import LinearProgrammingSolver
+
+
+ROWS = [
+    (1, 0, 4),
+    (0, 2, 12),
+    (3, 2, 18),
+    (1, 0, 6),    # dominada por X1 ≤ 4
+]
+
+
+def _problem(order) -> LinearProgrammingProblem:
+    constraints = [Constraint(a1, a2, InequalityType.MENOR_IGUAL, b) for a1, a2, b in (ROWS[i] for i in order)]
+    return LinearProgrammingProblem(ObjectiveFunction(3, 5, OptimizationType.MAXIMIZAR), constraints)
+
+
+def _indexed_fields(solution) -> tuple:
+    report = solution.sensitivity
+    removed = [(r.index, r.kept_index) for r in solution.presolve_removed]
+    return report.binding, report.basis, report.slacks, report.shadow_prices, report.rhs_ranges, removed
+
+
+def test_hit_with_reordered_constraints_remaps_indices():
+    for solver in (LinearProgrammingSolver(), LinearProgrammingSolver(presolve=True)):
+        cache = SolutionCache()
+        cache.get_or_solve(_problem([0, 1, 2, 3]), solver)
+
+        reordered = _problem([3, 2, 1, 0])
+        cached = cache.get(reordered, solver)
+        direct = solver.solve(_problem([3, 2, 1, 0]))
+
+        assert cached is not None and cache.stats.hits == 1
+        assert cached.problem is reordered
+        assert _indexed_fields(cached) == _indexed_fields(direct)
+
+
+def test_returned_solution_does_not_alias_cache():
+    cache = SolutionCache()
+    solver = LinearProgrammingSolver()
+    first = cache.get_or_solve(_problem([0, 1, 2]), solver)
+    first.sensitivity.binding.append(99)
+
+    assert 99 not in cache.get(_problem([0, 1, 2]), solver).sensitivity.binding
+
+
+def test_collect_stats_is_part_of_the_key():
+    cache = SolutionCache()
+    cache.get_or_solve(_problem([0, 1, 2]), LinearProgrammingSolver())
+
+    assert cache.get(_problem([0, 1, 2]), LinearProgrammingSolver(collect_stats=True)) is None
+    assert cache.get_or_solve(_problem([0, 1, 2]), LinearProgrammingSolver(collect_stats=True)).stats is not None
+    assert cache.get(_problem([0, 1, 2]), LinearProgrammingSolver()).stats is None
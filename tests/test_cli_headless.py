@@ -0,0 +1,60 @@
+"""
+Garantía de que el modo sin interfaz gráfica nunca carga tkinter ni matplotlib.
+Cada caso corre en un proceso nuevo para que los módulos ya importados por
+otras pruebas no afecten el resultado.
+"""
+import json
+import os
+import subprocess
+import sys
+
+from tests.test_runner import PROBLEM
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Se ejecuta en el proceso hijo: corre el código indicado y escribe en stderr
+# (como última línea) los módulos de GUI que quedaron cargados
+_PROBE = """
+import json, sys
+sys.path.insert(0, {root!r})
+try:
+    {code}
+except SystemExit as e:
+    exit_code = e.code
+else:
+    exit_code = 0
+loaded = sorted(name for name in sys.modules
+                if name.split(".")[0] in ("tkinter", "_tkinter", "matplotlib", "gui"))
+sys.stderr.write("\\n" + json.dumps(loaded))
+sys.exit(exit_code)
+"""
+
+
+def _run_probe(code: str) -> tuple:
+    """Ejecuta code en un intérprete nuevo con el problema de ejemplo en stdin"""
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(root=ROOT, code=code)],
+        input=json.dumps(PROBLEM), capture_output=True, text=True, encoding="utf-8", cwd=ROOT
+    )
+    loaded = json.loads(completed.stderr.strip().splitlines()[-1])
+    return completed, loaded
+
+
+def test_main_solve_stdin_does_not_import_gui():
+    completed, loaded = _run_probe(
+        "import runpy; sys.argv = ['main.py', 'solve', '--stdin']; "
+        "runpy.run_path('main.py', run_name='__main__')")
+
+    assert completed.returncode == 0, completed.stderr
+    assert json.loads(completed.stdout)["optimal_value"] == 36.0
+    assert loaded == []
+
+
+def test_cli_main_does_not_import_gui():
+    completed, loaded = _run_probe(
+        "from core.cli import main; sys.exit(main(['solve', '--stdin']))")
+
+    assert completed.returncode == 0, completed.stderr
+    assert json.loads(completed.stdout)["optimal_value"] == 36.0
+    assert loaded == []
@@ -0,0 +1,38 @@
+"""Pruebas del ejecutor por lotes (core.runner)"""
+import json
+
+from core.runner import run_batch, iter_problem_sources
+
+
+PROBLEM = {
+    "objective_function": {"c1": 3, "c2": 5, "optimization_type": "maximizar"},
+    "constraints": [
+        {"a1": 1, "a2": 0, "inequality_type": "≤", "b": 4},
+        {"a1": 0, "a2": 2, "inequality_type": "≤", "b": 12},
+        {"a1": 3, "a2": 2, "inequality_type": "≤", "b": 18},
+    ],
+}
+
+
+def test_malformed_sources_become_error_results(tmp_path):
+    jsonl = tmp_path / "problemas.jsonl"
+    jsonl.write_text("\n".join([json.dumps(PROBLEM), "{no es json", json.dumps(PROBLEM)]) + "\n",
+                     encoding="utf-8")
+
+    results = list(run_batch(iter_problem_sources(str(jsonl)), workers=1, chunk_size=2))
+
+    assert [result.source for result in results] == [f"{jsonl}:1", f"{jsonl}:2", f"{jsonl}:3"]
+    assert results[0].error is None and results[2].error is None
+    assert results[0].solution["optimal_value"] == results[2].solution["optimal_value"]
+    assert "JSON inválido" in results[1].error
+
+
+def test_unreadable_file_in_directory_does_not_stop_batch(tmp_path):
+    (tmp_path / "a.json").write_text(json.dumps(PROBLEM), encoding="utf-8")
+    (tmp_path / "b.json").write_text("[1, 2", encoding="utf-8")
+
+    results = list(run_batch(iter_problem_sources(str(tmp_path)), workers=1))
+
+    assert len(results) == 2
+    assert results[0].error is None
+    assert results[1].error.startswith("No se pudo leer el problema")